@@ -0,0 +1,98 @@
+"""
+Micro-Benchmark für Basenprüfung und Reverse Complement.
+
+Vergleicht die früheren Implementierungen pro Base (all(... in ...) bzw. Dictionary und join)
+mit den Tabellenvarianten aus sequence_codec, jeweils für einzelne Sequenzen verschiedener
+Länge und für einen Stapel kurzer Reads.
+
+Beispiel:
+    python benchmarks/codec_benchmark.py --lengths 60,1000,100000 --batch 10000 --json codec.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from typing import Callable
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+from fragment_generator import FragmentGenerator
+from sequence_codec import is_valid, reverse_complement, reverse_complements
+
+_COMPLEMENT = {"A": "T", "T": "A", "G": "C", "C": "G"}
+
+
+def reference_is_valid(sequence: str) -> bool:
+    """Frühere Prüfung in Fragment.__init__."""
+    return all(base in "ATGCatgc" for base in sequence)
+
+
+def reference_reverse_complement(sequence: str) -> str:
+    """Früheres Fragment.reverse_complement()."""
+    return "".join(_COMPLEMENT[base] for base in reversed(sequence))
+
+
+def best_time(func: Callable, repeats: int) -> float:
+    """Beste Laufzeit pro Aufruf in Sekunden; die Anzahl Aufrufe wird an die Dauer angepasst."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeats, number)) / number
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    random.seed(args.seed)
+    cases = []
+    for length in args.lengths:
+        sequence = FragmentGenerator.generate_random_dna(length)
+        cases.append((f"single_{length}", "validate",
+                      lambda s=sequence: reference_is_valid(s), lambda s=sequence: is_valid(s)))
+        cases.append((f"single_{length}", "reverse_complement",
+                      lambda s=sequence: reference_reverse_complement(s), lambda s=sequence: reverse_complement(s)))
+
+    reads = [FragmentGenerator.generate_random_dna(args.read_length) for _ in range(args.batch)]
+    cases.append((f"batch_{args.batch}x{args.read_length}", "validate",
+                  lambda: [reference_is_valid(s) for s in reads], lambda: [is_valid(s) for s in reads]))
+    cases.append((f"batch_{args.batch}x{args.read_length}", "reverse_complement",
+                  lambda: [reference_reverse_complement(s) for s in reads], lambda: reverse_complements(reads)))
+
+    rows = []
+    print(f"{'Eingabe':<22} {'Operation':<20} {'alt [µs]':>12} {'neu [µs]':>12} {'Faktor':>8}", file=sys.stderr)
+    for name, operation, old, new in cases:
+        if old() != new():
+            raise AssertionError(f"Ergebnisse weichen ab: {name} {operation}")
+        old_seconds, new_seconds = best_time(old, args.repeats), best_time(new, args.repeats)
+        speedup = old_seconds / new_seconds
+        rows.append({"input": name, "operation": operation, "reference_seconds": old_seconds,
+                     "codec_seconds": new_seconds, "speedup": round(speedup, 1)})
+        print(f"{name:<22} {operation:<20} {old_seconds * 1e6:12.2f} {new_seconds * 1e6:12.2f} {speedup:8.1f}",
+              file=sys.stderr)
+    return rows
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Micro-Benchmark für Basenprüfung und Reverse Complement")
+    parser.add_argument("--lengths", default="60,1000,100000", help="Kommagetrennte Sequenzlängen")
+    parser.add_argument("--batch", type=int, default=10000, help="Anzahl Reads im Stapel")
+    parser.add_argument("--read-length", type=int, default=60, help="Länge der Reads im Stapel")
+    parser.add_argument("--repeats", type=int, default=3, help="Wiederholungen pro Messung (bester Wert zählt)")
+    parser.add_argument("--seed", type=int, default=42, help="Startwert des Zufallsgenerators")
+    parser.add_argument("--json", help="Ergebnisse als JSON schreiben")
+    args = parser.parse_args(argv)
+    args.lengths = [int(item) for item in args.lengths.split(",") if item.strip()]
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    rows = run(args)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"results": rows}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Benchmark der AssemblyPipeline über mehrere Eingabedateien.
+
+Erzeugt mit dem FragmentGenerator `--files` Datensätze und assembliert sie einmal nacheinander
+(Stufen direkt aufgerufen), einmal mit der Pipeline im Thread-Pool (--processes 0) und einmal
+für jede Prozessanzahl aus --processes. Ein Gewinn des Prozess-Pools ist nur mit mehreren freien
+CPU-Kernen zu erwarten; die Kernanzahl wird deshalb mit ausgegeben.
+
+Beispiel:
+    python benchmarks/pipeline_benchmark.py --files 6 --genome-length 20000 --processes 1,3 --json pipe.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+from fragment_generator import FragmentGenerator
+from pipeline import AssemblyPipeline
+
+
+def write_inputs(directory: str, args: argparse.Namespace) -> list[str]:
+    """Schreibt die Datensätze als Textdateien (eine Sequenz pro Zeile)."""
+    random.seed(args.seed)
+    paths = []
+    for index in range(args.files):
+        generator = FragmentGenerator(args.genome_length, args.read_length, args.overlap, reverse_ratio=0)
+        path = os.path.join(directory, f"reads_{index}.txt")
+        with open(path, "w") as f:
+            f.writelines(fragment.sequence + "\n" for fragment in generator.generate_fragments())
+        paths.append(path)
+    return paths
+
+
+def run_sequential(paths: list[str], args: argparse.Namespace) -> tuple[list, float]:
+    """Alle Stufen aller Dateien nacheinander im Hauptprozess."""
+    pipeline = AssemblyPipeline(engine=args.engine, min_overlap=args.min_overlap, contigs=True)
+    start = time.perf_counter()
+    contigs = [pipeline.assemble(pipeline.build(pipeline.orient(pipeline.parse(path)))) for path in paths]
+    return contigs, time.perf_counter() - start
+
+
+def run_pipeline(paths: list[str], args: argparse.Namespace, processes: int) -> tuple[list, float]:
+    pipeline = AssemblyPipeline(engine=args.engine, min_overlap=args.min_overlap, contigs=True,
+                                processes=processes)
+    start = time.perf_counter()
+    results, _ = pipeline.run(paths)
+    seconds = time.perf_counter() - start
+    failed = [result["input"] for result in results if result["error"] is not None]
+    if failed:
+        raise AssertionError(f"Pipeline fehlgeschlagen für {failed}")
+    return [result["contigs"] for result in results], seconds
+
+
+def sequences(contigs: list) -> list[list[str]]:
+    return [sorted(fragment.sequence for fragment in item) for item in contigs]
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_inputs(directory, args)
+        expected, baseline = run_sequential(paths, args)
+        rows.append({"mode": "sequentiell", "processes": 0, "seconds": baseline, "speedup": 1.0})
+        variants = [("threads", 0)] + [("prozesse", count) for count in args.processes]
+        for mode, count in variants:
+            best = float("inf")
+            for _ in range(args.repeats):
+                contigs, seconds = run_pipeline(paths, args, count)
+                if sequences(contigs) != sequences(expected):
+                    raise AssertionError(f"Ergebnisse weichen ab: {mode} {count}")
+                best = min(best, seconds)
+            rows.append({"mode": mode, "processes": count, "seconds": best, "speedup": round(baseline / best, 2)})
+
+    print(f"{args.files} Dateien, {os.cpu_count()} CPU-Kerne", file=sys.stderr)
+    print(f"{'Modus':<12} {'Prozesse':>8} {'Zeit [s]':>10} {'Faktor':>8}", file=sys.stderr)
+    for row in rows:
+        print(f"{row['mode']:<12} {row['processes']:>8} {row['seconds']:10.2f} {row['speedup']:8.2f}",
+              file=sys.stderr)
+    return rows
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark der AssemblyPipeline über mehrere Dateien")
+    parser.add_argument("--files", type=int, default=6, help="Anzahl Eingabedateien")
+    parser.add_argument("--genome-length", type=int, default=20000, help="Länge des Genoms pro Datei")
+    parser.add_argument("--read-length", type=int, default=100, help="Mittlere Fragmentlänge")
+    parser.add_argument("--overlap", type=int, default=30, help="Minimaler Overlap beim Fragmentieren")
+    parser.add_argument("--min-overlap", type=int, default=20, help="Minimale Kantenüberlappung im Graphen")
+    parser.add_argument("--engine", default="suffix_array", help="Overlap-Engine")
+    parser.add_argument("--processes", default="1,3", help="Kommagetrennte Prozessanzahlen")
+    parser.add_argument("--repeats", type=int, default=1, help="Wiederholungen pro Messung (bester Wert zählt)")
+    parser.add_argument("--seed", type=int, default=42, help="Startwert des Zufallsgenerators")
+    parser.add_argument("--json", help="Ergebnisse als JSON schreiben")
+    args = parser.parse_args(argv)
+    args.processes = [int(item) for item in args.processes.split(",") if item.strip()]
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    rows = run(args)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"cpu_count": os.cpu_count(), "files": args.files, "results": rows}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
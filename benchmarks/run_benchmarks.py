@@ -0,0 +1,251 @@
+"""
+Benchmark-Suite für Graphaufbau, Orientierungswahl und Greedy-Assembly.
+
+Erzeugt mit dem FragmentGenerator reproduzierbare Datensätze über ein Parameter-Raster
+(Genomlänge, Fragmentlänge, Überlappung, Reverse-Ratio), misst die einzelnen Stufen getrennt
+(Laufzeit und Spitzen-Speicher) und schreibt die Ergebnisse als JSON und/oder CSV.
+Mit --compare werden die Laufzeiten gegen eine frühere JSON-Datei verglichen.
+
+Beispiel:
+    python benchmarks/run_benchmarks.py --genome-lengths 2000,10000 --read-lengths 100 \\
+        --overlaps 30 --reverse-ratios 0,0.4 --data --json bench.json
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+from file_parser import FileParser
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from greedy_assembler import GreedyAssembler
+from orientation_selector import OrientationSelector
+from overlap_engine import ENGINES
+from overlap_graph import OverlapGraph
+from progress import configure_logging
+
+DATA_FILES = [
+    "fragmentsEinzelstrang_short.txt",
+    "fragmentsDoppelstrang_short.txt",
+    "FragmenteEinzelstrang.txt",
+    "FragmenteDoppelstrang.txt",
+]
+
+
+def measure(func: Callable, repeats: int = 1, memory: bool = True) -> tuple[object, float, int | None]:
+    """
+    Führt func aus und misst die beste Laufzeit über `repeats` Wiederholungen.
+    Der Spitzen-Speicher wird in einem zusätzlichen Lauf mit tracemalloc bestimmt,
+    damit das Tracing die Zeitmessung nicht verfälscht.
+
+    Rückgabe:
+        (Ergebnis des letzten Laufs, Sekunden, Spitzen-Speicher in Bytes oder None)
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, best, peak
+
+
+def generate_dataset(genome_length: int, read_length: int, overlap: int, reverse_ratio: float,
+                     seed: int) -> list[Fragment]:
+    """Erzeugt einen reproduzierbaren synthetischen Datensatz."""
+    random.seed(seed)
+    generator = FragmentGenerator(genome_length, read_length, overlap, shuffle=True, reverse_ratio=reverse_ratio)
+    return generator.generate_fragments()
+
+
+def benchmark_dataset(name: str, params: dict, fragments: list[Fragment], double_strand: bool,
+                      args: argparse.Namespace) -> list[dict]:
+    """Misst alle Stufen für einen Datensatz und gibt eine Zeile pro Messung zurück."""
+    rows = []
+
+    def record(stage: str, variant: str, seconds: float, peak: int | None, status: str = "ok", **extra):
+        row = {"dataset": name, **params, "fragments": len(fragments), "stage": stage, "variant": variant,
+               "seconds": round(seconds, 6), "peak_bytes": peak, "status": status}
+        row.update(extra)
+        rows.append(row)
+        edges = ""
+        if "edges" in extra:
+            edges = f"  {extra['edges']} Kanten"
+            if "edges_before" in extra:
+                edges += f" (vorher {extra['edges_before']})"
+        print(f"  {stage:<20} {variant:<14} {seconds:9.4f} s  {status}{edges}", file=sys.stderr)
+
+    print(f"[{name}] {len(fragments)} Fragmente", file=sys.stderr)
+
+    oriented = fragments
+    if double_strand:
+        for method in OrientationSelector.METHODS:
+            if method == "global" and len(fragments) > args.max_global:
+                continue
+            selector_method = "select_orientation_" + method
+            result, seconds, peak = measure(
+                lambda: getattr(OrientationSelector(fragments, engine=args.base_engine), selector_method)(),
+                args.repeats, args.memory)
+            record("orientation", method, seconds, peak)
+            if method == "local":
+                oriented = result
+
+    for engine in args.engines:
+        graph, seconds, peak = measure(lambda: OverlapGraph(oriented, engine=engine), args.repeats, args.memory)
+        extra = {}
+        if hasattr(graph.engine, "reduction_ratio"):
+            extra["candidate_reduction"] = round(graph.engine.reduction_ratio, 4)
+        record("graph_build", engine, seconds, peak, edges=len(graph.edges), **extra)
+        if args.min_edge_overlap > 1 or args.top_k is not None:
+            # Gleicher Aufbau mit Mindestüberlappung/top-k; edges_before = Kanten ohne Begrenzung
+            pruned, seconds, peak = measure(
+                lambda: OverlapGraph(oriented, engine=engine, min_overlap=args.min_edge_overlap, top_k=args.top_k),
+                args.repeats, args.memory)
+            record("graph_build", f"{engine}+pruned", seconds, peak, edges=len(pruned.edges),
+                   edges_before=len(graph.edges))
+
+    for mode in args.assembly_modes:
+        if mode == "naive" and len(oriented) > args.max_naive_assembly:
+            continue
+
+        def assemble():
+            # Der Graph wird außerhalb der Messung aufgebaut; nur die Assembly wird gemessen
+            graph = OverlapGraph(oriented, engine=args.base_engine)
+            start = time.perf_counter()
+            try:
+                contig = GreedyAssembler(graph, mode=mode).assemble()
+                status = "ok"
+                length = len(contig.sequence)
+            except ValueError:
+                status, length = "incomplete", None
+            return time.perf_counter() - start, status, length
+
+        timings = []
+        for _ in range(args.repeats):
+            timings.append(assemble())
+        seconds = min(t[0] for t in timings)
+        peak = None
+        if args.memory:
+            _, _, peak = measure(assemble, 0, True)
+        record("assembly", mode, seconds, peak, status=timings[-1][1], contig_length=timings[-1][2])
+
+    return rows
+
+
+def parse_list(value: str, cast: Callable) -> list:
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark für Graphaufbau, Orientierung und Assembly")
+    parser.add_argument("--genome-lengths", default="2000,5000", help="Kommagetrennte Genomlängen")
+    parser.add_argument("--read-lengths", default="60", help="Kommagetrennte mittlere Fragmentlängen")
+    parser.add_argument("--overlaps", default="20", help="Kommagetrennte Mindestüberlappungen")
+    parser.add_argument("--reverse-ratios", default="0,0.4", help="Kommagetrennte Reverse-Ratios")
+    parser.add_argument("--seed", type=int, default=42, help="Startwert des Zufallsgenerators")
+    parser.add_argument("--data", action="store_true", help="Zusätzlich die Dateien aus data/ messen")
+    parser.add_argument("--no-synthetic", action="store_true", help="Keine synthetischen Datensätze messen")
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Kommagetrennte Overlap-Engines")
+    parser.add_argument("--base-engine", choices=list(ENGINES), default="suffix_array",
+                        help="Engine für Orientierung und den Graphen vor der Assembly-Messung")
+    parser.add_argument("--min-edge-overlap", type=int, default=1,
+                        help="Zusätzlich den Graphaufbau mit dieser Mindestüberlappung messen")
+    parser.add_argument("--top-k", type=int, default=None,
+                        help="Zusätzlich den Graphaufbau mit höchstens K Kanten pro Knoten und Richtung messen")
+    parser.add_argument("--assembly-modes", default=",".join(GreedyAssembler.MODES),
+                        help="Kommagetrennte Assembly-Modi")
+    parser.add_argument("--repeats", type=int, default=1, help="Wiederholungen pro Messung (bester Wert zählt)")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Keine Speichermessung")
+    parser.add_argument("--max-global", type=int, default=400,
+                        help="Globale Orientierung nur bis zu dieser Fragmentanzahl messen")
+    parser.add_argument("--max-naive-assembly", type=int, default=400,
+                        help="Naiven Assembly-Modus nur bis zu dieser Fragmentanzahl messen")
+    parser.add_argument("--json", help="Ergebnisse als JSON schreiben")
+    parser.add_argument("--csv", help="Ergebnisse als CSV schreiben")
+    parser.add_argument("--compare", help="JSON-Ergebnis einer früheren Version zum Vergleich")
+    args = parser.parse_args(argv)
+    args.engines = parse_list(args.engines, str)
+    args.assembly_modes = parse_list(args.assembly_modes, str)
+    return args
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    """Führt alle konfigurierten Benchmarks aus."""
+    rows = []
+    if not args.no_synthetic:
+        grid = itertools.product(parse_list(args.genome_lengths, int), parse_list(args.read_lengths, int),
+                                 parse_list(args.overlaps, int), parse_list(args.reverse_ratios, float))
+        for genome_length, read_length, overlap, reverse_ratio in grid:
+            params = {"genome_length": genome_length, "read_length": read_length,
+                      "overlap": overlap, "reverse_ratio": reverse_ratio}
+            fragments = generate_dataset(genome_length, read_length, overlap, reverse_ratio, args.seed)
+            name = f"synthetic_g{genome_length}_r{read_length}_o{overlap}_rev{reverse_ratio}"
+            rows += benchmark_dataset(name, params, fragments, reverse_ratio > 0, args)
+
+    if args.data:
+        for filename in DATA_FILES:
+            fragments = FileParser.parse_fragments(os.path.join(ROOT_DIR, "data", filename))
+            double_strand = "doppel" in filename.lower()
+            rows += benchmark_dataset(filename, {}, fragments, double_strand, args)
+    return rows
+
+
+def write_results(rows: list[dict], args: argparse.Namespace):
+    """Schreibt die Ergebnisse als JSON und/oder CSV."""
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": rows}, f, indent=2)
+    if args.csv:
+        fields = []
+        for row in rows:
+            fields += [key for key in row if key not in fields]
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def compare(rows: list[dict], baseline_path: str):
+    """Vergleicht die Laufzeiten mit einer früheren JSON-Ergebnisdatei."""
+    with open(baseline_path) as f:
+        baseline = {(r["dataset"], r["stage"], r["variant"]): r for r in json.load(f)["results"]}
+    print(f"{'Datensatz':<45} {'Stufe':<12} {'Variante':<14} {'alt [s]':>9} {'neu [s]':>9} {'Faktor':>7}")
+    for row in rows:
+        old = baseline.get((row["dataset"], row["stage"], row["variant"]))
+        if old is None or not old["seconds"]:
+            continue
+        factor = row["seconds"] / old["seconds"]
+        print(f"{row['dataset']:<45} {row['stage']:<12} {row['variant']:<14} "
+              f"{old['seconds']:9.4f} {row['seconds']:9.4f} {factor:7.2f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    configure_logging(quiet=True)
+    rows = run(args)
+    write_results(rows, args)
+    if args.compare:
+        compare(rows, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,7 @@
+import argparse
+import json
+import logging
+import random
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
@@ -7,6 +11,13 @@ from fragment_generator import FragmentGenerator
 from orientation_selector import OrientationSelector
 from greedy_assembler import GreedyAssembler
 from overlap_graph import OverlapGraph
+from overlap_engine import ENGINES, ApproximateOverlapEngine, MinimizerOverlapEngine
+from fasta_writer import FastaWriter
+from fragment_store import FragmentStore
+from pipeline import AssemblyPipeline
+from progress import configure_logging
+
+logger = logging.getLogger("main")
 
 def ask_choice(prompt: str, choices: list[str]) -> str:
     """Fragt den Nutzer nach einer Eingabe aus einer Liste erlaubter Optionen."""
@@ -55,7 +66,275 @@ def pause(msg="\nDrücke Enter, um fortzufahren...\n"):
     input(msg)
 
 
-def main():
+def positive_int(value: str) -> int:
+    """argparse-Typ für Ganzzahlen >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("Wert muss mindestens 1 sein.")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """argparse-Typ für Ganzzahlen >= 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("Wert darf nicht negativ sein.")
+    return number
+
+
+def ratio(value: str) -> float:
+    """argparse-Typ für Anteile zwischen 0 und 1."""
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError("Wert muss zwischen 0 und 1 liegen.")
+    return number
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Liest die Kommandozeilenoptionen ein.
+    Ohne Unterbefehl startet das interaktive Programm.
+    """
+    parser = argparse.ArgumentParser(description="DNA-Sequenz-Assembler mit Greedy-Algorithmus")
+    parser.add_argument("--workers", type=positive_int, default=1,
+                        help="Anzahl paralleler Prozesse für den Aufbau des Overlap-Graphen (Standard: 1)")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="Detaillierte Ausgabe pro Fragment und Merge")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Nur Warnungen und Fehler ausgeben")
+
+    # Gemeinsame Optionen der Batch-Befehle
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--workers", type=positive_int, default=argparse.SUPPRESS,
+                        help="Anzahl paralleler Prozesse für den Aufbau des Overlap-Graphen (Standard: 1)")
+    common.add_argument("-v", "--verbose", action="count", default=argparse.SUPPRESS,
+                        help="Detaillierte Ausgabe pro Fragment und Merge")
+    common.add_argument("-q", "--quiet", action="store_true", default=argparse.SUPPRESS,
+                        help="Nur Warnungen und Fehler ausgeben")
+    common.add_argument("--strand", choices=["single", "double"], default="single",
+                        help="Einzel- oder Doppelstrang (Standard: single)")
+    common.add_argument("--orientation", choices=list(OrientationSelector.METHODS), default="local",
+                        help="Orientierungsmethode bei Doppelstrang (Standard: local)")
+    common.add_argument("--engine", choices=list(ENGINES), default="suffix_array",
+                        help="Verfahren zur Overlap-Berechnung (Standard: suffix_array)")
+    common.add_argument("--max-error-rate", type=ratio, default=None,
+                        help="Erlaubter Fehleranteil im Overlap für --engine approximate (Standard: 0.02)")
+    common.add_argument("--minimizer-k", type=positive_int, default=11,
+                        help="Länge der k-mere für --engine minimizer (Standard: 11)")
+    common.add_argument("--minimizer-w", type=positive_int, default=5,
+                        help="k-mere pro Minimizer-Fenster für --engine minimizer (Standard: 5); "
+                             "gefunden werden nur Overlaps ab k + w - 1 Basen")
+    common.add_argument("--min-edge-overlap", type=positive_int, default=1,
+                        help="Kürzeste Overlap-Länge, die als Kante in den Graphen aufgenommen wird (Standard: 1)")
+    common.add_argument("--top-k", type=positive_int, default=None,
+                        help="Höchstens K aus- und eingehende Kanten pro Fragment behalten (Standard: alle)")
+    common.add_argument("--assembly-mode", choices=list(GreedyAssembler.MODES), default="heap",
+                        help="Assembly-Modus des GreedyAssembler (Standard: heap)")
+    common.add_argument("--dedup", action="store_true",
+                        help="Duplikate und enthaltene Fragmente (bei Doppelstrang auch als Reverse Complement) "
+                             "vor Orientierung und Graphaufbau entfernen")
+    common.add_argument("--string-graph", action="store_true",
+                        help="Enthaltene Fragmente und transitive Kanten vor der Assembly entfernen")
+    common.add_argument("--cache-dir",
+                        help="Verzeichnis für zwischengespeicherte Overlap-Graphen (gleiche Eingabe wird nicht neu berechnet)")
+    common.add_argument("--contigs", action="store_true",
+                        help="Bei fehlenden Overlaps alle verbleibenden Contigs ausgeben statt abzubrechen")
+    common.add_argument("-o", "--output", help="FASTA-Datei für den rekonstruierten Contig bzw. die Contigs")
+
+    subparsers = parser.add_subparsers(dest="command", metavar="{assemble,simulate,pipeline,convert}")
+
+    assemble = subparsers.add_parser("assemble", parents=[common],
+                                     help="Fragmente aus einer Datei assemblieren")
+    assemble.add_argument("input", help="Eingabedatei (Text, FASTA oder FASTQ, optional .gz)")
+    assemble.add_argument("--packed", action="store_true",
+                          help="Sequenzen 2-Bit-gepackt speichern (mit --engine packed ohne Entpacken verglichen)")
+
+    simulate = subparsers.add_parser("simulate", parents=[common],
+                                     help="Zufällige Fragmente erzeugen und assemblieren")
+    simulate.add_argument("--length", type=positive_int, default=1000, help="Länge der DNA-Sequenz")
+    simulate.add_argument("--fragment-length", type=positive_int, default=50,
+                          help="Durchschnittliche Fragmentlänge")
+    simulate.add_argument("--min-overlap", type=positive_int, default=10, help="Mindestüberlappung")
+    simulate.add_argument("--no-shuffle", action="store_true", help="Fragmente nicht shuffeln")
+    simulate.add_argument("--reverse-ratio", type=ratio, default=0.4,
+                          help="Anteil an Reverse Complements (nur bei --strand double)")
+    simulate.add_argument("--seed", type=int, help="Startwert des Zufallsgenerators")
+
+    pipeline = subparsers.add_parser("pipeline", parents=[common],
+                                     help="Mehrere Dateien nebenläufig in einer asyncio-Pipeline assemblieren")
+    pipeline.add_argument("inputs", nargs="+", help="Eingabedateien (Text, FASTA oder FASTQ, optional .gz)")
+    pipeline.add_argument("--packed", action="store_true",
+                          help="Sequenzen 2-Bit-gepackt speichern (mit --engine packed ohne Entpacken verglichen)")
+    pipeline.add_argument("--output-dir", help="Verzeichnis für die Contigs, eine FASTA-Datei pro Eingabe")
+    pipeline.add_argument("--queue-size", type=positive_int, default=1,
+                          help="Kapazität der Warteschlangen zwischen den Stufen (Standard: 1)")
+    pipeline.add_argument("--processes", type=non_negative_int, default=3,
+                          help="Prozesse für Orientierung, Graphaufbau und Assembly (Standard: 3, 0 = nur Threads)")
+    pipeline.add_argument("--threads", type=positive_int, default=None,
+                          help="Threads für das Einlesen bzw. bei --processes 0 für alle Stufen (Standard: eine pro Stufe)")
+    pipeline.add_argument("--metrics", help="Laufzeiten und Warteschlangen-Kennzahlen als JSON schreiben")
+
+    convert = subparsers.add_parser("convert", help="Eingabedatei in einen Fragmentspeicher (mmap) umwandeln")
+    convert.add_argument("input", help="Eingabedatei (Text, FASTA oder FASTQ, optional .gz)")
+    convert.add_argument("output", help="Zieldatei des Fragmentspeichers")
+
+    return parser.parse_args(argv)
+
+
+def build_pipeline(args: argparse.Namespace) -> AssemblyPipeline:
+    """Erzeugt die Assembly-Pipeline mit den Stufen-Optionen der Kommandozeile."""
+    engine = args.engine
+    min_overlap = args.min_edge_overlap
+    if engine == ApproximateOverlapEngine.name and args.max_error_rate is not None:
+        engine = ApproximateOverlapEngine(max_error_rate=args.max_error_rate)
+    elif engine == MinimizerOverlapEngine.name:
+        # Kürzere Overlaps als k + w - 1 teilen nicht sicher einen Minimizer und werden nicht gefunden
+        limit = args.minimizer_k + args.minimizer_w - 1
+        if min_overlap < limit:
+            logger.warning(f"Die Engine minimizer findet mit k = {args.minimizer_k}, w = {args.minimizer_w} nur "
+                           f"Overlaps ab {limit} Basen; --min-edge-overlap {min_overlap} wird auf {limit} angehoben. "
+                           f"Für kürzere Overlaps --minimizer-k bzw. --minimizer-w verkleinern.")
+            min_overlap = limit
+        engine = MinimizerOverlapEngine(args.minimizer_k, args.minimizer_w, min_overlap)
+    return AssemblyPipeline(engine=engine, double_strand=args.strand == "double", orientation=args.orientation,
+                            workers=args.workers, min_overlap=min_overlap, top_k=args.top_k,
+                            assembly_mode=args.assembly_mode, dedup=args.dedup, string_graph=args.string_graph,
+                            cache_dir=args.cache_dir, contigs=args.contigs,
+                            queue_size=getattr(args, "queue_size", 1), processes=getattr(args, "processes", 3),
+                            packed=getattr(args, "packed", False))
+
+
+def assemble_fragments(fragments: list, args: argparse.Namespace) -> list:
+    """
+    Orientiert (bei Doppelstrang) und assembliert die Fragmente gemäß den Optionen.
+    Gibt die Contigs zurück; ohne --contigs genau einen (sonst ValueError).
+    """
+    pipeline = build_pipeline(args)
+    return pipeline.assemble(pipeline.build(pipeline.orient(fragments)))
+
+
+def write_contigs(contigs: list, output: str | None):
+    """Meldet die Kennzahlen der Contigs und schreibt sie ggf. als (Multi-)FASTA."""
+    stats = GreedyAssembler.contig_stats(contigs)
+    if stats["count"] == 1:
+        logger.info(f"Rekonstruierte Sequenz: {stats['total_length']} bp")
+    else:
+        logger.info(f"{stats['count']} Contigs, Gesamtlänge {stats['total_length']} bp, "
+                    f"längster {stats['longest']} bp, N50 {stats['n50']} bp")
+    if output:
+        FastaWriter.write(output, contigs)
+        logger.info(f"{'Contig' if stats['count'] == 1 else 'Contigs'} geschrieben nach {output}")
+
+
+def run_assemble(args: argparse.Namespace) -> int:
+    """Batch-Befehl 'assemble': Datei einlesen, assemblieren, Contig schreiben."""
+    fragments = FileParser.parse_fragments(args.input, packed=args.packed)
+    logger.info(f"{len(fragments)} Fragmente geladen.")
+
+    write_contigs(assemble_fragments(fragments, args), args.output)
+    return 0
+
+
+def output_names(paths: list[str]) -> list[str]:
+    """
+    Eindeutige Ausgabenamen (ohne Endung) für die Eingabedateien der Pipeline.
+
+    Der Name ist der Dateiname ohne Endung (auch ohne ".gz"). Ergeben mehrere Eingaben denselben
+    Namen (z. B. a/reads.txt und b/reads.txt oder reads.fa und reads.fq), erhalten die späteren
+    in Eingabereihenfolge die Anhänge _2, _3, ...
+    """
+    names, used = [], set()
+    for path in paths:
+        base = os.path.basename(path)
+        if base.endswith(".gz"):
+            base = base[:-3]
+        base = os.path.splitext(base)[0] or "contigs"
+        name, number = base, 1
+        while name in used:
+            number += 1
+            name = f"{base}_{number}"
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def run_pipeline(args: argparse.Namespace) -> int:
+    """
+    Batch-Befehl 'pipeline': mehrere Dateien nebenläufig assemblieren (siehe AssemblyPipeline).
+    Mit --output-dir wird pro Eingabe <Dateiname>.fasta geschrieben (gleiche Namen werden über
+    output_names() durchnummeriert; -o nur bei einer Eingabe), mit
+    --metrics eine JSON-Datei mit den Laufzeiten pro Datei und Stufe sowie den Kennzahlen der
+    Warteschlangen. Schlägt eine Datei fehl, laufen die übrigen weiter; der Exit-Code ist dann 1.
+    """
+    if args.output and len(args.inputs) > 1:
+        raise ValueError("-o ist nur bei einer Eingabedatei möglich, sonst --output-dir verwenden.")
+    results, metrics = build_pipeline(args).run(args.inputs, args.threads)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    for result, name in zip(results, output_names(args.inputs)):
+        if result["contigs"] is None:
+            continue
+        logger.info(f"{result['input']}:")
+        output = args.output
+        if args.output_dir:
+            output = os.path.join(args.output_dir, f"{name}.fasta")
+        write_contigs(result["contigs"], output)
+    if args.metrics:
+        report = {"files": [{key: value for key, value in result.items() if key != "contigs"}
+                            | {"contigs": len(result["contigs"] or [])} for result in results],
+                  "stages": [stage.as_dict() for stage in metrics]}
+        with open(args.metrics, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Pipeline-Kennzahlen geschrieben nach {args.metrics}")
+    return 1 if any(result["error"] is not None for result in results) else 0
+
+
+def run_simulate(args: argparse.Namespace) -> int:
+    """Batch-Befehl 'simulate': Fragmente generieren, assemblieren und mit dem Original vergleichen."""
+    if args.seed is not None:
+        random.seed(args.seed)
+    reverse_ratio = args.reverse_ratio if args.strand == "double" else 0.0
+    generator = FragmentGenerator(args.length, args.fragment_length, args.min_overlap,
+                                  not args.no_shuffle, reverse_ratio)
+    fragments = generator.generate_fragments()
+    logger.info(f"{len(fragments)} Fragmente generiert.")
+
+    contigs = assemble_fragments(fragments, args)
+    write_contigs(contigs, args.output)
+
+    result = contigs[0]
+    correct = len(contigs) == 1 and (result.sequence == generator.dna
+                                     or result.reverse_complement().sequence == generator.dna)
+    logger.info(f"Sequenzierung erfolgreich: {'JA' if correct else 'NEIN'}")
+    return 0 if correct else 1
+
+
+def run_convert(args: argparse.Namespace) -> int:
+    """Batch-Befehl 'convert': Eingabedatei gestreamt in einen Fragmentspeicher schreiben."""
+    count = FragmentStore.convert(args.input, args.output)
+    logger.info(f"{count} Fragmente nach {args.output} geschrieben.")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    configure_logging(args.verbose, args.quiet)
+    if args.command is None:
+        run_interactive(args)
+        return 0
+
+    try:
+        if args.command == "convert":
+            return run_convert(args)
+        if args.command == "pipeline":
+            return run_pipeline(args)
+        return run_assemble(args) if args.command == "assemble" else run_simulate(args)
+    except (OSError, ValueError) as e:
+        logger.error(f"[ERROR] {e}")
+        return 1
+
+
+def run_interactive(args: argparse.Namespace):
+    """Interaktiver Ablauf über Eingaben in der Kommandozeile."""
     print("Willkommen beim DNA-Sequenzierungstool!")
 
     mode = ask_choice("Möchten Sie eine Datei einlesen, oder zuällige Fragmente generieren?", ["file", "generate"])
@@ -83,14 +362,14 @@ def main():
         print("Originalsequenz:", generator.dna)
 
     if strand == "double":
-        method = ask_choice("\nOrientierungsmethode wählen", ["local", "global"])
-        selector = OrientationSelector(fragments)
-        fragments = selector.select_orientation_local() if method == "local" else selector.select_orientation_global()
+        method = ask_choice("\nOrientierungsmethode wählen", list(OrientationSelector.METHODS))
+        selector = OrientationSelector(fragments, workers=args.workers)
+        fragments = selector.select_orientation(method)
 
     pause()
 
     print("Starte Greedy-Assembly...")
-    graph = OverlapGraph(fragments)
+    graph = OverlapGraph(fragments, workers=args.workers)
     assembler = GreedyAssembler(graph)
     result = assembler.assemble()
 
@@ -109,4 +388,4 @@ def main():
             print("Die rekonstruierte Sequenz unterscheidet sich vom Original.")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
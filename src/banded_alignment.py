@@ -0,0 +1,63 @@
+def banded_overlap(seq_a: str, seq_b: str, start: int, band: int, max_error_rate: float,
+                   proper: bool = True) -> tuple[int, int] | None:
+    """
+    Prüft einen fehlertoleranten Overlap von seq_a nach seq_b, der in seq_a bei `start` beginnt.
+
+    Das Suffix seq_a[start:] wird vollständig gegen ein Präfix von seq_b ausgerichtet
+    (Edit-Distanz: Mismatch, Einfügung und Löschung kosten je 1). Berechnet werden nur die Zellen
+    im Band |i - j| <= band um die Diagonale, der Aufwand ist damit O(Overlap-Länge · band).
+    Das Ende in seq_b ist frei wählbar, solange es im Band liegt.
+
+    Parameter:
+        start (int): Position in seq_a, an der der Overlap beginnt (z. B. aus einem Seed-Treffer).
+        band (int): Maximale Abweichung von der Diagonalen (= maximale Zahl an Indels).
+        max_error_rate (float): Erlaubte Fehler pro Base des Overlaps.
+        proper (bool): Wenn True, darf der Overlap keine der beiden Sequenzen vollständig abdecken.
+
+    Rückgabe:
+        (Länge des Präfixes von seq_b, Anzahl Fehler) oder None, falls kein Overlap im Rahmen liegt.
+    """
+    suffix = seq_a[start:]
+    m = len(suffix)
+    n = len(seq_b)
+    if m == 0 or (proper and start == 0):
+        return None
+    max_errors = int(max_error_rate * m)
+    infinity = m + n + 1
+
+    # previous[j - i + band] = Kosten, um suffix[:i] gegen seq_b[:j] auszurichten
+    width = 2 * band + 1
+    previous = [infinity] * width
+    for j in range(0, min(band, n) + 1):
+        previous[j + band] = j
+    for i in range(1, m + 1):
+        current = [infinity] * width
+        base = suffix[i - 1]
+        row_min = infinity
+        for offset in range(width):
+            j = i + offset - band
+            if j < 0 or j > n:
+                continue
+            if j == 0:
+                cost = i
+            else:
+                cost = previous[offset] + (base != seq_b[j - 1])                # Match/Mismatch
+                if offset + 1 < width and previous[offset + 1] + 1 < cost:
+                    cost = previous[offset + 1] + 1                             # Base aus seq_a überzählig
+                if offset > 0 and current[offset - 1] + 1 < cost:
+                    cost = current[offset - 1] + 1                              # Base aus seq_b überzählig
+            current[offset] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_errors:
+            return None
+        previous = current
+
+    best = None
+    for offset in range(width):
+        j = m + offset - band
+        if 0 < j <= n and not (proper and j == n) and previous[offset] <= max_errors:
+            # Bei gleicher Fehlerzahl das längere Präfix bevorzugen
+            if best is None or (previous[offset], -j) < (best[1], -best[0]):
+                best = (j, previous[offset])
+    return best
@@ -0,0 +1,100 @@
+import logging
+from typing import List
+from fragment import Fragment
+from sequence_codec import reverse_complement
+
+logger = logging.getLogger(__name__)
+
+class ContainmentFilter:
+    """
+    Vorfilter, der Duplikate und enthaltene Fragmente noch vor dem Graphaufbau entfernt.
+
+    Solche Reads tragen keine neue Information zur Sequenz bei, erzeugen im Overlap-Graphen aber
+    überflüssige Kanten (ein enthaltener Read überlappt mit allen Nachbarn seines Containers) oder
+    werden vom GreedyAssembler nie zusammengeführt.
+
+    - remove_duplicates(): exakte Duplikate über eine Hash-Tabelle der Sequenzen, bei Doppelstrang
+      über die kanonische Form (kleinere von Sequenz und Reverse Complement).
+    - remove_contained(): Fragmente, die Teilstring eines anderen Fragments sind (bei Doppelstrang
+      auch als Reverse Complement), über einen k-mer-Index statt paarweiser `in`-Prüfungen.
+    """
+    SEED_LENGTH = 16  # Länge der k-mer-Seeds für die Suche nach enthaltenen Fragmenten
+
+    @staticmethod
+    def remove_duplicates(fragments: List[Fragment], double_strand: bool = False) -> tuple[List[Fragment], dict]:
+        """
+        Entfernt exakte Duplikate; vom ersten Vorkommen bleibt das Fragment erhalten.
+
+        Rückgabe:
+            (verbleibende Fragmente in Eingabereihenfolge, {ID entfernt: ID des behaltenen Fragments})
+        """
+        first: dict[str, Fragment] = {}
+        kept, removed = [], {}
+        for fragment in fragments:
+            key = fragment.sequence
+            if double_strand:
+                key = min(key, reverse_complement(key))
+            original = first.setdefault(key, fragment)
+            if original is fragment:
+                kept.append(fragment)
+            else:
+                removed[fragment.id] = original.id
+        return kept, removed
+
+    @staticmethod
+    def remove_contained(fragments: List[Fragment], double_strand: bool = False) -> tuple[List[Fragment], dict]:
+        """
+        Entfernt alle Fragmente, die echter Teilstring eines anderen (längeren) Fragments sind.
+
+        Jedes Fragment wird über sein erstes k-mer indiziert, bei Doppelstrang zusätzlich über das
+        erste k-mer seines Reverse Complements. Für jede Position eines Fragments s wird das dort
+        beginnende k-mer nachgeschlagen und nur für die Treffer geprüft, ob das Fragment an dieser
+        Stelle in s beginnt. Exakte Duplikate werden hier nicht erkannt (siehe remove_duplicates()).
+
+        Rückgabe:
+            (verbleibende Fragmente in Eingabereihenfolge, {ID entfernt: ID des enthaltenden Fragments})
+        """
+        if not fragments:
+            return [], {}
+        sequences = [f.sequence for f in fragments]
+        k = min(ContainmentFilter.SEED_LENGTH, min(len(seq) for seq in sequences))
+        seeds: dict[str, list[tuple[int, str]]] = {}
+        for r, seq in enumerate(sequences):
+            seeds.setdefault(seq[:k], []).append((r, seq))
+            if double_strand:
+                rc_seq = reverse_complement(seq)
+                if rc_seq != seq:
+                    seeds.setdefault(rc_seq[:k], []).append((r, rc_seq))
+
+        container: dict[int, int] = {}
+        for s, seq in enumerate(sequences):
+            for p in range(len(seq) - k + 1):
+                for r, read in seeds.get(seq[p:p + k], ()):
+                    if r not in container and len(read) < len(seq) and seq.startswith(read, p):
+                        container[r] = s
+
+        # Ketten auflösen, damit jedes entfernte Fragment auf ein verbleibendes zeigt
+        removed = {}
+        for r, s in container.items():
+            while s in container:
+                s = container[s]
+            removed[fragments[r].id] = fragments[s].id
+        return [f for r, f in enumerate(fragments) if r not in container], removed
+
+    @staticmethod
+    def filter(fragments: List[Fragment], double_strand: bool = False) -> tuple[List[Fragment], dict]:
+        """
+        Entfernt zuerst Duplikate, dann enthaltene Fragmente.
+
+        Rückgabe:
+            (verbleibende Fragmente in Eingabereihenfolge, Statistik mit "duplicates", "contained" und
+            "removed" = {ID entfernt: ID des verbleibenden Fragments, das es enthält})
+        """
+        unique, duplicates = ContainmentFilter.remove_duplicates(fragments, double_strand)
+        kept, contained = ContainmentFilter.remove_contained(unique, double_strand)
+        # Duplikate auf den Container ihres Originals umlenken, falls dieses selbst enthalten war
+        removed = {r: contained.get(s, s) for r, s in duplicates.items()}
+        removed.update(contained)
+        logger.info(f"[ContainmentFilter] {len(duplicates)} Duplikate und {len(contained)} enthaltene "
+                    f"Fragmente entfernt, {len(kept)} verbleiben.")
+        return kept, {"duplicates": len(duplicates), "contained": len(contained), "removed": removed}
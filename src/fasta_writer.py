@@ -0,0 +1,35 @@
+from typing import Iterable
+from fragment import Fragment
+
+class FastaWriter:
+    """
+    Eine Hilfsklasse zum Schreiben von Fragmenten bzw. Contigs im FASTA-Format.
+    """
+
+    @staticmethod
+    def write(filepath: str, fragments: Iterable[Fragment], line_width: int = 60) -> int:
+        """
+        Schreibt alle Fragmente als FASTA-Records in eine Datei.
+
+        Parameter:
+            filepath (str): Zieldatei.
+            fragments (Iterable[Fragment]): Die zu schreibenden Fragmente.
+            line_width (int): Maximale Zeilenlänge der Sequenzzeilen (0 = keine Umbrüche).
+
+        Rückgabe:
+            int: Anzahl der geschriebenen Records.
+        """
+        count = 0
+        try:
+            with open(filepath, "w") as f:
+                for fragment in fragments:
+                    sequence = fragment.sequence
+                    f.write(f">{fragment.id} length={len(sequence)}\n")
+                    step = line_width if line_width > 0 else max(1, len(sequence))
+                    for start in range(0, len(sequence), step):
+                        f.write(sequence[start:start + step])
+                        f.write("\n")
+                    count += 1
+        except OSError as e:
+            raise IOError(f"Fehler beim Schreiben der Datei '{filepath}': {e}")
+        return count
@@ -1,36 +1,132 @@
-from typing import List
+import gzip
+import io
+from typing import IO, Iterator, List
 from fragment import Fragment
+from fragment_store import FragmentStore
 
 class FileParser:
     """
     Eine Hilfsklasse zum Einlesen von DNA-Fragmenten aus einer Textdatei.
 
-    Jede Zeile der Datei wird als ein Fragment interpretiert.
-    Die Fragmente werden als Fragment-Objekte mit eindeutiger ID zurückgegeben.
+    Unterstützte Formate (automatisch erkannt, optional gzip-komprimiert):
+    - Einfacher Text: Jede nicht-leere Zeile ist ein Fragment (IDs "Frag_0", "Frag_1", ...).
+    - FASTA: Records mit Kopfzeile ">name", Sequenz auch über mehrere Zeilen.
+    - FASTQ: Records aus vier Zeilen "@name", Sequenz, "+", Qualitätswerte.
+    - Fragmentspeicher (siehe FragmentStore), erkannt an den Magic Bytes "FSTR".
+
+    Bei FASTA/FASTQ wird der Record-Name (erstes Wort der Kopfzeile) als ID übernommen.
     """
+    BUFFER_SIZE = 1 << 20  # Größe der Lesepuffer in Bytes
+
+    @staticmethod
+    def parse_fragments(filepath: str, packed: bool = False) -> List[Fragment]:
+        """
+        Liest eine Datei vollständig ein und gibt alle Fragmente als Liste zurück.
+
+        Mit packed=True werden die Sequenzen 2-Bit-gepackt gespeichert (lohnt sich erst bei langen
+        Reads, siehe PackedSequence).
+        """
+        return list(FileParser.iter_fragments(filepath, packed=packed))
 
     @staticmethod
-    def parse_fragments(filepath: str) -> List[Fragment]:
+    def iter_fragments(filepath: str, packed: bool = False, keep_quality: bool = False) -> Iterator[Fragment]:
         """
-        Liest eine Datei zeilenweise ein und wandelt jede nicht-leere Zeile
-        in ein Fragment-Objekt um.
+        Liest eine Datei gestreamt ein und liefert die Fragmente einzeln.
+
+        Es wird immer nur der aktuelle Record im Speicher gehalten; wird der Iterator von
+        einer Pipeline-Stufe konsumiert, bleibt der Speicherbedarf unabhängig von der Dateigröße.
+
+        Parameter:
+            filepath (str): Pfad zur Datei (Text, FASTA oder FASTQ, optional .gz).
+            packed (bool): Sequenzen 2-Bit-gepackt speichern.
+            keep_quality (bool): Qualitätswerte aus FASTQ-Dateien am Fragment behalten.
         """
-        fragments: List[Fragment] = []
         try:
-            with open(filepath, 'r') as f:
-                fragment_id_counter = 0 # Zähler zur Vergabe eindeutiger IDs
+            if FragmentStore.is_store(filepath):
+                with FragmentStore(filepath) as store:
+                    yield from store.iter_fragments(packed=packed)
+                return
 
-                for line in f:
-                    sequence = line.strip() # Entfernt \n und Leerzeichen
-                    if sequence:
-                        # Erzeuge ein Fragment-Objekt mit eindeutiger ID
-                        fragments.append(Fragment(id=f"Frag_{fragment_id_counter}", sequence=sequence))
-                        fragment_id_counter += 1
-            return fragments
+            with FileParser._open(filepath) as f:
+                first_line = ""
+                for first_line in f:
+                    if first_line.strip():
+                        break
+
+                if first_line.startswith(">"):
+                    records = FileParser._read_fasta(f, first_line)
+                elif first_line.startswith("@"):
+                    records = FileParser._read_fastq(f, first_line)
+                else:
+                    records = FileParser._read_lines(f, first_line)
+
+                fragment_id_counter = 0 # Zähler zur Vergabe eindeutiger IDs
+                for name, sequence, quality in records:
+                    if not sequence:
+                        continue
+                    # Erzeuge ein Fragment-Objekt mit eindeutiger ID
+                    yield Fragment(id=name or f"Frag_{fragment_id_counter}", sequence=sequence, packed=packed,
+                                   quality=quality if keep_quality else None)
+                    fragment_id_counter += 1
         except FileNotFoundError:
             # Falls Datei nicht existiert
             raise FileNotFoundError(f"Die Datei '{filepath}' wurde nicht gefunden.")
         except Exception as e:
             # Allgemeiner Fehler beim Einlesen
             raise IOError(f"Fehler beim Lesen der Datei '{filepath}': {e}")
-        
\ No newline at end of file
+
+    @staticmethod
+    def _open(filepath: str) -> IO[str]:
+        """
+        Öffnet eine Datei gepuffert als Text; gzip-Dateien werden an den Magic Bytes erkannt.
+        """
+        raw = open(filepath, "rb", buffering=FileParser.BUFFER_SIZE)
+        if raw.peek(2)[:2] == b"\x1f\x8b":
+            raw = io.BufferedReader(gzip.GzipFile(fileobj=raw), buffer_size=FileParser.BUFFER_SIZE)
+        return io.TextIOWrapper(raw, encoding="ascii")
+
+    @staticmethod
+    def _read_lines(f: IO[str], first_line: str) -> Iterator[tuple]:
+        """Einfaches Textformat: jede Zeile eine Sequenz."""
+        yield None, first_line.strip(), None # Entfernt \n und Leerzeichen
+        for line in f:
+            yield None, line.strip(), None
+
+    @staticmethod
+    def _read_fasta(f: IO[str], first_line: str) -> Iterator[tuple]:
+        """FASTA-Format: Kopfzeile gefolgt von einer oder mehreren Sequenzzeilen."""
+        name = FileParser._record_name(first_line)
+        parts: list[str] = []
+        for line in f:
+            line = line.strip()
+            if line.startswith(">"):
+                yield name, "".join(parts), None
+                name = FileParser._record_name(line)
+                parts = []
+            elif line:
+                parts.append(line)
+        yield name, "".join(parts), None
+
+    @staticmethod
+    def _read_fastq(f: IO[str], first_line: str) -> Iterator[tuple]:
+        """FASTQ-Format: Records aus jeweils vier Zeilen."""
+        header = first_line
+        while header:
+            if not header.strip():
+                header = f.readline()
+                continue
+            if not header.startswith("@"):
+                raise ValueError(f"Ungültiger FASTQ-Record, erwartet '@': {header.strip()}")
+            sequence = f.readline().strip()
+            separator = f.readline()
+            quality = f.readline().strip()
+            if not separator.startswith("+"):
+                raise ValueError(f"Ungültiger FASTQ-Record ohne '+'-Zeile: {header.strip()}")
+            yield FileParser._record_name(header), sequence, quality
+            header = f.readline()
+
+    @staticmethod
+    def _record_name(header: str) -> str | None:
+        """Erstes Wort der Kopfzeile ohne das Präfix '>' bzw. '@'."""
+        words = header[1:].split()
+        return words[0] if words else None
@@ -0,0 +1,112 @@
+from array import array
+from itertools import accumulate
+from operator import ne
+
+_PREFIX = 32  # Zeichen, nach denen die erste Runde sortiert
+
+
+def suffix_array(text: bytes) -> list[int]:
+    """
+    Sortiert alle Suffixe von `text` per Präfixverdopplung und liefert ihre Startpositionen.
+
+    Nach jeder Runde sind die Suffixe nach ihren ersten k Zeichen sortiert; der Rang eines Suffixes
+    zusammen mit dem Rang des k Zeichen später beginnenden Suffixes ergibt die Sortierung nach
+    2k Zeichen. Die erste Runde sortiert direkt nach den ersten 32 Zeichen. Pro Runde kostet das eine Sortierung (O(N log N)); die Runden enden, sobald
+    alle Ränge verschieden sind, also nach O(log R) Runden für die Länge R der längsten
+    Wiederholung im Text.
+    """
+    n = len(text)
+    if n == 0:
+        return []
+    # Erste Runde direkt über die ersten _PREFIX Zeichen (Bytevergleich in C) statt Zeichen für Zeichen
+    k = _PREFIX
+    keys = [text[i:i + k] for i in range(n)]
+    sa = sorted(range(n), key=keys.__getitem__)
+    rank, distinct = _ranks(sa, keys)
+
+    while distinct < n:
+        # Schlüssel (Rang an i, Rang an i + k) als eine Zahl; hinter dem Textende zählt -1
+        keys = [first * (n + 1) + second + 1 for first, second in zip(rank, rank[k:] + [-1] * k)]
+        sa.sort(key=keys.__getitem__)
+        rank, distinct = _ranks(sa, keys)
+        k *= 2
+    return sa
+
+
+def _ranks(sa: list[int], keys) -> tuple[list[int], int]:
+    """
+    Dichte Ränge der nach `keys` sortierten Positionen `sa` (gleiche Schlüssel, gleicher Rang)
+    und die Anzahl verschiedener Ränge. Läuft über accumulate/map statt über eine Python-Schleife.
+    """
+    sorted_keys = list(map(keys.__getitem__, sa))
+    ranks = list(accumulate(map(ne, sorted_keys[1:], sorted_keys[:-1]), initial=0))
+    rank = [0] * len(sa)
+    for position, value in zip(sa, ranks):
+        rank[position] = value
+    return rank, ranks[-1] + 1
+
+
+class FMIndex:
+    """
+    FM-Index über eine Menge von Sequenzen zur Suche nach Sequenzen mit einem gegebenen Präfix.
+
+    Die Sequenzen werden als T = "$" s0 "$" s1 ... "$" s(n-1) "#" verkettet ("#" < "$" < Basen).
+    Aus dem Suffix-Array von T entsteht die Burrows-Wheeler-Transformierte; gespeichert werden
+    nur sie, die Zählstände jedes Zeichens alle 64 Zeilen und die Sequenz hinter jeder
+    "$"-Zeile. Das Suffix-Array selbst wird nach dem Aufbau verworfen.
+
+    Ein Muster wird per Rückwärtssuche von hinten nach vorne verlängert (extend(), O(1) pro
+    Zeichen). Ein weiterer Schritt mit "$" (starting_with()) liefert genau die Sequenzen, die mit
+    dem bisherigen Muster beginnen, da das Muster selbst kein "$" enthält.
+    """
+    _BLOCK = 64
+    _SEPARATOR = ord("$")
+
+    def __init__(self, sequences: list[str]):
+        text = b"$" + b"$".join(sequence.encode("ascii") for sequence in sequences) + b"#" if sequences else b"#"
+        sa = suffix_array(text)
+        self._bwt = bytes([text[position - 1] for position in sa])  # text[-1] = "#" für Position 0
+
+        # Sequenzindex hinter jeder "$"-Zeile; die "$"-Zeilen folgen direkt auf die "#"-Zeile
+        sequence_at = {}
+        start = 0
+        for index, sequence in enumerate(sequences):
+            sequence_at[start] = index
+            start += len(sequence) + 1
+        self._sequence_of_row = [sequence_at[position] for position in sa[1:len(sequences) + 1]]
+
+        self._first: dict[int, int] = {}  # C-Tabelle: Anzahl kleinerer Zeichen in T
+        self._checkpoints: dict[int, array] = {}
+        total = 0
+        for char in sorted(set(self._bwt)):
+            self._first[char] = total
+            total += self._bwt.count(char)
+            counts = array("l", [0])
+            for block in range(0, len(self._bwt), self._BLOCK):
+                counts.append(counts[-1] + self._bwt.count(char, block, block + self._BLOCK))
+            self._checkpoints[char] = counts
+
+    def __len__(self) -> int:
+        """Anzahl der Zeilen (Länge von T)."""
+        return len(self._bwt)
+
+    def occ(self, char: int, row: int) -> int:
+        """Anzahl von `char` in den ersten `row` Zeichen der BWT."""
+        block = row // self._BLOCK
+        return self._checkpoints[char][block] + self._bwt.count(char, block * self._BLOCK, row)
+
+    def extend(self, char: int, lo: int, hi: int) -> tuple[int, int]:
+        """
+        Setzt `char` vor das Muster mit dem Zeilenbereich [lo, hi) (anfangs [0, len(self))).
+        Ein leerer Bereich (lo >= hi) bedeutet, dass das verlängerte Muster nicht vorkommt.
+        """
+        first = self._first.get(char)
+        if first is None:
+            return 0, 0
+        return first + self.occ(char, lo), first + self.occ(char, hi)
+
+    def starting_with(self, lo: int, hi: int) -> list[int]:
+        """Indizes der Sequenzen, die mit dem Muster des Zeilenbereichs [lo, hi) beginnen."""
+        lo, hi = self.extend(self._SEPARATOR, lo, hi)
+        first = self._first.get(self._SEPARATOR, 0)
+        return self._sequence_of_row[lo - first:hi - first]
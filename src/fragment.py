@@ -1,41 +1,250 @@
+from array import array
+from packed_sequence import PackedSequence
+from sequence_codec import is_valid, reverse_complement, reverse_complements
+from rolling_hash import merge_prefix_hashes, merge_suffix_hashes, prefix_hashes, suffix_hashes
+
 class Fragment:
     """
     Repräsentiert ein einzelnes DNA-Fragment.
 
     Attribute:
         _id (int oder str): Eine eindeutige Kennung für das Fragment.
-        _sequence (str): Die DNA-Sequenz des Fragments.
+        _sequence (str oder PackedSequence): Die DNA-Sequenz des Fragments, optional 2-Bit-gepackt.
+        _quality (str oder None): Optionale Qualitätswerte (z. B. aus FASTQ), ein Zeichen pro Base.
+        _prefix_hashes, _suffix_hashes (array oder None): Zwischengespeicherte Rolling-Hashes
+            aller Präfixe bzw. Suffixe (siehe rolling_hash).
     """
+    __slots__ = ("_id", "_sequence", "_quality", "_prefix_hashes", "_suffix_hashes")
 
-    def __init__(self, id: int | str, sequence: str):
+    def __init__(self, id: int | str, sequence: str, packed: bool = False, quality: str | None = None):
         if not isinstance(sequence, str) or not sequence:
             raise ValueError("Die Sequenz muss ein nicht-leerer String sein.")
-        if not all(base in "ATGCatgc" for base in sequence):
+        if not is_valid(sequence):
             raise ValueError(f"Die Sequenz enthält möglicherweise ungültige Basen: {sequence}")
+        if quality is not None and len(quality) != len(sequence):
+            raise ValueError("Die Qualitätswerte müssen dieselbe Länge wie die Sequenz haben.")
 
         self._id = id
-        self._sequence = sequence.upper()
+        self._sequence = PackedSequence(sequence) if packed else sequence.upper()
+        self._quality = quality
+        self._prefix_hashes = None
+        self._suffix_hashes = None
+
+    @classmethod
+    def _from_validated(cls, id: int | str, sequence: "str | PackedSequence",
+                        quality: str | None = None) -> "Fragment":
+        """
+        Erzeugt ein Fragment aus bereits validierten Daten (Großbuchstaben bzw. gepackt),
+        ohne die Basen erneut zu prüfen.
+        """
+        fragment = cls.__new__(cls)
+        fragment._id = id
+        fragment._sequence = sequence
+        fragment._quality = quality
+        fragment._prefix_hashes = None
+        fragment._suffix_hashes = None
+        return fragment
 
     @property
     def sequence(self) -> str:
-        """Zugriff auf die DNA-Sequenz (öffentlich lesbar, aber geschützt gespeichert)."""
-        return self._sequence
+        """
+        Zugriff auf die DNA-Sequenz (öffentlich lesbar, aber geschützt gespeichert).
+        Gepackte Sequenzen werden bei jedem Zugriff entpackt; die Overlap-Engines lesen die
+        Sequenzen deshalb einmal pro Graphaufbau und arbeiten danach auf Strings.
+        """
+        sequence = self._sequence
+        return sequence if type(sequence) is str else sequence.decode()
 
     @property
     def id(self) -> int | str:
         """Zugriff auf die ID (öffentlich lesbar, aber geschützt gespeichert)."""
         return self._id
 
+    @property
+    def quality(self) -> str | None:
+        """Qualitätswerte des Fragments oder None, falls keine vorliegen."""
+        return self._quality
+
+    @property
+    def is_packed(self) -> bool:
+        """Gibt an, ob die Sequenz 2-Bit-gepackt gespeichert ist."""
+        return type(self._sequence) is not str
+
+    @property
+    def packed(self) -> PackedSequence:
+        """Die Sequenz in 2-Bit-gepackter Form (wird bei Bedarf erzeugt)."""
+        sequence = self._sequence
+        return sequence if type(sequence) is not str else PackedSequence(sequence)
+
+    @property
+    def prefix_hashes(self) -> array:
+        """Polynomiale Hashes aller Präfixe, werden beim ersten Zugriff berechnet und gespeichert."""
+        if self._prefix_hashes is None:
+            self._prefix_hashes = prefix_hashes(self.sequence)
+        return self._prefix_hashes
+
+    @property
+    def suffix_hashes(self) -> array:
+        """Polynomiale Hashes aller Suffixe, werden beim ersten Zugriff berechnet und gespeichert."""
+        if self._suffix_hashes is None:
+            self._suffix_hashes = suffix_hashes(self.prefix_hashes)
+        return self._suffix_hashes
+
+    @property
+    def has_hashes(self) -> bool:
+        """Gibt an, ob die Rolling-Hashes bereits berechnet wurden."""
+        return self._prefix_hashes is not None and self._suffix_hashes is not None
+
+    def set_hashes(self, prefix: array, suffix: array):
+        """Übernimmt bereits berechnete Hashes (z. B. aus den Eltern eines Merges)."""
+        if len(prefix) != len(self) + 1 or len(suffix) != len(self) + 1:
+            raise ValueError("Die Hashes passen nicht zur Länge der Sequenz.")
+        self._prefix_hashes = prefix
+        self._suffix_hashes = suffix
+
+    def head(self, n: int) -> str:
+        """Die ersten n Basen der Sequenz."""
+        return self.sequence[:n]
+
+    def tail(self, n: int) -> str:
+        """Die letzten n Basen der Sequenz (n >= 1)."""
+        return self.sequence[-n:]
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
     def reverse_complement(self) -> "Fragment":
         """
         Erzeugt das Reverse Complement der Sequenz und gibt ein neues Fragment zurück.
         """
-        complement = {"A": "T", "T": "A", "G": "C", "C": "G"}
-        rc_seq = "".join(complement[base] for base in reversed(self._sequence))
-        return Fragment(f"{self._id}_cf", rc_seq)
-    
+        rc_quality = self._quality[::-1] if self._quality is not None else None
+        if self.is_packed:
+            return Fragment._from_validated(f"{self._id}_cf", self._sequence.reverse_complement(), rc_quality)
+        return Fragment._from_validated(f"{self._id}_cf", reverse_complement(self.sequence), rc_quality)
+
+    @staticmethod
+    def reverse_complement_all(fragments: list["Fragment"]) -> list["Fragment"]:
+        """
+        Reverse Complements vieler Fragmente; ungepackte Sequenzen werden gemeinsam in einem
+        Durchlauf komplementiert (siehe sequence_codec.reverse_complements).
+        """
+        plain = [fragment for fragment in fragments if not fragment.is_packed]
+        complements = iter(reverse_complements([fragment.sequence for fragment in plain]))
+        result = []
+        for fragment in fragments:
+            if fragment.is_packed:
+                result.append(fragment.reverse_complement())
+            else:
+                quality = fragment._quality[::-1] if fragment._quality is not None else None
+                result.append(Fragment._from_validated(f"{fragment._id}_cf", next(complements), quality))
+        return result
+
     def __str__(self) -> str:
         """
         String-Repräsentation des Fragments.
         """
-        return f"Fragment {self._id}: {self._sequence}"
+        return f"Fragment {self._id}: {self.sequence}"
+
+
+class MergedFragment(Fragment):
+    """
+    Contig aus zwei bereits validierten Fragmenten: source + target[overlap_len:].
+
+    Statt die Sequenz bei jedem Merge zu kopieren, merkt sich der Contig nur seine beiden Teile
+    (Rope). Über viele Merges entsteht so ein Binärbaum, dessen Blätter die ursprünglichen
+    Fragmente sind; ein Merge kostet O(1) statt O(Contig-Länge) und prüft keine Basen erneut.
+    Die vollständige Sequenz wird erst beim ersten Zugriff auf `sequence` zusammengesetzt und
+    dann zwischengespeichert. head()/tail() lesen nur die benötigten Blätter.
+
+    Attribute:
+        _parts (tuple): (source, target, overlap_len)
+        _length (int): Länge der zusammengesetzten Sequenz.
+    """
+    __slots__ = ("_parts", "_length")
+
+    def __init__(self, id: int | str, source: Fragment, target: Fragment, overlap_len: int):
+        if not 0 <= overlap_len <= len(target):
+            raise ValueError("Die Overlap-Länge passt nicht zum Ziel-Fragment.")
+        self._id = id
+        self._sequence = None  # wird erst bei Bedarf zusammengesetzt
+        self._quality = None
+        self._prefix_hashes = None
+        self._suffix_hashes = None
+        self._parts = (source, target, overlap_len)
+        self._length = len(source) + len(target) - overlap_len
+        # Die Teile gehen im Contig auf; ihre zwischengespeicherten Sequenzen werden nicht mehr
+        # gebraucht und sollen nicht über den Baum am Leben bleiben. Ihre Hashes bleiben erhalten,
+        # bis der Contig seine eigenen daraus ableitet (siehe prefix_hashes).
+        for part in (source, target):
+            if isinstance(part, MergedFragment):
+                part._sequence = None
+
+    @property
+    def sequence(self) -> str:
+        if self._sequence is None:
+            self._sequence = "".join(self._pieces(0, self._length))
+        return self._sequence
+
+    @property
+    def is_packed(self) -> bool:
+        return False
+
+    @property
+    def prefix_hashes(self) -> array:
+        """
+        Präfix-Hashes des Contigs, erst beim ersten Zugriff (z. B. durch die Engine "rolling")
+        berechnet. Liegen die Hashes beider Teile vor, werden sie daraus abgeleitet, ohne die
+        Basen erneut zu lesen; danach werden die Hashes verbrauchter Contig-Teile freigegeben.
+        """
+        if self._prefix_hashes is None:
+            source, target, overlap_len = self._parts
+            if source.has_hashes and target.has_hashes:
+                self._prefix_hashes = merge_prefix_hashes(source.prefix_hashes, target.prefix_hashes, overlap_len)
+                self._suffix_hashes = merge_suffix_hashes(target.suffix_hashes, self._prefix_hashes)
+                for part in (source, target):
+                    if isinstance(part, MergedFragment):
+                        part._prefix_hashes = None
+                        part._suffix_hashes = None
+            else:
+                self._prefix_hashes = prefix_hashes(self.sequence)
+        return self._prefix_hashes
+
+    @property
+    def packed(self) -> PackedSequence:
+        return PackedSequence(self.sequence)
+
+    def head(self, n: int) -> str:
+        if self._sequence is not None:
+            return self._sequence[:n]
+        return "".join(self._pieces(0, min(n, self._length)))
+
+    def tail(self, n: int) -> str:
+        if self._sequence is not None:
+            return self._sequence[-n:]
+        return "".join(self._pieces(max(self._length - n, 0), self._length))
+
+    def _pieces(self, start: int, end: int) -> list[str]:
+        """
+        Teilstücke der Sequenz im Bereich [start, end), von links nach rechts.
+        Iterativ, da der Baum bei langen Contigs sehr tief wird.
+        """
+        pieces = []
+        stack = [(self, start, end)]
+        while stack:
+            node, start, end = stack.pop()
+            if start >= end:
+                continue
+            if not isinstance(node, MergedFragment) or node._sequence is not None:
+                pieces.append(node.sequence[start:end])
+                continue
+            source, target, overlap_len = node._parts
+            split = len(source)
+            # Rechter Teil zuerst auf den Stapel, damit der linke zuerst ausgegeben wird
+            if end > split:
+                stack.append((target, max(start, split) - split + overlap_len, end - split + overlap_len))
+            if start < split:
+                stack.append((source, start, min(end, split)))
+        return pieces
+
+    def __len__(self) -> int:
+        return self._length
@@ -70,10 +70,10 @@ class FragmentGenerator:
         Rückgabe:
             list[Fragment]: Neue Liste mit ggf. umorientierten Fragmenten.
         """
-        return [
-            f.reverse_complement() if random.random() < ratio else f
-            for f in fragments
-        ]
+        flags = [random.random() < ratio for _ in fragments]
+        # Alle gewählten Fragmente gemeinsam komplementieren statt einzeln
+        complements = iter(Fragment.reverse_complement_all([f for f, flag in zip(fragments, flags) if flag]))
+        return [next(complements) if flag else f for f, flag in zip(fragments, flags)]
 
     def generate_fragments(self) -> list[Fragment]:
         """
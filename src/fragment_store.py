@@ -0,0 +1,176 @@
+import mmap
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import Iterable, Iterator
+from fragment import Fragment
+from packed_sequence import PackedSequence
+
+class FragmentStore:
+    """
+    Fragmentspeicher auf der Festplatte, der per mmap geöffnet wird.
+
+    Alle Sequenzen liegen hintereinander in einem einzigen Puffer, ein Offset-Array markiert
+    die Fragmentgrenzen. sequence_view() liefert eine Sequenz als memoryview-Ausschnitt der
+    gemappten Datei (ohne Kopie), sequence_length() liest nur die Offsets; erst sequence()/
+    fragment() erzeugen Python-Objekte, und das Betriebssystem lädt nur die gelesenen Seiten.
+
+    Der Speicher erspart beim erneuten Einlesen das Parsen und Prüfen der Basen (fragment()
+    übernimmt die beim Schreiben geprüften Sequenzen unverändert). Die Assembly selbst
+    (FileParser, Overlap-Engines, OverlapGraph, GreedyAssembler) liest die gemappten Daten nicht
+    direkt, sondern erzeugt weiterhin für jedes Fragment ein Fragment-Objekt mit eigenem String;
+    ihr Speicherbedarf sinkt dadurch nicht. Ohne Kopie arbeiten nur Zugriffe auf einzelne
+    Sequenzen über sequence_view().
+
+    Dateiformat (native Bytereihenfolge, 8-Byte-ausgerichtet):
+        Kopf:       Magic "FSTR", Version, Anzahl Fragmente n, Position der Offsets,
+                    Position der ID-Offsets, Position der IDs
+        Sequenzen:  alle Sequenzen als ASCII hintereinander
+        Offsets:    uint64-Array der Länge n + 1 (Beginn jeder Sequenz, zuletzt das Ende)
+        ID-Offsets: uint64-Array der Länge n + 1 in den ID-Block
+        IDs:        alle IDs als UTF-8 hintereinander
+    """
+    MAGIC = b"FSTR"
+    VERSION = 1
+    _HEADER = struct.Struct("=4sIQQQQ")  # 40 Bytes
+
+    def __init__(self, path: str):
+        """Öffnet einen Fragmentspeicher zum Lesen."""
+        self.path = path
+        try:
+            self._file = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Die Datei '{path}' wurde nicht gefunden.")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, offsets_pos, id_offsets_pos, ids_pos = FragmentStore._HEADER.unpack_from(self._data)
+        except (ValueError, struct.error):
+            self._file.close()
+            raise ValueError(f"'{path}' ist kein gültiger Fragmentspeicher.")
+        if magic != FragmentStore.MAGIC or version != FragmentStore.VERSION:
+            self.close()
+            raise ValueError(f"'{path}' ist kein gültiger Fragmentspeicher.")
+
+        self._view = memoryview(self._data)
+        self._count = count
+        self._offsets = self._view[offsets_pos:offsets_pos + 8 * (count + 1)].cast("Q")
+        self._id_offsets = self._view[id_offsets_pos:id_offsets_pos + 8 * (count + 1)].cast("Q")
+        self._ids_pos = ids_pos
+
+    @staticmethod
+    def is_store(path: str) -> bool:
+        """Prüft an den Magic Bytes, ob die Datei ein Fragmentspeicher ist."""
+        with open(path, "rb") as f:
+            return f.read(4) == FragmentStore.MAGIC
+
+    @staticmethod
+    def write(path: str, fragments: Iterable[Fragment]) -> int:
+        """
+        Schreibt Fragmente gestreamt in einen neuen Fragmentspeicher.
+
+        Im Speicher gehalten werden nur die beiden Offset-Arrays (16 Bytes pro Fragment);
+        Sequenzen und IDs werden direkt in die Datei bzw. eine temporäre Datei geschrieben.
+
+        Rückgabe:
+            int: Anzahl der geschriebenen Fragmente.
+        """
+        header_size = FragmentStore._HEADER.size
+        offsets = array("Q", [header_size])
+        id_offsets = array("Q", [0])
+        try:
+            with open(path, "wb") as f, tempfile.TemporaryFile() as ids:
+                f.write(bytes(header_size))
+                for fragment in fragments:
+                    sequence = fragment.sequence.encode("ascii")
+                    identifier = str(fragment.id).encode("utf-8")
+                    f.write(sequence)
+                    ids.write(identifier)
+                    offsets.append(offsets[-1] + len(sequence))
+                    id_offsets.append(id_offsets[-1] + len(identifier))
+
+                f.write(bytes(-f.tell() % 8))  # Arrays 8-Byte-ausgerichtet ablegen
+                offsets_pos = f.tell()
+                offsets.tofile(f)
+                id_offsets_pos = f.tell()
+                id_offsets.tofile(f)
+                ids_pos = f.tell()
+                ids.seek(0)
+                shutil.copyfileobj(ids, f)
+
+                f.seek(0)
+                f.write(FragmentStore._HEADER.pack(FragmentStore.MAGIC, FragmentStore.VERSION, len(offsets) - 1,
+                                                   offsets_pos, id_offsets_pos, ids_pos))
+        except OSError as e:
+            raise IOError(f"Fehler beim Schreiben der Datei '{path}': {e}")
+        return len(offsets) - 1
+
+    @staticmethod
+    def convert(input_path: str, store_path: str) -> int:
+        """
+        Wandelt eine Text-, FASTA- oder FASTQ-Datei (optional gzip) in einen Fragmentspeicher um.
+
+        Rückgabe:
+            int: Anzahl der übernommenen Fragmente.
+        """
+        from file_parser import FileParser  # erst hier, da FileParser selbst Fragmentspeicher liest
+
+        return FragmentStore.write(store_path, FileParser.iter_fragments(input_path))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def sequence_view(self, index: int) -> memoryview:
+        """Die Sequenz als memoryview auf die gemappte Datei (ohne Kopie)."""
+        if not 0 <= index < self._count:
+            raise IndexError(f"Fragmentindex {index} außerhalb des Bereichs.")
+        return self._view[self._offsets[index]:self._offsets[index + 1]]
+
+    def sequence(self, index: int) -> str:
+        """Die Sequenz als String."""
+        return str(self.sequence_view(index), "ascii")
+
+    def sequence_length(self, index: int) -> int:
+        """Länge der Sequenz, ohne sie zu lesen."""
+        return self._offsets[index + 1] - self._offsets[index]
+
+    def id(self, index: int) -> str:
+        """Die ID des Fragments."""
+        if not 0 <= index < self._count:
+            raise IndexError(f"Fragmentindex {index} außerhalb des Bereichs.")
+        start = self._ids_pos + self._id_offsets[index]
+        return str(self._view[start:self._ids_pos + self._id_offsets[index + 1]], "utf-8")
+
+    def fragment(self, index: int, packed: bool = False) -> Fragment:
+        """
+        Erzeugt das Fragment-Objekt für einen Eintrag. Die Basen wurden beim Schreiben bereits
+        geprüft und in Großbuchstaben abgelegt (write() nimmt nur Fragmente entgegen) und werden
+        deshalb nicht erneut validiert.
+        """
+        sequence = self.sequence(index)
+        return Fragment._from_validated(self.id(index), PackedSequence(sequence) if packed else sequence)
+
+    def iter_fragments(self, packed: bool = False) -> Iterator[Fragment]:
+        """Liefert die Fragmente einzeln in gespeicherter Reihenfolge."""
+        for index in range(self._count):
+            yield self.fragment(index, packed)
+
+    def close(self):
+        """
+        Gibt die Views frei und schließt die Datei. Sind noch Sequenz-Views in Benutzung,
+        bleibt die Abbildung bestehen, bis der letzte davon freigegeben ist.
+        """
+        try:
+            for view in ("_offsets", "_id_offsets", "_view"):
+                if hasattr(self, view):
+                    getattr(self, view).release()
+            self._data.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self) -> "FragmentStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
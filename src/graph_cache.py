@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List
+from fragment import Fragment
+from overlap_engine import NaiveOverlapEngine
+from overlap_graph import OverlapGraph
+
+logger = logging.getLogger(__name__)
+
+class GraphCache:
+    """
+    Speichert Overlap-Graphen in einem kompakten Binärformat und lädt sie bei gleicher Eingabe wieder.
+
+    Dateiformat (native Bytereihenfolge, im Kopf vermerkt):
+        Kopf:        Magic "OVGR", Version, Bytereihenfolge, Anzahl Fragmente n, Anzahl Kanten m
+        Kanten:      float64-Array der Identitäten, danach drei uint32-Arrays (Quelle, Ziel, Länge),
+                     jeweils der Länge m in Kantenreihenfolge
+        Fragmente:   uint32-Array der Sequenzlängen, danach die IDs (UTF-8, durch "\\n" getrennt)
+
+    Der Cache-Schlüssel ist ein SHA-256 über alle Fragment-IDs und -Sequenzen sowie die
+    Parameter des Graphaufbaus (z. B. die Engine). Geladen wird per mmap; die Kanten-Arrays
+    werden direkt aus der gemappten Datei gelesen, ohne die Overlaps neu zu berechnen.
+    """
+    MAGIC = b"OVGR"
+    VERSION = 2
+    SUFFIX = ".ovg"
+    _HEADER = struct.Struct("=4sIIII4x")  # 24 Bytes, die Arrays beginnen 8-Byte-ausgerichtet
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @staticmethod
+    def key(fragments: List[Fragment], **params) -> str:
+        """Berechnet den Cache-Schlüssel aus dem Inhalt der Fragmente und den Parametern."""
+        digest = hashlib.sha256()
+        digest.update(json.dumps({"version": GraphCache.VERSION, **params}, sort_keys=True).encode())
+        for fragment in fragments:
+            digest.update(f"\n{fragment.id}\t{fragment.sequence}".encode())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + GraphCache.SUFFIX)
+
+    def load(self, fragments: List[Fragment], engine: "str | NaiveOverlapEngine" = "suffix_array",
+             workers: int = 1, min_overlap: int = 1, top_k: int | None = None, **params) -> OverlapGraph | None:
+        """
+        Lädt den Graphen für diese Fragmente und Parameter aus dem Cache.
+        min_overlap und top_k gehören zum Schlüssel und werden an den geladenen Graphen übergeben.
+
+        Rückgabe:
+            Den Graphen oder None, falls kein (passender) Eintrag existiert.
+        """
+        path = self.path(GraphCache.key(fragments, engine=_engine_key(engine), min_overlap=min_overlap,
+                                        top_k=top_k, **params))
+        if not os.path.exists(path):
+            return None
+        try:
+            graph = GraphCache.read(path, fragments, engine, workers, min_overlap, top_k)
+        except ValueError as e:
+            logger.warning(f"[GraphCache] Cache-Eintrag {path} wird ignoriert: {e}")
+            return None
+        logger.info(f"[GraphCache] Overlap-Graph aus dem Cache geladen: {path}")
+        return graph
+
+    def store(self, graph: OverlapGraph, fragments: List[Fragment],
+              engine: "str | NaiveOverlapEngine" = "suffix_array", **params) -> str:
+        """Schreibt den Graphen unter dem Schlüssel der Fragmente und Parameter in den Cache."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(GraphCache.key(fragments, engine=_engine_key(engine), min_overlap=graph.min_overlap,
+                                        top_k=graph.top_k, **params))
+        temporary = f"{path}.{os.getpid()}.tmp"
+        GraphCache.write(temporary, graph)
+        os.replace(temporary, path)  # atomar, damit parallele Läufe keine halben Dateien lesen
+        logger.info(f"[GraphCache] Overlap-Graph im Cache gespeichert: {path}")
+        return path
+
+    @staticmethod
+    def write(path: str, graph: OverlapGraph):
+        """Serialisiert den Graphen (Kanten und Fragmenttabelle) in eine Datei."""
+        sources, targets, lengths, identities = graph.edge_table()
+        fragments = graph.fragments
+        ids = "\n".join(str(fragment.id) for fragment in fragments).encode("utf-8")
+        try:
+            with open(path, "wb") as f:
+                f.write(GraphCache._HEADER.pack(GraphCache.MAGIC, GraphCache.VERSION, sys.byteorder == "little",
+                                                len(fragments), len(lengths)))
+                for table in (identities, sources, targets, lengths,
+                              array("I", [len(fragment) for fragment in fragments])):
+                    table.tofile(f)
+                f.write(ids)
+        except OSError as e:
+            raise IOError(f"Fehler beim Schreiben der Datei '{path}': {e}")
+
+    @staticmethod
+    def read(path: str, fragments: List[Fragment], engine: "str | NaiveOverlapEngine" = "suffix_array",
+             workers: int = 1, min_overlap: int = 1, top_k: int | None = None) -> OverlapGraph:
+        """
+        Lädt einen gespeicherten Graphen für die gegebenen Fragmente.
+
+        Die Fragmenttabelle der Datei muss zu den Fragmenten passen (IDs und Längen), sonst
+        wird ein ValueError ausgelöst.
+        """
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            header_size = GraphCache._HEADER.size
+            if len(data) < header_size:
+                raise ValueError("Datei ist unvollständig.")
+            magic, version, little, n, m = GraphCache._HEADER.unpack_from(data)
+            if magic != GraphCache.MAGIC or version != GraphCache.VERSION:
+                raise ValueError("Unbekanntes Dateiformat.")
+            if bool(little) != (sys.byteorder == "little"):
+                raise ValueError("Datei wurde mit anderer Bytereihenfolge geschrieben.")
+            if n != len(fragments):
+                raise ValueError("Anzahl der Fragmente stimmt nicht überein.")
+            tables_start = header_size + 8 * m
+            ids_start = tables_start + 4 * (3 * m + n)
+            if len(data) < ids_start:
+                raise ValueError("Datei ist unvollständig.")
+
+            with memoryview(data) as view:
+                identities = view[header_size:tables_start].cast("d")
+                tables = view[tables_start:ids_start].cast("I")
+                try:
+                    sources, targets, lengths = tables[:m], tables[m:2 * m], tables[2 * m:3 * m]
+                    if list(tables[3 * m:]) != [len(fragment) for fragment in fragments]:
+                        raise ValueError("Fragmentlängen stimmen nicht überein.")
+                    ids = bytes(view[ids_start:]).decode("utf-8")
+                    if ids != "\n".join(str(fragment.id) for fragment in fragments):
+                        raise ValueError("Fragment-IDs stimmen nicht überein.")
+                    graph = OverlapGraph.from_edges(fragments, zip(sources, targets, lengths, identities),
+                                                    engine, workers, min_overlap, top_k)
+                finally:
+                    for table in (sources, targets, lengths, tables, identities):
+                        table.release()
+        return graph
+
+
+def _engine_key(engine: "str | NaiveOverlapEngine") -> str:
+    """Name der Engine samt ihrer Parameter (z. B. k und w beim Minimizer-Filter)."""
+    if isinstance(engine, str):
+        return engine
+    params = getattr(engine, "params", {})
+    return engine.name + "".join(f";{key}={value}" for key, value in sorted(params.items()))
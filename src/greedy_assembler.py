@@ -1,18 +1,32 @@
-from overlap_graph import OverlapGraph
+import heapq
+import logging
+from overlap_graph import IncrementalMerge, OverlapGraph
 from overlap import Overlap
-from fragment import Fragment
+from fragment import Fragment, MergedFragment
+from progress import ProgressReporter
+
+logger = logging.getLogger(__name__)
 
 class GreedyAssembler:
     """
     Führt eine Greedy-Assembly durch, indem jeweils das Fragmentpaar mit dem größten Overlap 
     zusammengeführt wird. Verwendet dafür den OverlapGraph.
+
+    Modi:
+        "naive": Sucht in jedem Schritt die beste Kante im Graphen und aktualisiert den Graphen.
+        "heap": Hält die Kandidatenkanten in einer Prioritätswarteschlange und verwirft Kanten
+                zu bereits verbrauchten Fragmenten erst beim Entnehmen (lazy invalidation).
     """
+    MODES = ("naive", "heap")
 
-    def __init__(self, graph: OverlapGraph):
+    def __init__(self, graph: OverlapGraph, mode: str = "naive"):
         """
         Initialisiert den Assembler mit einem OverlapGraph.
         """
+        if mode not in self.MODES:
+            raise ValueError(f"Unbekannter Assembly-Modus '{mode}'. Verfügbar: {', '.join(self.MODES)}")
         self.graph = graph
+        self.mode = mode
 
     def assemble(self) -> Fragment:
         """
@@ -22,20 +36,57 @@ class GreedyAssembler:
         Rückgabe:
             Fragment: Das final zusammengesetzte Fragment
         """
-        while len(self.graph.fragments) > 1:
-            best_edge = self._find_best_overlap()
-
+        contigs = self.assemble_contigs()
+        if len(contigs) > 1:
             # Falls keine Kanten mehr vorhanden sind, aber noch mehrere Fragmente existieren
+            raise ValueError(f"Keine weiteren Overlaps vorhanden – Sequenz kann nicht vollständig rekonstruiert werden.\n" \
+            "Verbleibende Fragmente:" \
+            f"{contigs}")
+        return contigs[0]  # Das letzte übrig gebliebene Fragment
+
+    def assemble_contigs(self) -> list[Fragment]:
+        """
+        Führt die Greedy-Assembly durch, bis keine Overlaps mehr vorhanden sind.
+
+        Anders als assemble() bricht die Methode bei Abdeckungslücken nicht ab, sondern gibt
+        alle verbleibenden Contigs zurück (bei lückenloser Abdeckung genau einen).
+
+        Rückgabe:
+            list[Fragment]: Die Contigs in der Reihenfolge der verbleibenden Knoten
+        """
+        if self.mode == "heap":
+            return self._assemble_heap()
+
+        progress = ProgressReporter(logger, "GreedyAssembler: Merges", len(self.graph) - 1)
+        while len(self.graph) > 1:
+            best_edge = self._find_best_overlap()
             if best_edge is None:
-                raise ValueError(f"Keine weiteren Overlaps vorhanden – Sequenz kann nicht vollständig rekonstruiert werden.\n" \
-                "Verbleibende Fragmente:" \
-                f"{self.graph.fragments}")
+                break
 
             # Führe das beste Fragmentpaar (mit größtem Overlap) zusammen
             merged = self.graph.merge_and_replace(
                 best_edge.source, best_edge.target, best_edge.length
             )
-        return self.graph.fragments[0]  # Das letzte übrig gebliebene Fragment
+            progress.update()
+        progress.finish()
+        return self.graph.fragments
+
+    @staticmethod
+    def contig_stats(contigs: list[Fragment]) -> dict:
+        """
+        Kennzahlen einer Assembly: Anzahl, Gesamtlänge, längster Contig und N50
+        (Länge, ab der die Contigs dieser Länge und länger mindestens die Hälfte der Gesamtlänge abdecken).
+        """
+        lengths = sorted((len(contig) for contig in contigs), reverse=True)
+        total = sum(lengths)
+        n50 = 0
+        covered = 0
+        for length in lengths:
+            covered += length
+            if 2 * covered >= total:
+                n50 = length
+                break
+        return {"count": len(lengths), "total_length": total, "longest": lengths[0] if lengths else 0, "n50": n50}
 
     def _find_best_overlap(self) -> Overlap | None:
         """
@@ -46,5 +97,135 @@ class GreedyAssembler:
         """
         if not self.graph.edges:
             return None
-        # Wähle die Kante mit der größten Overlap-Länge
-        return max(self.graph.edges, key=lambda e: e.length, default=None)
+        # Wähle die Kante mit der größten Overlap-Länge, bei Gleichstand die mit der höheren Identität
+        return max(self.graph.edges, key=lambda e: (e.length, e.identity), default=None)
+
+    def _assemble_heap(self) -> list[Fragment]:
+        """
+        Inkrementelle Greedy-Assembly mit Prioritätswarteschlange.
+
+        Die Kanten liegen als (-Länge, -Identität, Erzeugungsnummer, Quelle, Ziel) im Heap. Die Erzeugungsnummer
+        entspricht der Position in der Kantenliste des naiven Modus, sodass bei gleicher Länge
+        dieselbe Kante gewählt wird und das Ergebnis identisch ist. Zusammengeführte Contigs werden
+        als MergedFragment (Kopf aus der Quelle, Schwanz aus dem Ziel) geführt, ihre Sequenz wird
+        erst bei der Ausgabe zusammengesetzt. Der Graph selbst bleibt dabei unverändert.
+
+        Bei exakten Engines ohne top_k erbt ein Contig wie in OverlapGraph._replace_merged die
+        eingehenden Overlaps der Quelle und die ausgehenden des Ziels. Betrachtet werden nur die
+        bisherigen Nachbarn von Quelle und Ziel; neu gerechnet wird nur gegen längere Nachbarn, und
+        zwar über Kopf- bzw. Schwanzfenster von höchstens einer Read-Länge, bei zwei langen Contigs
+        zusätzlich nach Repeat-Overlaps ab einer Read-Länge (siehe IncrementalMerge). Ein Merge
+        kostet damit im Regelfall O(Grad · (Read-Länge + log n)) statt O(n).
+
+        Rückgabe:
+            list[Fragment]: Die verbleibenden Contigs
+        """
+        fragments = self.graph.fragments
+        node_of = {fragment: node for node, fragment in enumerate(fragments)}
+        engine = self.graph.engine
+        min_overlap, top_k = self.graph.min_overlap, self.graph.top_k
+
+        # Lebende Knoten in derselben Reihenfolge wie die Fragmentliste des naiven Modus
+        contigs: dict[int, Fragment] = dict(enumerate(fragments))
+
+        heap = [(-edge.length, -edge.identity, order, node_of[edge.source], node_of[edge.target])
+                for order, edge in enumerate(self.graph.edges)]
+
+        # Overlaps pro Knoten (Ziel bzw. Quelle -> (Länge, Identität)), damit Contigs sie erben können
+        incremental = engine.exact and top_k is None
+        merger = IncrementalMerge(engine, min_overlap, self.graph.read_length)
+        out_overlaps: dict[int, dict[int, tuple]] = {node: {} for node in contigs}
+        in_overlaps: dict[int, dict[int, tuple]] = {node: {} for node in contigs}
+        if incremental:
+            for neg_length, neg_identity, _, source, target in heap:
+                out_overlaps[source][target] = in_overlaps[target][source] = (-neg_length, -neg_identity)
+        heapq.heapify(heap)
+        next_order = len(heap)
+        next_node = len(fragments)
+        progress = ProgressReporter(logger, "GreedyAssembler: Merges", len(contigs) - 1)
+
+        while len(contigs) > 1:
+            # Kanten zu bereits verbrauchten Fragmenten verwerfen
+            while heap and (heap[0][3] not in contigs or heap[0][4] not in contigs):
+                heapq.heappop(heap)
+
+            if not heap:
+                break
+
+            neg_length, _, _, source, target = heapq.heappop(heap)
+            source_fragment, target_fragment = contigs.pop(source), contigs.pop(target)
+            merged = MergedFragment(f"MERGED_{OverlapGraph._merge_counter}", source_fragment, target_fragment,
+                                    -neg_length)
+            OverlapGraph._merge_counter += 1
+            if incremental:
+                outgoing, incoming = self._inherit_overlaps(merger, merged, source_fragment, target_fragment,
+                                                            -neg_length, source, target, contigs,
+                                                            out_overlaps, in_overlaps)
+            else:
+                # Nicht exakte Engines bzw. top_k: wie OverlapGraph.add_fragment gegen alle Knoten rechnen
+                for node in (source, target):
+                    del out_overlaps[node], in_overlaps[node]
+                others = list(contigs.items())
+                merged_seq = merged.sequence
+                scores_out = [engine.sequence_overlap(merged_seq, other.sequence, min_overlap) for _, other in others]
+                scores_in = [engine.sequence_overlap(other.sequence, merged_seq, min_overlap) for _, other in others]
+                outgoing = {others[index][0]: scores_out[index]
+                            for index in OverlapGraph._strongest_indices(scores_out, top_k)}
+                incoming = {others[index][0]: scores_in[index]
+                            for index in OverlapGraph._strongest_indices(scores_in, top_k)}
+
+            out_overlaps[next_node], in_overlaps[next_node] = {}, {}
+            # Kanten in Knotenreihenfolge eintragen, wie add_fragment() im naiven Modus
+            for node in sorted(outgoing.keys() | incoming.keys()):
+                if node in outgoing:
+                    len1, identity1 = outgoing[node]
+                    heapq.heappush(heap, (-len1, -identity1, next_order, next_node, node))
+                    next_order += 1
+                    if incremental:
+                        out_overlaps[next_node][node] = in_overlaps[node][next_node] = outgoing[node]
+                if node in incoming:
+                    len2, identity2 = incoming[node]
+                    heapq.heappush(heap, (-len2, -identity2, next_order, node, next_node))
+                    next_order += 1
+                    if incremental:
+                        in_overlaps[next_node][node] = out_overlaps[node][next_node] = incoming[node]
+
+            contigs[next_node] = merged
+            next_node += 1
+            progress.update()
+
+        progress.finish()
+
+        return list(contigs.values())
+
+    @staticmethod
+    def _inherit_overlaps(merger: IncrementalMerge, merged: MergedFragment, source_fragment: Fragment,
+                          target_fragment: Fragment, overlap_len: int, source: int, target: int,
+                          contigs: dict[int, Fragment], out_overlaps: dict[int, dict[int, tuple]],
+                          in_overlaps: dict[int, dict[int, tuple]]) -> tuple[dict, dict]:
+        """
+        Overlaps des neuen Contigs zu den bisherigen Nachbarn von Quelle und Ziel (IncrementalMerge).
+
+        Entfernt Quelle und Ziel aus den Overlap-Tabellen (auch bei ihren Nachbarn). Knoten ohne
+        Kante zu Quelle oder Ziel werden nicht betrachtet; der Aufwand ist O(Grad) statt O(n).
+
+        Rückgabe:
+            ({Ziel: (Länge, Identität)}, {Quelle: (Länge, Identität)}) nur mit positiven Overlaps
+        """
+        inherited_in, source_out = in_overlaps.pop(source), out_overlaps.pop(source)
+        target_in, inherited_out = in_overlaps.pop(target), out_overlaps.pop(target)
+        for node in inherited_in.keys() | target_in.keys():
+            if node in contigs:
+                out_overlaps[node].pop(source, None)
+                out_overlaps[node].pop(target, None)
+        for node in source_out.keys() | inherited_out.keys():
+            if node in contigs:
+                in_overlaps[node].pop(source, None)
+                in_overlaps[node].pop(target, None)
+
+        successors = [(node, contigs[node]) for node in sorted(source_out.keys() | inherited_out.keys())
+                      if node in contigs]
+        predecessors = [(node, contigs[node]) for node in sorted(inherited_in.keys() | target_in.keys())
+                        if node in contigs]
+        return merger.overlaps(merged, source_fragment, target_fragment, overlap_len, inherited_in, inherited_out,
+                               successors, predecessors)
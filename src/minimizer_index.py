@@ -0,0 +1,89 @@
+from collections import deque
+
+_CODES = str.maketrans("ACGTacgt", "01230123")
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def kmer_hashes(sequence: str, k: int) -> list[int]:
+    """
+    Berechnet für jede Position den Hash des dort beginnenden k-mers.
+
+    Die k-mere werden rollierend mit 2 Bit pro Base kodiert und anschließend mit einer
+    multiplikativen Hashfunktion gestreut, damit die Minimizer nicht lexikographisch
+    (z. B. bevorzugt "AAAA...") ausfallen. Der Hash ist deterministisch.
+    """
+    if len(sequence) < k:
+        return []
+    mask = (1 << (2 * k)) - 1
+    hash_mask = (1 << 64) - 1
+    digits = sequence.translate(_CODES)
+    value = int(digits[:k - 1], 4) if k > 1 else 0
+    hashes = []
+    for position in range(k - 1, len(digits)):
+        value = ((value << 2) | (ord(digits[position]) - 48)) & mask
+        hashes.append((value * _HASH_MULTIPLIER) & hash_mask)
+    return hashes
+
+
+def minimizers(sequence: str, k: int, w: int) -> set[int]:
+    """
+    Liefert die Minimizer aller Fenster aus w aufeinanderfolgenden k-meren.
+
+    Der Minimizer eines Fensters ist der kleinste k-mer-Hash darin; da er nur vom Inhalt
+    des Fensters abhängt, haben gleiche Teilstrings stets dieselben Minimizer.
+    """
+    return {value for _, value in minimizer_positions(sequence, k, w)}
+
+
+def minimizer_positions(sequence: str, k: int, w: int) -> list[tuple[int, int]]:
+    """
+    Wie minimizers(), liefert aber (Position, Hash) für jeden ausgewählten k-mer, aufsteigend nach Position.
+    """
+    hashes = kmer_hashes(sequence, k)
+    if len(hashes) < w:
+        return []
+
+    result = []
+    window: deque[int] = deque()  # Positionen mit aufsteigenden Hashes (gleitendes Minimum)
+    for position, value in enumerate(hashes):
+        while window and hashes[window[-1]] > value:
+            window.pop()
+        window.append(position)
+        if window[0] <= position - w:
+            window.popleft()
+        if position >= w - 1 and (not result or result[-1][0] != window[0]):
+            result.append((window[0], hashes[window[0]]))
+    return result
+
+
+class MinimizerIndex:
+    """
+    Hash-Tabelle von Präfix-Minimizern auf Fragmentindizes zur Vorauswahl von Overlap-Kandidaten.
+
+    Für jedes Ziel b werden die Minimizer seines Präfixes der Länge `min_overlap` indiziert.
+    Für eine Quelle a werden die Minimizer ihres Suffixes (höchstens so lang wie das längste
+    Fragment) nachgeschlagen. Jeder exakte Overlap mit Länge >= min_overlap enthält das ganze
+    Präfixfenster von b und teilt daher mindestens einen Minimizer – es gehen keine Overlaps
+    verloren, solange w + k - 1 <= min_overlap gilt.
+    """
+
+    def __init__(self, sequences: list[str], k: int, w: int, min_overlap: int):
+        if k < 1 or w < 1:
+            raise ValueError("k und die Fenstergröße müssen mindestens 1 sein.")
+        if w + k - 1 > min_overlap:
+            raise ValueError("Die Mindestüberlappung muss mindestens w + k - 1 betragen.")
+        self.k = k
+        self.w = w
+        self.min_overlap = min_overlap
+        self._max_length = max((len(seq) for seq in sequences), default=0)
+        self._table: dict[int, list[int]] = {}
+        for index, sequence in enumerate(sequences):
+            for value in minimizers(sequence[:min_overlap], k, w):
+                self._table.setdefault(value, []).append(index)
+
+    def candidates(self, sequence: str) -> set[int]:
+        """Alle Ziele, deren Präfix einen Minimizer mit dem Suffix der Sequenz teilt."""
+        found: set[int] = set()
+        for value in minimizers(sequence[-self._max_length:], self.k, self.w):
+            found.update(self._table.get(value, ()))
+        return found
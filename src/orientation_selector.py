@@ -1,23 +1,50 @@
+import logging
 from fragment import Fragment
+from sequence_codec import reverse_complement
+from overlap_engine import NaiveOverlapEngine, get_engine, identity_classes
+from parallel_overlap import ParallelOverlapEngine
+from progress import ProgressReporter
+
+logger = logging.getLogger(__name__)
 
 class OrientationSelector:
     """
     Diese Klasse implementiert zwei Varianten zur Wahl der Orientierung (Original oder Reverse Complement)
     für eine Liste von DNA-Fragmenten, basierend auf der Stärke ihrer Overlaps.
+
+    Alle paarweisen Overlaps zwischen Fragmenten und Reverse Complements (f→g, f→rc(g), rc(f)→g,
+    rc(f)→rc(g)) werden einmalig über eine Overlap-Engine berechnet. Die Scores werden danach
+    inkrementell fortgeschrieben, sobald ein Fragment zur orientierten Liste hinzukommt.
+
+    Die dritte Variante (select_orientation_kmer) kommt ohne Overlap-Tabelle aus und verbindet
+    Fragmente nur über gemeinsame kanonische k-mere.
     """
+    METHODS = ("local", "global", "kmer")
+    KMER_LENGTH = 11  # Standardlänge der k-mere für select_orientation_kmer
 
-    def __init__(self, fragments: list[Fragment]):
+    def __init__(self, fragments: list[Fragment], engine: "str | NaiveOverlapEngine" = "suffix_array",
+                 workers: int = 1):
         # Ursprüngliche Liste der ungeordneten und nicht-orientierten Fragmente
         self.initial_fragments = fragments
+        self._engine = get_engine(engine)
+        if workers > 1:
+            self._engine = ParallelOverlapEngine(self._engine, workers)
+
+        # Overlap-Tabelle über die Knoten 2*i (Fragment i) und 2*i+1 (Reverse Complement von i)
+        self._nodes: list[Fragment] | None = None
+        self._out: list[dict[int, int]] = []
+        self._in: list[dict[int, int]] = []
+        self._same_object: dict[int, list[int]] = {}
 
     def _get_overlap(self, a: Fragment, b: Fragment, min_length: int = 1) -> int:
         """
         Berechnet die maximale Overlap-Länge zwischen dem Suffix von a und dem Präfix von b.
         Gibt 0 zurück, wenn kein Overlap vorhanden ist.
         """
-        max_len = min(len(a.sequence), len(b.sequence))
+        seq_a, seq_b = a.sequence, b.sequence  # gepackte Sequenzen nur einmal entpacken
+        max_len = min(len(seq_a), len(seq_b))
         for i in range(max_len, min_length - 1, -1):
-            if a.sequence[-i:] == b.sequence[:i]:
+            if seq_a[-i:] == seq_b[:i]:
                 return i
         return 0
 
@@ -25,38 +52,87 @@ class OrientationSelector:
         """
         Berechnet die gesamte Overlap-Summe eines Fragments zu allen Fragmenten in der Referenzliste.
         Dabei wird sowohl der Overlap von fragment - ref als auch ref - fragment berücksichtigt.
+
+        Referenzimplementierung; die Auswahlverfahren nutzen die vorberechnete Overlap-Tabelle.
         """
         return sum(
             self._get_overlap(fragment, ref) + self._get_overlap(ref, fragment)
             for ref in reference_list
         )
 
+    def _build_overlap_table(self):
+        """
+        Berechnet einmalig die Reverse Complements und alle Overlaps zwischen den 2n Knoten.
+        """
+        if self._nodes is not None:
+            return
+        nodes = []
+        for fragment, rc in zip(self.initial_fragments, Fragment.reverse_complement_all(self.initial_fragments)):
+            nodes.append(fragment)
+            nodes.append(rc)
+
+        self._out = [{} for _ in nodes]
+        self._in = [{} for _ in nodes]
+        for a, b, length, *_ in self._engine.iter_overlaps(nodes, proper=False):
+            self._out[a][b] = length
+            self._in[b][a] = length
+
+        # Ein Objekt überlappt mit sich selbst vollständig (die Engine liefert diese Paare nicht)
+        self._same_object = {}
+        for node, cls in enumerate(identity_classes(nodes)):
+            self._same_object.setdefault(cls, []).append(node)
+        self._same_object = {node: members for members in self._same_object.values() for node in members}
+        self._nodes = nodes
+
+    def _add_scores(self, scores: list[int], node: int):
+        """
+        Addiert zu jedem Knoten x den Beitrag overlap(x, node) + overlap(node, x) – in O(Grad).
+        """
+        for other, length in self._out[node].items():
+            scores[other] += length
+        for other, length in self._in[node].items():
+            scores[other] += length
+        full = 2 * len(self._nodes[node])
+        for other in self._same_object[node]:
+            scores[other] += full
+
     def select_orientation_local(self) -> list[Fragment]:
         """
         Lokaler Greedy-Ansatz:
         Iteriert durch die ursprüngliche Reihenfolge der Fragmente und entscheidet für jedes Fragment
         lokal, ob Original oder Reverse Complement besser zu den bereits orientierten Fragmenten passt.
         """
-        print("[OrientationSelector] Starte lokale Orientierungswahl...")
+        logger.info("[OrientationSelector] Starte lokale Orientierungswahl...")
+        self._build_overlap_table()
         oriented = []
+        scores = [0] * len(self._nodes)  # Score jedes Knotens zu den bisher orientierten Fragmenten
+        debug = logger.isEnabledFor(logging.DEBUG)
+        progress = ProgressReporter(logger, "OrientationSelector", len(self.initial_fragments))
 
         for idx, fragment in enumerate(self.initial_fragments):
-            rc = fragment.reverse_complement()
-            score_f = self._total_overlap_score(fragment, oriented)
-            score_rc = self._total_overlap_score(rc, oriented)
+            rc = self._nodes[2 * idx + 1]
+            score_f = scores[2 * idx]
+            score_rc = scores[2 * idx + 1]
 
-            print(f"\n[{idx}] Fragment {fragment.id}")
-            print(f"    Original: {fragment.sequence[:20]}... - Score: {score_f}")
-            print(f"    Rev. Complement: {rc.sequence[:20]}... - Score: {score_rc}")
+            if debug:
+                logger.debug(f"\n[{idx}] Fragment {fragment.id}")
+                logger.debug(f"    Original: {fragment.sequence[:20]}... - Score: {score_f}")
+                logger.debug(f"    Rev. Complement: {rc.sequence[:20]}... - Score: {score_rc}")
 
             # Wähle die Orientierung mit dem besseren Score
             if score_rc > score_f:
-                print(f"    Entscheidung: Reverse Complement wird gewählt.")
+                if debug:
+                    logger.debug(f"    Entscheidung: Reverse Complement wird gewählt.")
                 oriented.append(rc)
+                self._add_scores(scores, 2 * idx + 1)
             else:
-                print(f"    Entscheidung: Originalfragment wird gewählt.")
+                if debug:
+                    logger.debug(f"    Entscheidung: Originalfragment wird gewählt.")
                 oriented.append(fragment)
-        print("[OrientationSelector] Lokale Orientierungsauswahl abgeschlossen.")
+                self._add_scores(scores, 2 * idx)
+            progress.update()
+        progress.finish()
+        logger.info("[OrientationSelector] Lokale Orientierungsauswahl abgeschlossen.")
         return oriented
 
     def select_orientation_global(self) -> list[Fragment]:
@@ -66,58 +142,174 @@ class OrientationSelector:
         Fügt danach iterativ das beste nächste Fragment hinzu, das den höchsten Overlap zu allen
         bereits orientierten Fragmenten besitzt (inkl. Richtungswahl).
         """
-        print("[OrientationSelector] Starte globale Orientierungswahl... \n")
-        fragments = self.initial_fragments[:]
+        logger.info("[OrientationSelector] Starte globale Orientierungswahl...")
+        self._build_overlap_table()
+        fragments = self.initial_fragments
+        remaining = list(range(len(fragments)))
         oriented = []
+        used_nodes: set[int] = set()
+
+        # Startscores: Overlap jedes Knotens zu allen Originalfragmenten
+        start_scores = [0] * len(self._nodes)
+        for idx in remaining:
+            self._add_scores(start_scores, 2 * idx)
 
-        best_fragment = None
+        best_node = None
         best_score = -1
 
         # Suche Startfragment mit höchstem Gesamtscore zu allen anderen Fragmenten
-        print("[OrientationSelector] Suche bestes Startfragment")
-        for fragment in fragments:
-            rc = fragment.reverse_complement()
-            score_f = self._total_overlap_score(fragment, fragments)
-            score_rc = self._total_overlap_score(rc, fragments)
+        logger.debug("[OrientationSelector] Suche bestes Startfragment")
+        for idx in remaining:
+            score_f = start_scores[2 * idx]
+            score_rc = start_scores[2 * idx + 1]
 
             if score_f > best_score:
                 best_score = score_f
-                best_fragment = fragment
+                best_node = 2 * idx
             if score_rc > best_score:
                 best_score = score_rc
-                best_fragment = rc
+                best_node = 2 * idx + 1
 
-        print(f"    Startfragment gewählt: {best_fragment.id} (Score: {best_score})")
+        best_fragment = self._take_node(best_node, used_nodes)
+        logger.info(f"    Startfragment gewählt: {best_fragment.id} (Score: {best_score})")
         oriented.append(best_fragment)
+        scores = [0] * len(self._nodes)  # Score jedes Knotens zu den bisher orientierten Fragmenten
+        self._add_scores(scores, best_node)
 
         # Entferne Original (egal ob f oder cf) aus Liste der verbleibenden
-        fragments = [f for f in fragments if f.id != best_fragment.id.replace("_cf", "")]
+        remaining = [idx for idx in remaining if fragments[idx].id != best_fragment.id.replace("_cf", "")]
 
         step = 2
-        while fragments:
-            best_next = None
+        debug = logger.isEnabledFor(logging.DEBUG)
+        progress = ProgressReporter(logger, "OrientationSelector", len(remaining))
+        while remaining:
+            best_node = None
             best_score = -1
             best_id = None
-            print(f"[OrientationSelector] [{step}] Auswahl nächstes bestes Fragment:")
+            if debug:
+                logger.debug(f"[OrientationSelector] [{step}] Auswahl nächstes bestes Fragment:")
 
-            for fragment in fragments:
-                rc = fragment.reverse_complement()
-                score_f = self._total_overlap_score(fragment, oriented)
-                score_rc = self._total_overlap_score(rc, oriented)
+            for idx in remaining:
+                score_f = scores[2 * idx]
+                score_rc = scores[2 * idx + 1]
 
                 if score_f > best_score:
-                    best_next = fragment
+                    best_node = 2 * idx
                     best_score = score_f
-                    best_id = fragment.id
+                    best_id = fragments[idx].id
                 if score_rc > best_score:
-                    best_next = rc
+                    best_node = 2 * idx + 1
                     best_score = score_rc
-                    best_id = fragment.id
+                    best_id = fragments[idx].id
 
-            print(f"    Hinzugefügt: {best_next.id} (Score: {best_score})")
+            best_next = self._take_node(best_node, used_nodes)
+            if debug:
+                logger.debug(f"    Hinzugefügt: {best_next.id} (Score: {best_score})")
             oriented.append(best_next)
-            fragments = [f for f in fragments if f.id != best_id]
+            self._add_scores(scores, best_node)
+            remaining = [idx for idx in remaining if fragments[idx].id != best_id]
             step += 1
+            progress.update()
 
-        print("[OrientationSelector] Globale Orientierungsauswahl abgeschlossen.")
+        progress.finish()
+        logger.info("[OrientationSelector] Globale Orientierungsauswahl abgeschlossen.")
         return oriented
+
+    def select_orientation_kmer(self, k: int | None = None) -> list[Fragment]:
+        """
+        Orientierung über kanonische k-mere und Union-Find mit Parität:
+        Jedes k-mer wird durch die kleinere Form aus k-mer und Reverse Complement vertreten; ein
+        Strang-Bit merkt sich, welche der beiden im Fragment vorkommt. Teilen zwei Fragmente ein
+        kanonisches k-mer, liegen sie bei gleichem Strang-Bit auf demselben, sonst auf dem
+        Gegenstrang. Die Belege werden pro Fragmentpaar gezählt und in absteigender Stärke in einen
+        Union-Find mit Parität (relative Orientierung zur Wurzel) eingefügt; widersprüchliche,
+        schwächere Belege (z. B. aus Repeats) werden verworfen. Innerhalb jeder Zusammenhangskomponente
+        bleibt die Mehrheit der Fragmente in ihrer ursprünglichen Orientierung.
+
+        Der Aufwand ist O(Gesamtzahl der k-mere) plus das Sortieren der Fragmentpaare.
+        Palindromische k-mere (gleich ihrem Reverse Complement) tragen keine Information und werden
+        übersprungen.
+        """
+        logger.info("[OrientationSelector] Starte k-mer-basierte Orientierungswahl...")
+        k = k or OrientationSelector.KMER_LENGTH
+        fragments = self.initial_fragments
+        first: dict[str, tuple[int, bool]] = {}  # kanonisches k-mer -> (erstes Fragment, Strang-Bit)
+        votes: dict[tuple[int, int], list[int]] = {}  # Fragmentpaar -> [gleicher Strang, Gegenstrang]
+        for idx, fragment in enumerate(fragments):
+            seq = fragment.sequence
+            rc_seq = reverse_complement(seq)
+            length = len(seq)
+            seen = set()
+            for p in range(length - k + 1):
+                kmer = seq[p:p + k]
+                rc_kmer = rc_seq[length - p - k:length - p]
+                if kmer == rc_kmer:
+                    continue
+                reverse = rc_kmer < kmer
+                canonical = rc_kmer if reverse else kmer
+                other, other_reverse = first.setdefault(canonical, (idx, reverse))
+                if other != idx and canonical not in seen:
+                    votes.setdefault((other, idx), [0, 0])[reverse != other_reverse] += 1
+                seen.add(canonical)
+
+        # Union-Find mit Parität: parity[x] = Orientierung von x relativ zu parent[x]
+        parent = list(range(len(fragments)))
+        parity = [0] * len(fragments)
+
+        def find(x: int) -> tuple[int, int]:
+            path = []
+            while parent[x] != x:
+                path.append(x)
+                x = parent[x]
+            # Pfadkompression: Parität zur Wurzel von hinten nach vorn aufsummieren
+            total = 0
+            for node in reversed(path):
+                total ^= parity[node]
+                parity[node] = total
+                parent[node] = x
+            return x, parity[path[0]] if path else 0
+
+        conflicts = 0
+        for (a, b), (same, opposite) in sorted(votes.items(), key=lambda item: -max(item[1])):
+            relation = int(opposite > same)
+            root_a, parity_a = find(a)
+            root_b, parity_b = find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+                parity[root_b] = parity_a ^ parity_b ^ relation
+            elif parity_a ^ parity_b != relation:
+                conflicts += 1
+
+        flips = [find(idx)[1] for idx in range(len(fragments))]
+        component_votes: dict[int, int] = {}
+        for idx, flip in enumerate(flips):
+            root = find(idx)[0]
+            component_votes[root] = component_votes.get(root, 0) + (1 if flip else -1)
+
+        oriented = []
+        for idx, fragment in enumerate(fragments):
+            # Dreht die Mehrheit der Komponente, wird stattdessen die Wurzel gedreht
+            if flips[idx] ^ (component_votes[find(idx)[0]] > 0):
+                oriented.append(fragment.reverse_complement())
+            else:
+                oriented.append(fragment)
+        logger.info(f"[OrientationSelector] k-mer-Orientierung abgeschlossen: {len(component_votes)} "
+                    f"Komponenten, {conflicts} widersprüchliche Fragmentpaare verworfen.")
+        return oriented
+
+    def select_orientation(self, method: str = "local") -> list[Fragment]:
+        """Ruft das Orientierungsverfahren `method` ("local" (Standard), "global" oder "kmer") auf."""
+        if method not in OrientationSelector.METHODS:
+            raise ValueError(f"Unbekannte Orientierungsmethode: {method}")
+        return getattr(self, f"select_orientation_{method}")()
+
+    def _take_node(self, node: int, used_nodes: set[int]) -> Fragment:
+        """
+        Liefert das Fragment eines Knotens für die Ergebnisliste. Wird ein Reverse Complement
+        mehrfach gewählt, erhält jede Verwendung ein eigenes Objekt.
+        """
+        fragment = self._nodes[node]
+        if node % 2 == 1 and node in used_nodes:
+            fragment = self.initial_fragments[node // 2].reverse_complement()
+        used_nodes.add(node)
+        return fragment
@@ -9,14 +9,19 @@ class Overlap:
         source (Fragment): Das Ausgangsfragment (Start der Kante)
         target (Fragment): Das Ziel-Fragment (Ende der Kante)
         length (int): Die Länge der Überlappung
+        identity (float): Anteil übereinstimmender Basen (1.0 bei exakten Overlaps)
     """
+    __slots__ = ("_source", "_target", "_length", "_identity")
 
-    def __init__(self, source: Fragment, target: Fragment, length: int):
+    def __init__(self, source: Fragment, target: Fragment, length: int, identity: float = 1.0):
         if length <= 0:
             raise ValueError("Overlap-Länge muss positiv sein.")
+        if not 0 < identity <= 1:
+            raise ValueError("Die Identität muss im Bereich (0, 1] liegen.")
         self._source = source
         self._target = target
         self._length = length
+        self._identity = identity
 
     @property
     def source(self) -> Fragment:
@@ -29,6 +34,10 @@ class Overlap:
     @property
     def length(self) -> int:
         return self._length
+
+    @property
+    def identity(self) -> float:
+        return self._identity
     
     def __str__(self) -> str:
         return f"{self.source.id} → {self.target.id} (Overlap: {self.length})"
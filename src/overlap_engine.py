@@ -0,0 +1,594 @@
+import logging
+from bisect import bisect_left
+from typing import Iterable, Iterator, List
+from fragment import Fragment
+from banded_alignment import banded_overlap
+from fm_index import FMIndex
+from minimizer_index import MinimizerIndex, minimizer_positions
+from packed_sequence import PackedSequence, packed_overlap
+from rolling_hash import prefix_hashes, rolling_overlap, suffix_hashes
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional und wird nur für die Engine "numpy" benötigt
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+def suffix_prefix_overlap(seq_a: str, seq_b: str, min_length: int = 1, proper: bool = True) -> int:
+    """
+    Berechnet die Länge des längsten Suffixes von seq_a, der mit dem Präfix von seq_b übereinstimmt.
+
+    Parameter:
+        seq_a (str): Sequenz, deren Suffix betrachtet wird.
+        seq_b (str): Sequenz, deren Präfix betrachtet wird.
+        min_length (int): Kürzeste Overlap-Länge, die noch berücksichtigt wird.
+        proper (bool): Wenn True, muss der Overlap echt kürzer als beide Sequenzen sein.
+
+    Rückgabe:
+        int: Die Overlap-Länge oder 0, falls kein Overlap vorhanden ist.
+    """
+    max_len = min(len(seq_a), len(seq_b)) - (1 if proper else 0)
+    for l in range(max_len, min_length - 1, -1):
+        if seq_a[-l:] == seq_b[:l]:
+            return l
+    return 0
+
+
+def identity_classes(fragments: List[Fragment]) -> List[int]:
+    """
+    Ordnet jedem Listeneintrag den Index des ersten Vorkommens desselben Fragment-Objekts zu.
+    Paare eines Objekts mit sich selbst erhalten so keine Kante.
+    """
+    first: dict[int, int] = {}
+    return [first.setdefault(id(fragment), i) for i, fragment in enumerate(fragments)]
+
+
+class NaiveOverlapEngine:
+    """
+    Referenzimplementierung: vergleicht jedes Fragmentpaar einzeln (O(n² · L²)).
+
+    Dient als Vergleichsbasis, gegen die schnellere Engines Kante für Kante geprüft werden.
+    """
+    name = "naive"
+    exact = True  # Alle Overlaps sind exakt (Identität 1.0)
+
+    def overlap(self, a: Fragment, b: Fragment, min_length: int = 1, proper: bool = True) -> int:
+        """Berechnet den längsten Overlap von a nach b."""
+        return suffix_prefix_overlap(a.sequence, b.sequence, min_length, proper)
+
+    def sequence_overlap(self, seq_a: str, seq_b: str, min_length: int = 1,
+                         proper: bool = True) -> tuple[int, float]:
+        """
+        Berechnet den Overlap zweier Sequenzen samt Identität (bei exakten Engines immer 1.0).
+        Wird für Contigs verwendet, die nur als Sequenz vorliegen.
+        """
+        return suffix_prefix_overlap(seq_a, seq_b, min_length, proper), 1.0
+
+    def scored_overlap(self, a: Fragment, b: Fragment, min_length: int = 1,
+                       proper: bool = True) -> tuple[int, float]:
+        """Berechnet den längsten Overlap von a nach b samt Identität."""
+        return self.overlap(a, b, min_length, proper), 1.0
+
+    def iter_overlaps(self, fragments: List[Fragment], min_length: int = 1,
+                      proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Liefert für alle geordneten Fragmentpaare den längsten Overlap.
+
+        Rückgabe:
+            Iterator über Tupel (Index Quelle, Index Ziel, Overlap-Länge), sortiert nach (Quelle, Ziel).
+            Nicht exakte Engines liefern als viertes Element die Identität des Overlaps.
+        """
+        sequences = [f.sequence for f in fragments]
+        index = self.prepare(sequences)
+        yield from self.iter_rows(sequences, index, range(len(sequences)),
+                                  identity_classes(fragments), min_length, proper)
+
+    def prepare(self, sequences: List[str]) -> object:
+        """
+        Baut einmalig den Suchindex über alle Sequenzen auf (bei der naiven Engine keiner).
+        """
+        return None
+
+    def iter_rows(self, sequences: List[str], index: object, rows: Iterable[int], classes: List[int],
+                  min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Berechnet die Overlaps für die angegebenen Quellzeilen gegen alle Sequenzen.
+
+        Parameter:
+            sequences (List[str]): Alle Sequenzen.
+            index (object): Ergebnis von prepare().
+            rows (Iterable[int]): Indizes der Quellsequenzen, aufsteigend.
+            classes (List[int]): Paare mit gleicher Klasse (dasselbe Fragment-Objekt) werden übersprungen.
+        """
+        for i in rows:
+            seq_a = sequences[i]
+            for j, seq_b in enumerate(sequences):
+                if classes[i] != classes[j]:
+                    length = suffix_prefix_overlap(seq_a, seq_b, min_length, proper)
+                    if length > 0:
+                        yield i, j, length
+
+
+class SuffixArrayOverlapEngine(NaiveOverlapEngine):
+    """
+    Findet Suffix-Präfix-Overlaps über ein Suffix-Array aller Fragmente (als FM-Index, siehe fm_index).
+
+    prepare() verkettet die n Sequenzen (Gesamtlänge N) und sortiert alle N Suffixe per
+    Präfixverdopplung: O(N log N) pro Runde, O(log L) Runden bei Fragmenten der Länge L. Gesucht
+    wird per Rückwärtssuche: Das Suffix eines Quellfragments wird Base für Base von hinten
+    verlängert (O(1) pro Base), und nach jeder Base liefert der Index alle Fragmente, die mit dem
+    bisherigen Suffix beginnen. Die Suche kostet damit O(L) pro Fragment plus die Anzahl der
+    Treffer, insgesamt O(N log N + Treffer) statt O(n² · L²) bei der naiven Engine.
+    """
+    name = "suffix_array"
+
+    def prepare(self, sequences: List[str]) -> FMIndex:
+        """Baut den FM-Index über alle Sequenzen auf."""
+        return FMIndex(sequences)
+
+    def iter_rows(self, sequences: List[str], index: FMIndex, rows: Iterable[int], classes: List[int],
+                  min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Berechnet die Overlaps für die angegebenen Quellzeilen per Rückwärtssuche im FM-Index.
+        """
+        for i in rows:
+            seq_a = sequences[i].encode("ascii")
+            len_a = len(seq_a)
+            best: dict[int, int] = {}
+            lo, hi = 0, len(index)
+
+            # Kürzeste Suffixe zuerst; längere Overlaps überschreiben kürzere zum selben Ziel.
+            # Das Suffix kommt in seinem eigenen Fragment vor, der Bereich wird also nie leer.
+            for l in range(1, len_a + (0 if proper else 1)):
+                lo, hi = index.extend(seq_a[len_a - l], lo, hi)
+                if l < min_length:
+                    continue
+                for j in index.starting_with(lo, hi):
+                    # Bei echten Overlaps darf das Ziel nicht vollständig vom Suffix abgedeckt sein
+                    if classes[j] == classes[i] or (proper and len(sequences[j]) <= l):
+                        continue
+                    best[j] = l
+
+            for j in sorted(best):
+                yield i, j, best[j]
+
+
+class SortedPrefixOverlapEngine(NaiveOverlapEngine):
+    """
+    Findet Suffix-Präfix-Overlaps über eine lexikographisch sortierte Liste der Fragmente.
+
+    Die Liste wird einmal aufgebaut (kein Suffix-Array über alle Positionen der Eingabe wie bei
+    "suffix_array", sondern nur die n ganzen Sequenzen). Für jedes Suffix eines Fragments liefert eine binäre Suche den
+    Bereich der Fragmente, die mit diesem Suffix beginnen. Pro Suffix entstehen dabei ein
+    Teilstring der Länge l und O(log n) Stringvergleiche, die jeweils bis zu O(l) kosten; im
+    schlechtesten Fall sind das O(n · L² · log n) für n Fragmente der Länge L plus die Treffer.
+    Gegenüber dem paarweisen Vergleich (O(n² · L²)) entfällt der Faktor n, und Vergleiche
+    zufälliger Sequenzen enden in der Praxis nach wenigen Zeichen. Da die binäre Suche in C
+    läuft, ist die Engine bei kurzen Reads trotz der schlechteren Schranke schneller als
+    "suffix_array", dessen Rückwärtssuche pro Base in Python läuft.
+    """
+    name = "sorted_prefix"
+
+    def prepare(self, sequences: List[str]) -> tuple[List[int], List[str]]:
+        """
+        Sortiert alle Sequenzen lexikographisch (Reihenfolge der Indizes und sortierte Sequenzen).
+        """
+        order = sorted(range(len(sequences)), key=sequences.__getitem__)
+        return order, [sequences[k] for k in order]
+
+    def iter_rows(self, sequences: List[str], index: tuple[List[int], List[str]], rows: Iterable[int],
+                  classes: List[int], min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Berechnet die Overlaps für die angegebenen Quellzeilen über binäre Suche im sortierten Array.
+        """
+        order, sorted_sequences = index
+
+        for i in rows:
+            seq_a = sequences[i]
+            len_a = len(seq_a)
+            best: dict[int, int] = {}
+
+            # Längste Suffixe zuerst, damit pro Ziel nur der längste Overlap übernommen wird
+            for l in range(len_a - (1 if proper else 0), min_length - 1, -1):
+                suffix = seq_a[len_a - l:]
+                lo = bisect_left(sorted_sequences, suffix)
+                hi = bisect_left(sorted_sequences, suffix + "\U0010ffff", lo)
+                for k in range(lo, hi):
+                    j = order[k]
+                    if j in best or classes[j] == classes[i]:
+                        continue
+                    # Bei echten Overlaps darf das Ziel nicht vollständig vom Suffix abgedeckt sein
+                    if proper and len(sorted_sequences[k]) <= l:
+                        continue
+                    best[j] = l
+
+            for j in sorted(best):
+                yield i, j, best[j]
+
+
+class PackedOverlapEngine(NaiveOverlapEngine):
+    """
+    Vergleicht jedes Fragmentpaar auf den 2-Bit-gepackten Sequenzen (siehe packed_overlap).
+
+    Gepackte Fragmente (Fragment(packed=True), --packed) werden dafür nicht entpackt; aus
+    anderen Fragmenten werden die gepackten Werte einmal pro Graphaufbau erzeugt. Wie die naive
+    Engine prüft sie alle Paare (O(n² · L) Vergleiche), jeder Vergleich läuft aber über
+    Maschinenwörter statt über Teilstrings.
+    """
+    name = "packed"
+
+    def overlap(self, a: Fragment, b: Fragment, min_length: int = 1, proper: bool = True) -> int:
+        return packed_overlap(a.packed.value, len(a), b.packed.value, len(b), min_length, proper)
+
+    def iter_overlaps(self, fragments: List[Fragment], min_length: int = 1,
+                      proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """Wie NaiveOverlapEngine.iter_overlaps(), liest die Sequenzen aber gepackt statt als String."""
+        index = [(fragment.packed.value, len(fragment)) for fragment in fragments]
+        yield from self.iter_rows([], index, range(len(fragments)), identity_classes(fragments), min_length, proper)
+
+    def prepare(self, sequences: List[str]) -> list[tuple[int, int]]:
+        """Gepackter Wert und Länge jeder Sequenz."""
+        return [(PackedSequence(sequence).value, len(sequence)) for sequence in sequences]
+
+    def iter_rows(self, sequences: List[str], index: list[tuple[int, int]], rows: Iterable[int],
+                  classes: List[int], min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """Berechnet die Overlaps der Quellzeilen allein aus den gepackten Werten in `index`."""
+        for i in rows:
+            value_a, len_a = index[i]
+            for j, (value_b, len_b) in enumerate(index):
+                if classes[i] != classes[j]:
+                    length = packed_overlap(value_a, len_a, value_b, len_b, min_length, proper)
+                    if length > 0:
+                        yield i, j, length
+
+
+class RollingHashOverlapEngine(NaiveOverlapEngine):
+    """
+    Vergleicht jedes Fragmentpaar mit Rabin–Karp-Hashes statt mit Teilstring-Vergleichen.
+
+    Präfix- und Suffix-Hashes werden einmal pro Fragment berechnet und am Fragment gespeichert
+    (Fragment.prefix_hashes/suffix_hashes); danach kostet jede Längenprüfung O(1), ein Paar also
+    O(L) statt O(L²). Bei Hash-Gleichheit wird der Overlap zur Sicherheit exakt bestätigt.
+    """
+    name = "rolling"
+
+    def overlap(self, a: Fragment, b: Fragment, min_length: int = 1, proper: bool = True) -> int:
+        """Berechnet den längsten Overlap von a nach b über die gespeicherten Präfix-Hashes."""
+        return rolling_overlap(a.sequence, a.suffix_hashes, b.sequence, b.prefix_hashes, min_length, proper)
+
+    def iter_overlaps(self, fragments: List[Fragment], min_length: int = 1,
+                      proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        # Die am Fragment gespeicherten Hashes verwenden, statt sie in prepare() neu zu berechnen
+        sequences = [f.sequence for f in fragments]
+        index = [(f.prefix_hashes, f.suffix_hashes) for f in fragments]
+        yield from self.iter_rows(sequences, index, range(len(sequences)),
+                                  identity_classes(fragments), min_length, proper)
+
+    def prepare(self, sequences: List[str]) -> list:
+        """Berechnet Präfix- und Suffix-Hashes aller Sequenzen."""
+        index = []
+        for seq in sequences:
+            prefix = prefix_hashes(seq)
+            index.append((prefix, suffix_hashes(prefix)))
+        return index
+
+    def iter_rows(self, sequences: List[str], index: list, rows: Iterable[int], classes: List[int],
+                  min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Berechnet die Overlaps für die angegebenen Quellzeilen mit dem Rolling-Hash-Vergleich.
+        """
+        for i in rows:
+            seq_a, suffix_a = sequences[i], index[i][1]
+            for j, seq_b in enumerate(sequences):
+                if classes[i] != classes[j]:
+                    length = rolling_overlap(seq_a, suffix_a, seq_b, index[j][0], min_length, proper)
+                    if length > 0:
+                        yield i, j, length
+
+
+class MinimizerOverlapEngine(NaiveOverlapEngine):
+    """
+    Filtert die Fragmentpaare über gemeinsame Minimizer vor und prüft nur die Kandidaten exakt.
+
+    Statt alle n² Paare zu vergleichen, wird ein Paar (a, b) nur dann mit
+    suffix_prefix_overlap() verifiziert, wenn das Suffix von a und das Präfix von b einen
+    Minimizer teilen (siehe MinimizerIndex). Gefunden werden genau die Overlaps mit Länge
+    >= min_overlap; kürzere Overlaps werden bewusst ignoriert, auch wenn ein kleineres
+    min_length übergeben wird.
+
+    Nach iter_overlaps() enthalten `candidate_pairs` und `total_pairs` die Zahl der geprüften
+    bzw. aller geordneten Paare; `reduction_ratio` ist der Anteil der eingesparten Prüfungen.
+    """
+    name = "minimizer"
+
+    def __init__(self, k: int = 11, w: int = 5, min_overlap: int = 15):
+        """
+        Parameter:
+            k (int): Länge der k-mere.
+            w (int): Anzahl aufeinanderfolgender k-mere pro Fenster.
+            min_overlap (int): Kürzeste gesuchte Overlap-Länge, mindestens w + k - 1.
+        """
+        if k < 1 or w < 1:
+            raise ValueError("k und die Fenstergröße müssen mindestens 1 sein.")
+        if w + k - 1 > min_overlap:
+            raise ValueError("Die Mindestüberlappung muss mindestens w + k - 1 betragen.")
+        self.k = k
+        self.w = w
+        self.min_overlap = min_overlap
+        self.candidate_pairs = 0
+        self.total_pairs = 0
+
+    @property
+    def params(self) -> dict:
+        """Parameter, die das Ergebnis der Engine bestimmen."""
+        return {"k": self.k, "w": self.w, "min_overlap": self.min_overlap}
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Anteil der Paare, die dank des Filters nicht exakt geprüft werden mussten."""
+        if not self.total_pairs:
+            return 0.0
+        return 1 - self.candidate_pairs / self.total_pairs
+
+    def overlap(self, a: Fragment, b: Fragment, min_length: int = 1, proper: bool = True) -> int:
+        """Berechnet den längsten Overlap von a nach b mit Länge >= min_overlap."""
+        return suffix_prefix_overlap(a.sequence, b.sequence, max(min_length, self.min_overlap), proper)
+
+    def sequence_overlap(self, seq_a: str, seq_b: str, min_length: int = 1,
+                         proper: bool = True) -> tuple[int, float]:
+        return suffix_prefix_overlap(seq_a, seq_b, max(min_length, self.min_overlap), proper), 1.0
+
+    def iter_overlaps(self, fragments: List[Fragment], min_length: int = 1,
+                      proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        self.candidate_pairs = 0
+        self.total_pairs = 0
+        yield from super().iter_overlaps(fragments, min_length, proper)
+        logger.info(f"[MinimizerOverlapEngine] {self.candidate_pairs} von {self.total_pairs} Paaren geprüft "
+                    f"(Reduktion {100 * self.reduction_ratio:.1f} %)")
+
+    def prepare(self, sequences: List[str]) -> MinimizerIndex:
+        """Indiziert die Präfix-Minimizer aller Sequenzen."""
+        return MinimizerIndex(sequences, self.k, self.w, self.min_overlap)
+
+    def iter_rows(self, sequences: List[str], index: MinimizerIndex, rows: Iterable[int], classes: List[int],
+                  min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Berechnet die Overlaps für die angegebenen Quellzeilen, geprüft werden nur Kandidatenpaare.
+        """
+        min_length = max(min_length, self.min_overlap)
+        for i in rows:
+            seq_a = sequences[i]
+            candidates = sorted(j for j in index.candidates(seq_a) if classes[j] != classes[i])
+            self.candidate_pairs += len(candidates)
+            self.total_pairs += len(sequences) - 1
+            for j in candidates:
+                length = suffix_prefix_overlap(seq_a, sequences[j], min_length, proper)
+                if length > 0:
+                    yield i, j, length
+
+
+class ApproximateOverlapEngine(NaiveOverlapEngine):
+    """
+    Findet fehlertolerante Overlaps (Mismatches und kleine Indels) über Seeds und Banded Alignment.
+
+    Kandidaten entstehen wie beim Minimizer-Filter aus gemeinsamen Minimizern von a und b; jeder
+    Treffer legt eine Diagonale fest (Startposition des Overlaps in a). Nur für diese Diagonalen
+    wird mit banded_overlap() eine Edit-Distanz im Band ±band berechnet, längster Overlap zuerst.
+    Ein Overlap gilt, wenn höchstens max_error_rate · Länge Fehler auftreten und er mindestens
+    min_overlap lang ist. Zusätzlich zur Länge (= Länge des überlappten Präfixes von b) wird die
+    Identität 1 - Fehler / Länge geliefert.
+    """
+    name = "approximate"
+    exact = False
+
+    def __init__(self, max_error_rate: float = 0.02, k: int = 11, w: int = 5, min_overlap: int = 20,
+                 band: int = 3):
+        """
+        Parameter:
+            max_error_rate (float): Erlaubter Anteil fehlerhafter Basen im Overlap (0 = nur exakt).
+            k (int): Länge der k-mere für die Seeds.
+            w (int): Anzahl aufeinanderfolgender k-mere pro Minimizer-Fenster.
+            min_overlap (int): Kürzeste gesuchte Overlap-Länge, mindestens w + k - 1.
+            band (int): Breite des Alignment-Bands (maximale Anzahl an Indels).
+        """
+        if not 0 <= max_error_rate < 1:
+            raise ValueError("Die Fehlerrate muss zwischen 0 und 1 liegen.")
+        if band < 0:
+            raise ValueError("Die Bandbreite darf nicht negativ sein.")
+        if k < 1 or w < 1:
+            raise ValueError("k und die Fenstergröße müssen mindestens 1 sein.")
+        if w + k - 1 > min_overlap:
+            raise ValueError("Die Mindestüberlappung muss mindestens w + k - 1 betragen.")
+        self.max_error_rate = max_error_rate
+        self.k = k
+        self.w = w
+        self.min_overlap = min_overlap
+        self.band = band
+
+    @property
+    def params(self) -> dict:
+        """Parameter, die das Ergebnis der Engine bestimmen."""
+        return {"max_error_rate": self.max_error_rate, "k": self.k, "w": self.w,
+                "min_overlap": self.min_overlap, "band": self.band}
+
+    def overlap(self, a: Fragment, b: Fragment, min_length: int = 1, proper: bool = True) -> int:
+        return self.scored_overlap(a, b, min_length, proper)[0]
+
+    def scored_overlap(self, a: Fragment, b: Fragment, min_length: int = 1,
+                       proper: bool = True) -> tuple[int, float]:
+        return self.sequence_overlap(a.sequence, b.sequence, min_length, proper)
+
+    def sequence_overlap(self, seq_a: str, seq_b: str, min_length: int = 1,
+                         proper: bool = True) -> tuple[int, float]:
+        seeds_b: dict[int, list[int]] = {}
+        for position, value in minimizer_positions(seq_b, self.k, self.w):
+            seeds_b.setdefault(value, []).append(position)
+        starts = {pa - pb for pa, value in minimizer_positions(seq_a, self.k, self.w)
+                  for pb in seeds_b.get(value, ()) if pa >= pb}
+        return self._best_overlap(seq_a, seq_b, starts, min_length, proper)
+
+    def _best_overlap(self, seq_a: str, seq_b: str, starts: Iterable[int], min_length: int,
+                      proper: bool) -> tuple[int, float]:
+        """Prüft die Diagonalen vom längsten zum kürzesten Overlap, der erste Treffer gewinnt."""
+        min_length = max(min_length, self.min_overlap)
+        for start in sorted(starts):
+            if len(seq_a) - start < min_length:
+                break
+            result = banded_overlap(seq_a, seq_b, start, self.band, self.max_error_rate, proper)
+            if result is not None and result[0] >= min_length:
+                length, errors = result
+                return length, 1 - errors / max(length, len(seq_a) - start)
+        return 0, 1.0
+
+    def prepare(self, sequences: List[str]) -> dict[int, list[tuple[int, int]]]:
+        """Indiziert alle Minimizer aller Sequenzen mit (Sequenzindex, Position)."""
+        table: dict[int, list[tuple[int, int]]] = {}
+        for j, sequence in enumerate(sequences):
+            for position, value in minimizer_positions(sequence, self.k, self.w):
+                table.setdefault(value, []).append((j, position))
+        return table
+
+    def iter_rows(self, sequences: List[str], index: dict, rows: Iterable[int], classes: List[int],
+                  min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int, float]]:
+        """
+        Berechnet die fehlertoleranten Overlaps der Quellzeilen zu allen Kandidaten.
+
+        Rückgabe:
+            Iterator über Tupel (Index Quelle, Index Ziel, Overlap-Länge, Identität).
+        """
+        for i in rows:
+            seq_a = sequences[i]
+            starts: dict[int, set[int]] = {}
+            for pa, value in minimizer_positions(seq_a, self.k, self.w):
+                for j, pb in index.get(value, ()):
+                    if pa >= pb and classes[j] != classes[i]:
+                        starts.setdefault(j, set()).add(pa - pb)
+            for j in sorted(starts):
+                length, identity = self._best_overlap(seq_a, sequences[j], starts[j], min_length, proper)
+                if length > 0:
+                    yield i, j, length, identity
+
+
+class NumpyOverlapEngine(NaiveOverlapEngine):
+    """
+    Berechnet die Overlaps blockweise als Matrix mit NumPy über polynomiale Präfix-Hashes.
+
+    Jede Sequenz wird als uint8-Array kodiert. Daraus entstehen zwei Hash-Tabellen der Form
+    (Anzahl Sequenzen × maximale Länge + 1): der Hash jedes Präfixes und der Hash jedes Suffixes
+    (gleich normiert, gerechnet modulo 2^64). Für einen Block von Quellzeilen wird dann je Länge l
+    ein ganzer Vektorvergleich "Suffix der Länge l == Präfix der Länge l" gegen alle Ziele
+    ausgeführt, von der längsten zur kürzesten Länge. Jeder Hash-Treffer wird anschließend exakt
+    geprüft; bei einer (sehr seltenen) Kollision wird das Paar mit suffix_prefix_overlap() berechnet.
+    """
+    name = "numpy"
+    BASE = 0x100000001B3  # ungerade, daher modulo 2^64 invertierbar
+    BLOCK_SIZE = 64  # Quellzeilen pro Matrixblock
+
+    def __init__(self):
+        if np is None:
+            raise ValueError("Die Overlap-Engine 'numpy' benötigt das Paket NumPy.")
+
+    def prepare(self, sequences: List[str]) -> tuple:
+        """
+        Kodiert alle Sequenzen und berechnet Präfix- und Suffix-Hashes aller Längen.
+
+        Rückgabe:
+            (Längen, Präfix-Hashes, Suffix-Hashes) als NumPy-Arrays.
+        """
+        lengths = np.array([len(seq) for seq in sequences], dtype=np.int64)
+        max_length = int(lengths.max()) if len(sequences) else 0
+
+        # Groß- und Kleinbuchstaben erhalten verschiedene Codes (wie beim Stringvergleich)
+        table = np.zeros(256, dtype=np.uint64)
+        for code, base in enumerate("ACGTacgt", start=1):
+            table[ord(base)] = code
+        codes = np.zeros((len(sequences), max_length), dtype=np.uint64)
+        for row, seq in enumerate(sequences):
+            codes[row, :len(seq)] = table[np.frombuffer(seq.encode("ascii"), dtype=np.uint8)]
+
+        modulus = 1 << 64
+        inverse = pow(self.BASE, -1, modulus)
+        powers = np.array([pow(self.BASE, t, modulus) for t in range(max_length + 1)], dtype=np.uint64)
+        inverse_powers = np.array([pow(inverse, t, modulus) for t in range(max_length + 1)], dtype=np.uint64)
+
+        # cumulative[i, l] = Summe codes[i, t] · B^t für t < l (modulo 2^64 durch Überlauf)
+        cumulative = np.zeros((len(sequences), max_length + 1), dtype=np.uint64)
+        np.cumsum(codes * powers[:max_length], axis=1, out=cumulative[:, 1:])
+        prefix_hashes = cumulative
+
+        # Suffix der Länge l beginnt bei n - l; durch B^(n - l) teilen normiert auf die Präfixform
+        starts = np.maximum(lengths[:, None] - np.arange(max_length + 1)[None, :], 0)
+        totals = cumulative[np.arange(len(sequences)), lengths]
+        suffix_hashes = (totals[:, None] - np.take_along_axis(cumulative, starts, axis=1)) * inverse_powers[starts]
+        return lengths, prefix_hashes, suffix_hashes
+
+    def overlap_matrix(self, sequences: List[str], index: tuple, rows: List[int], classes: List[int],
+                       min_length: int = 1, proper: bool = True) -> "np.ndarray":
+        """
+        Berechnet die Overlap-Längen der Quellzeilen `rows` gegen alle Sequenzen.
+
+        Rückgabe:
+            np.ndarray der Form (len(rows), len(sequences)); 0 bedeutet kein Overlap.
+        """
+        lengths, prefix_hashes, suffix_hashes = index
+        rows = np.asarray(rows, dtype=np.int64)
+        limit_rows = lengths[rows] - (1 if proper else 0)
+        limit_targets = lengths - (1 if proper else 0)
+        result = np.zeros((len(rows), len(sequences)), dtype=np.int64)
+        max_l = min(int(limit_rows.max(initial=0)), int(limit_targets.max(initial=0)))
+
+        for l in range(max_l, min_length - 1, -1):
+            hit = suffix_hashes[rows, l][:, None] == prefix_hashes[:, l][None, :]
+            hit &= (limit_rows >= l)[:, None]
+            hit &= (limit_targets >= l)[None, :]
+            hit &= result == 0
+            result[hit] = l
+
+        classes = np.asarray(classes)
+        result[classes[rows][:, None] == classes[None, :]] = 0
+
+        # Hash-Treffer exakt bestätigen
+        for r, j in zip(*np.nonzero(result)):
+            l = int(result[r, j])
+            seq_a, seq_b = sequences[rows[r]], sequences[j]
+            if seq_a[-l:] != seq_b[:l]:
+                result[r, j] = suffix_prefix_overlap(seq_a, seq_b, min_length, proper)
+        return result
+
+    def iter_rows(self, sequences: List[str], index: tuple, rows: Iterable[int], classes: List[int],
+                  min_length: int = 1, proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Berechnet die Overlaps für die angegebenen Quellzeilen in Blöcken von BLOCK_SIZE Zeilen.
+        """
+        rows = list(rows)
+        for start in range(0, len(rows), self.BLOCK_SIZE):
+            block = rows[start:start + self.BLOCK_SIZE]
+            matrix = self.overlap_matrix(sequences, index, block, classes, min_length, proper)
+            for r, j in zip(*np.nonzero(matrix)):
+                yield block[r], int(j), int(matrix[r, j])
+
+
+ENGINES = {
+    NaiveOverlapEngine.name: NaiveOverlapEngine,
+    SuffixArrayOverlapEngine.name: SuffixArrayOverlapEngine,
+    SortedPrefixOverlapEngine.name: SortedPrefixOverlapEngine,
+    PackedOverlapEngine.name: PackedOverlapEngine,
+    RollingHashOverlapEngine.name: RollingHashOverlapEngine,
+    MinimizerOverlapEngine.name: MinimizerOverlapEngine,
+    ApproximateOverlapEngine.name: ApproximateOverlapEngine,
+}
+if np is not None:
+    ENGINES[NumpyOverlapEngine.name] = NumpyOverlapEngine
+
+
+def get_engine(engine: "str | NaiveOverlapEngine") -> NaiveOverlapEngine:
+    """
+    Liefert eine Overlap-Engine anhand ihres Namens oder gibt eine übergebene Instanz unverändert zurück.
+    """
+    if not isinstance(engine, str):
+        return engine
+    if engine not in ENGINES:
+        raise ValueError(f"Unbekannte Overlap-Engine '{engine}'. Verfügbar: {', '.join(ENGINES)}")
+    return ENGINES[engine]()
@@ -1,6 +1,124 @@
-from typing import List
-from fragment import Fragment
+import heapq
+import logging
+from array import array
+from typing import Dict, Iterable, List
+from fragment import Fragment, MergedFragment
 from overlap import Overlap
+from overlap_engine import NaiveOverlapEngine, get_engine, suffix_prefix_overlap
+from parallel_overlap import ParallelOverlapEngine
+from progress import ProgressReporter
+
+logger = logging.getLogger(__name__)
+
+class IncrementalMerge:
+    """
+    Kanten eines neuen Contigs aus den Kanten seiner Teile (exakte Engines ohne top_k).
+    Gemeinsam genutzt von OverlapGraph._replace_merged() und dem Heap-Modus des GreedyAssembler.
+
+    Der Contig M = source + target[overlap_len:] beginnt mit source und endet mit target. Ein echter
+    Overlap M → x, der kürzer als target ist, ist ein Suffix von target und entspricht damit der
+    Kante target → x; ebenso entspricht x → M der Kante x → source. Ein längerer Overlap setzt
+    voraus, dass x das Ziel bzw. die Quelle enthält und auch mit dem anderen Teil überlappt. Neu
+    gerechnet wird deshalb nur gegen die bisherigen Nachbarn von source und target, die länger als
+    target bzw. source sind, und zwar zwischen Kopf- und Schwanzfenstern von höchstens `window`
+    Basen (Länge des längsten Eingabe-Fragments). Sind beide Seiten länger als das Fenster, kann
+    ein Repeat einen Overlap ab `window` Basen erzeugen; den sucht _repeat_overlap() zusätzlich
+    auf den ganzen Enden. Das Ergebnis entspricht damit einer vollständigen Neuberechnung.
+
+    Die Fenster eines Contigs werden aus den Fenstern seiner Teile abgeleitet; zusammengesetzt
+    werden nur die Enden langer Contigs für _repeat_overlap(). Ein Merge kostet damit im Regelfall
+    O(Grad · window) und nur bei langen Nachbarn O(Grad · Contig-Länge) statt O(n · Contig-Länge).
+    """
+
+    def __init__(self, engine: NaiveOverlapEngine, min_overlap: int, window: int):
+        self.engine = engine
+        self.min_overlap = min_overlap
+        self.window = window
+        self._windows: Dict[Fragment, tuple[str, str]] = {}  # Fragment -> (Kopf, Schwanz)
+
+    def windows(self, fragment: Fragment) -> tuple[str, str]:
+        """Kopf- und Schwanzfenster eines Fragments (werden beim ersten Zugriff gespeichert)."""
+        windows = self._windows.get(fragment)
+        if windows is None:
+            windows = self._windows[fragment] = (fragment.head(self.window), fragment.tail(self.window))
+        return windows
+
+    def overlaps(self, merged: MergedFragment, source: Fragment, target: Fragment, overlap_len: int,
+                 inherited_in: Dict[int, tuple], inherited_out: Dict[int, tuple],
+                 successors: List[tuple[int, Fragment]],
+                 predecessors: List[tuple[int, Fragment]]) -> tuple[Dict[int, tuple], Dict[int, tuple]]:
+        """
+        Berechnet die Overlaps des Contigs zu den bisherigen Nachbarn von source und target.
+
+        Parameter:
+            inherited_in (dict): Knoten -> (Länge, Identität) der Kanten x → source.
+            inherited_out (dict): Knoten -> (Länge, Identität) der Kanten target → x.
+            successors (list): (Knoten, Fragment) aller Ziele von Kanten aus source oder target.
+            predecessors (list): (Knoten, Fragment) aller Quellen von Kanten auf source oder target.
+
+        Rückgabe:
+            ({Ziel: (Länge, Identität)}, {Quelle: (Länge, Identität)}) nur mit positiven Overlaps
+        """
+        head, tail = self._merge_windows(merged, source, target, overlap_len)
+        outgoing, incoming = {}, {}
+        for node, other in successors:
+            score = inherited_out.get(node, (0, 1.0))
+            if len(other) > len(target):
+                size = min(self.window, len(other), len(merged))
+                score = max(score, self.engine.sequence_overlap(tail[-size:], self.windows(other)[0][:size],
+                                                                self.min_overlap))
+                if min(len(other), len(merged)) > self.window:
+                    score = max(score, self._repeat_overlap(merged, other))
+            if score[0] > 0:
+                outgoing[node] = score
+        for node, other in predecessors:
+            score = inherited_in.get(node, (0, 1.0))
+            if len(other) > len(source):
+                size = min(self.window, len(other), len(merged))
+                score = max(score, self.engine.sequence_overlap(self.windows(other)[1][-size:], head[:size],
+                                                                self.min_overlap))
+                if min(len(other), len(merged)) > self.window:
+                    score = max(score, self._repeat_overlap(other, merged))
+            if score[0] > 0:
+                incoming[node] = score
+        return outgoing, incoming
+
+    def _repeat_overlap(self, a: Fragment, b: Fragment) -> tuple[int, float]:
+        """
+        Längster echter Overlap a → b von mindestens `window` Basen (0, falls keiner existiert).
+
+        Solche Overlaps entstehen nur bei Repeats, die länger als die Reads sind, und fehlen in den
+        Fenstern. Gesucht wird mit str.find nach den Vorkommen des Kopffensters von b im Ende von a;
+        erst dort wird der ganze Überlapp verglichen.
+        """
+        size = min(len(a), len(b))
+        seq_a, seq_b = a.tail(size), b.head(size)
+        window = seq_b[:self.window]
+        position = seq_a.find(window, 1)
+        while position != -1 and size - position >= self.window:
+            if seq_a[position:] == seq_b[:size - position]:
+                return size - position, 1.0
+            position = seq_a.find(window, position + 1)
+        return 0, 1.0
+
+    def _merge_windows(self, merged: MergedFragment, source: Fragment, target: Fragment,
+                       overlap_len: int) -> tuple[str, str]:
+        """Leitet Kopf und Schwanz des Contigs aus den Fenstern der Teile ab und vergisst diese."""
+        source_head, source_tail = self.windows(source)
+        target_head, target_tail = self.windows(target)
+        del self._windows[source], self._windows[target]
+        # Ist ein Teil kürzer als das Fenster, liegt er vollständig in seinem Fenster
+        if len(source) >= self.window:
+            head = source_head
+        else:
+            head = (source_head + target_head[overlap_len:])[:self.window]
+        if len(target) >= self.window:
+            tail = target_tail
+        else:
+            tail = (source_tail[:max(len(source_tail) - overlap_len, 0)] + target_tail)[-self.window:]
+        self._windows[merged] = head, tail
+        return head, tail
+
 
 class OverlapGraph:
     """
@@ -8,32 +126,140 @@ class OverlapGraph:
 
     Jeder Knoten im Graph ist ein Fragment. 
     Eine gerichtete Kante (Overlap) existiert, wenn das Suffix eines Fragments mit dem Präfix eines anderen überlappt.
+
+    Intern erhält jeder Knoten einen fortlaufenden, dichten Integer-Index. Ausgehende und eingehende
+    Kanten werden pro Knoten in Adjazenz-Dictionaries gehalten, sodass Entfernen, Einfügen und
+    Nachbarschaftsabfragen nur O(Grad) kosten. Die Eigenschaften `fragments` und `edges` liefern
+    Listen in Einfügereihenfolge.
+
+    Optional werden nur Overlaps ab `min_overlap` Basen aufgenommen und pro Knoten höchstens die
+    `top_k` stärksten ausgehenden und eingehenden Kanten behalten (Länge, dann Identität; bei
+    Gleichstand die zuerst gefundene). Eine Kante bleibt nur, wenn sie für beide Endpunkte zu den
+    top_k gehört; der Kantenspeicher ist damit O(n · top_k).
     """
     _merge_counter = 0 # Zähler für die Vergabe eindeutiger IDs bei Merges
 
-    def __init__(self, fragments: List[Fragment]):
+    def __init__(self, fragments: List[Fragment], engine: "str | NaiveOverlapEngine" = "suffix_array",
+                 workers: int = 1, min_overlap: int = 1, top_k: int | None = None):
         """
         Initialisiert den OverlapGraph mit einer Liste von Fragmenten.
         Baut beim Erzeugen automatisch den vollständigen Overlap-Graph auf.
+
+        Parameter:
+            fragments (List[Fragment]): Die Knoten des Graphen.
+            engine (str | NaiveOverlapEngine): Verfahren zur Overlap-Berechnung
+                ("naive" als Referenz oder "suffix_array").
+            workers (int): Anzahl der Prozesse für den Graphaufbau; bei mehr als 1 wird die
+                Engine über einen Prozess-Pool parallelisiert.
+            min_overlap (int): Kürzeste Overlap-Länge, die als Kante aufgenommen wird.
+            top_k (int | None): Maximale Anzahl aus- und eingehender Kanten pro Knoten (None = alle).
         """
-        self._fragments = fragments
-        self._edges: List[Overlap] = []
+        self._init_empty(engine, workers, min_overlap, top_k)
+        for fragment in fragments:
+            self._insert_node(fragment)
         self._build_graph()
 
+    @classmethod
+    def from_edges(cls, fragments: List[Fragment], edges: Iterable[tuple[int, int, int]],
+                   engine: "str | NaiveOverlapEngine" = "suffix_array", workers: int = 1,
+                   min_overlap: int = 1, top_k: int | None = None) -> "OverlapGraph":
+        """
+        Erzeugt einen Graphen aus bereits bekannten Kanten, ohne Overlaps zu berechnen
+        (z. B. beim Laden aus dem Cache).
+
+        Parameter:
+            fragments (List[Fragment]): Die Knoten des Graphen.
+            edges (Iterable[tuple]): Tupel (Index Quelle, Index Ziel, Overlap-Länge[, Identität])
+                bezogen auf `fragments`, in der gewünschten Kantenreihenfolge.
+            engine (str | NaiveOverlapEngine): Engine für später hinzugefügte Fragmente.
+            min_overlap, top_k: Schwellen für später hinzugefügte Fragmente (die Kanten werden
+                unverändert übernommen).
+        """
+        graph = cls.__new__(cls)
+        graph._init_empty(engine, workers, min_overlap, top_k)
+        for fragment in fragments:
+            graph._insert_node(fragment)
+        for i, j, overlap_len, *identity in edges:
+            graph._insert_edge(i, j, Overlap(fragments[i], fragments[j], overlap_len, *identity))
+        logger.info(f"[OverlapGraph] {len(graph._edges)} Kanten wurden übernommen.")
+        return graph
+
+    def _init_empty(self, engine: "str | NaiveOverlapEngine", workers: int, min_overlap: int = 1,
+                    top_k: int | None = None):
+        """Legt die leeren Knoten- und Kantenstrukturen an."""
+        if min_overlap < 1:
+            raise ValueError("Die Mindestüberlappung muss mindestens 1 betragen.")
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k muss mindestens 1 sein.")
+        self._min_overlap = min_overlap
+        self._top_k = top_k
+        self._nodes: Dict[int, Fragment] = {}              # Knotenindex -> Fragment
+        self._node_of: Dict[Fragment, List[int]] = {}      # Fragment -> Knotenindizes
+        self._out: Dict[int, Dict[int, Overlap]] = {}      # Quelle -> {Ziel: Kante}
+        self._in: Dict[int, Dict[int, Overlap]] = {}       # Ziel -> {Quelle: Kante}
+        self._edges: Dict[Overlap, None] = {}              # Alle Kanten in Einfügereihenfolge
+        self._next_index = 0
+        self._read_length = 0                              # Länge des längsten Eingabe-Fragments
+        self._merger: IncrementalMerge | None = None
+        self._engine = get_engine(engine)
+        if workers > 1:
+            self._engine = ParallelOverlapEngine(self._engine, workers)
+
     def _build_graph(self):
         """
         Baut alle möglichen gerichteten Kanten (Overlaps) zwischen Fragmenten auf.
         """
-        print("[OverlapGraph] Baue Overlap-Graph aus Fragmenten aus...")
-        edge_count = 0
-        for a in self.fragments:
-            for b in self.fragments:
-                if a != b:
-                    overlap_len = self._compute_overlap(a.sequence, b.sequence)
-                    if overlap_len > 0:
-                        self._edges.append(Overlap(a, b, overlap_len))
-                        edge_count += 1
-        print(f"[OverlapGraph] {edge_count} Kanten wurden erzeugt.")
+        logger.info("[OverlapGraph] Baue Overlap-Graph aus Fragmenten aus...")
+        nodes = list(self._nodes)
+        fragments = list(self._nodes.values())
+        progress = ProgressReporter(logger, "OverlapGraph: Kanten")
+        overlaps = self._engine.iter_overlaps(fragments, min_length=self._min_overlap)
+        if self._top_k is not None:
+            overlaps = self._strongest_edges(overlaps, len(fragments), self._top_k, progress)
+        for i, j, overlap_len, *identity in overlaps:
+            self._insert_edge(nodes[i], nodes[j], Overlap(fragments[i], fragments[j], overlap_len, *identity))
+            if self._top_k is None:
+                progress.update()
+        progress.finish()
+        if self._top_k is not None:
+            logger.info(f"[OverlapGraph] {progress.count} Kanten gefunden, {len(self._edges)} "
+                        f"nach Begrenzung auf top_k = {self._top_k} behalten.")
+        else:
+            logger.info(f"[OverlapGraph] {progress.count} Kanten wurden erzeugt.")
+
+    @staticmethod
+    def _strongest_edges(overlaps: Iterable[tuple], n: int, k: int, progress: ProgressReporter) -> List[tuple]:
+        """
+        Behält pro Knoten die k stärksten aus- und eingehenden Overlaps (Länge, dann Identität,
+        dann Fundreihenfolge) über begrenzte Min-Heaps, ohne alle Overlaps zwischenzuspeichern.
+
+        Rückgabe:
+            Die Overlaps, die bei Quelle und Ziel unter den k stärksten sind, in Fundreihenfolge.
+        """
+        out_heaps: List[list] = [[] for _ in range(n)]
+        in_heaps: List[list] = [[] for _ in range(n)]
+        for order, overlap in enumerate(overlaps):
+            i, j, overlap_len = overlap[0], overlap[1], overlap[2]
+            entry = (overlap_len, overlap[3] if len(overlap) > 3 else 1.0, -order, overlap)
+            for heap in (out_heaps[i], in_heaps[j]):
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+            progress.update()
+
+        kept_out = {entry[2] for heap in out_heaps for entry in heap}
+        kept = [entry for heap in in_heaps for entry in heap if entry[2] in kept_out]
+        kept.sort(key=lambda entry: -entry[2])
+        return [entry[3] for entry in kept]
+
+    @staticmethod
+    def _strongest_indices(scores: List[tuple], k: int | None) -> set:
+        """Indizes der k stärksten (Länge, Identität)-Paare; bei Gleichstand gewinnt das frühere."""
+        candidates = [index for index, score in enumerate(scores) if score[0] > 0]
+        if k is None or len(candidates) <= k:
+            return set(candidates)
+        return set(heapq.nlargest(k, candidates, key=lambda index: scores[index]))
 
     @staticmethod
     def _compute_overlap(seq_a: str, seq_b: str) -> int:
@@ -41,37 +267,117 @@ class OverlapGraph:
         Berechnet die Länge des längsten Suffixes von seq_a,
         der mit dem Präfix von seq_b übereinstimmt.
         """
-        max_len = min(len(seq_a), len(seq_b)) - 1
-        for l in range(max_len, 0, -1):
-            if seq_a[-l:] == seq_b[:l]:
-                return l
-        return 0
+        return suffix_prefix_overlap(seq_a, seq_b)
+
+    def _insert_node(self, fragment: Fragment) -> int:
+        """Legt einen neuen Knoten ohne Kanten an und gibt seinen Index zurück."""
+        node = self._next_index
+        self._next_index += 1
+        self._nodes[node] = fragment
+        self._node_of.setdefault(fragment, []).append(node)
+        self._out[node] = {}
+        self._in[node] = {}
+        if not isinstance(fragment, MergedFragment) and len(fragment) > self._read_length:
+            self._read_length = len(fragment)
+        return node
+
+    def _insert_edge(self, source: int, target: int, edge: Overlap):
+        """Trägt eine Kante in beide Adjazenz-Dictionaries und die Kantenreihenfolge ein."""
+        self._out[source][target] = edge
+        self._in[target][source] = edge
+        self._edges[edge] = None
+
+    def edge_table(self) -> tuple[array, array, array, array]:
+        """
+        Liefert alle Kanten als kompakte Arrays (Quelle, Ziel, Länge, Identität) in Kantenreihenfolge.
+        Quelle und Ziel sind Positionen in der Liste `fragments`.
+        """
+        position = {node: k for k, node in enumerate(self._nodes)}
+        endpoints = {edge: (source, target) for source, out in self._out.items() for target, edge in out.items()}
+        sources, targets, lengths, identities = array("I"), array("I"), array("I"), array("d")
+        for edge in self._edges:
+            source, target = endpoints[edge]
+            sources.append(position[source])
+            targets.append(position[target])
+            lengths.append(edge.length)
+            identities.append(edge.identity)
+        return sources, targets, lengths, identities
+
+    def __reduce__(self):
+        """
+        Pickelt den Graphen kompakt als Fragmentliste plus edge_table() statt als Geflecht aus
+        Kanten-Objekten und Adjazenz-Dictionaries (z. B. zwischen den Prozessen der AssemblyPipeline).
+        """
+        return _graph_from_table, (self.fragments, self.edge_table(), self._engine, self._min_overlap, self._top_k)
+
+    def node_index(self, fragment: Fragment) -> int:
+        """
+        Liefert den dichten Integer-Index eines Fragments im Graphen.
+        """
+        if fragment not in self._node_of:
+            raise KeyError(f"Fragment {fragment.id} ist nicht im Graph enthalten.")
+        return self._node_of[fragment][0]
+
+    def out_edges(self, fragment: Fragment) -> List[Overlap]:
+        """Alle Kanten, die von diesem Fragment ausgehen."""
+        return [edge for node in self._node_of.get(fragment, []) for edge in self._out[node].values()]
+
+    def in_edges(self, fragment: Fragment) -> List[Overlap]:
+        """Alle Kanten, die auf dieses Fragment zeigen."""
+        return [edge for node in self._node_of.get(fragment, []) for edge in self._in[node].values()]
+
+    def successors(self, fragment: Fragment) -> List[Fragment]:
+        """Alle Fragmente, auf die eine Kante von diesem Fragment zeigt."""
+        return [edge.target for edge in self.out_edges(fragment)]
+
+    def predecessors(self, fragment: Fragment) -> List[Fragment]:
+        """Alle Fragmente, von denen eine Kante auf dieses Fragment zeigt."""
+        return [edge.source for edge in self.in_edges(fragment)]
 
     def remove_fragment(self, fragment: Fragment):
         """
         Entfernt ein Fragment sowie alle zugehörigen Overlap-Kanten aus dem Graph.
         """
-        self._fragments = [f for f in self._fragments if f != fragment]
-        self._edges = [e for e in self._edges if e.source != fragment and e.target != fragment]
-        print(f"[-] Fragment wurde entfernt: {fragment.id}")
+        for node in self._node_of.pop(fragment, []):
+            for target, edge in self._out.pop(node).items():
+                self._in[target].pop(node, None)
+                self._edges.pop(edge, None)
+            for source, edge in self._in.pop(node).items():
+                self._out[source].pop(node, None)
+                self._edges.pop(edge, None)
+            del self._nodes[node]
+        logger.debug("[-] Fragment wurde entfernt: %s", fragment.id)
+
+    def remove_edge(self, edge: Overlap):
+        """
+        Entfernt eine einzelne Kante aus dem Graph; die Fragmente bleiben erhalten.
+        """
+        for source in self._node_of.get(edge.source, []):
+            for target in self._node_of.get(edge.target, []):
+                if self._out[source].get(target) is edge:
+                    del self._out[source][target]
+                    del self._in[target][source]
+                    del self._edges[edge]
+                    return
+        raise KeyError(f"Kante {edge} ist nicht im Graph enthalten.")
 
     def add_fragment(self, new_fragment: Fragment):
         """
         Fügt ein neues Fragment dem Graph hinzu und berechnet Overlaps zu allen vorhandenen Fragmenten.
         """
-        for other in self._fragments:
-            if other != new_fragment:
-                # new - other
-                len1 = self._compute_overlap(new_fragment.sequence, other.sequence)
-                if len1 > 0:
-                    self._edges.append(Overlap(new_fragment, other, len1))
-
-                # other - new
-                len2 = self._compute_overlap(other.sequence, new_fragment.sequence)
-                if len2 > 0:
-                    self._edges.append(Overlap(other, new_fragment, len2))
-        self.fragments.append(new_fragment)
-        print(f"[+] Neues Fragment wurde hinzugefügt: {new_fragment.id}")
+        existing = [(node, other) for node, other in self._nodes.items() if other is not new_fragment]
+        new_node = self._insert_node(new_fragment)
+        # new - other und other - new
+        outgoing = [self._engine.scored_overlap(new_fragment, other, self._min_overlap) for _, other in existing]
+        incoming = [self._engine.scored_overlap(other, new_fragment, self._min_overlap) for _, other in existing]
+        keep_out = self._strongest_indices(outgoing, self._top_k)
+        keep_in = self._strongest_indices(incoming, self._top_k)
+        for index, (node, other) in enumerate(existing):
+            if index in keep_out:
+                self._insert_edge(new_node, node, Overlap(new_fragment, other, *outgoing[index]))
+            if index in keep_in:
+                self._insert_edge(node, new_node, Overlap(other, new_fragment, *incoming[index]))
+        logger.debug("[+] Neues Fragment wurde hinzugefügt: %s", new_fragment.id)
 
     def merge_and_replace(self, source: Fragment, target: Fragment, overlap_len: int) -> Fragment:
         """
@@ -84,24 +390,88 @@ class OverlapGraph:
         if overlap_len <= 0:
             raise ValueError("Overlap-Länge muss positiv sein.")
 
-        # Erzeuge zusammengeführte Sequenz
-        merged_seq = source.sequence + target.sequence[overlap_len:]
         new_id = f"MERGED_{OverlapGraph._merge_counter}"
         OverlapGraph._merge_counter += 1
 
-        new_fragment = Fragment(id=new_id, sequence=merged_seq)
+        # Der Contig verweist nur auf seine Teile; Sequenz und Rolling-Hashes entstehen erst bei Bedarf
+        new_fragment = MergedFragment(new_id, source, target, overlap_len)
 
         # Aktualisiere den Graphen
+        if self._engine.exact and self._top_k is None:
+            self._replace_merged(source, target, overlap_len, new_fragment)
+        else:
+            self.remove_fragment(source)
+            self.remove_fragment(target)
+            self.add_fragment(new_fragment)
+
+        return new_fragment
+
+    def _replace_merged(self, source: Fragment, target: Fragment, overlap_len: int, merged: MergedFragment):
+        """
+        Ersetzt source und target durch den Merge, ohne alle Overlaps neu zu berechnen.
+
+        Der Merge erbt die eingehenden Kanten von source und die ausgehenden von target; neu
+        gerechnet wird nur gegen deren Nachbarn über Fenster begrenzter Länge (siehe
+        IncrementalMerge). Gilt nur für exakte Engines ohne top_k-Begrenzung (sonst fehlen ggf.
+        Kanten). Die Kanten werden wie bei add_fragment() in Knotenreihenfolge eingetragen.
+        """
+        if self._merger is None or self._merger.window != self._read_length:
+            self._merger = IncrementalMerge(self._engine, self._min_overlap, self._read_length)
+        source_nodes, target_nodes = self._node_of.get(source, []), self._node_of.get(target, [])
+        inherited_in = {x: (edge.length, edge.identity) for node in source_nodes for x, edge in self._in[node].items()}
+        inherited_out = {x: (edge.length, edge.identity) for node in target_nodes for x, edge in self._out[node].items()}
+        successors = inherited_out.keys() | {x for node in source_nodes for x in self._out[node]}
+        predecessors = inherited_in.keys() | {x for node in target_nodes for x in self._in[node]}
         self.remove_fragment(source)
         self.remove_fragment(target)
-        self.add_fragment(new_fragment)
 
-        return new_fragment
+        outgoing, incoming = self._merger.overlaps(
+            merged, source, target, overlap_len, inherited_in, inherited_out,
+            [(x, self._nodes[x]) for x in sorted(successors) if x in self._nodes],
+            [(x, self._nodes[x]) for x in sorted(predecessors) if x in self._nodes])
+        new_node = self._insert_node(merged)
+        for node in sorted(outgoing.keys() | incoming.keys()):
+            other = self._nodes[node]
+            if node in outgoing:
+                self._insert_edge(new_node, node, Overlap(merged, other, *outgoing[node]))
+            if node in incoming:
+                self._insert_edge(node, new_node, Overlap(other, merged, *incoming[node]))
+        logger.debug("[+] Neues Fragment wurde hinzugefügt: %s", merged.id)
+
+    @property
+    def engine(self) -> NaiveOverlapEngine:
+        return self._engine
+
+    @property
+    def read_length(self) -> int:
+        """Länge des längsten Eingabe-Fragments (Contigs zählen nicht)."""
+        return self._read_length
+
+    @property
+    def min_overlap(self) -> int:
+        """Kürzeste Overlap-Länge, die als Kante aufgenommen wird."""
+        return self._min_overlap
+
+    @property
+    def top_k(self) -> int | None:
+        """Maximale Anzahl aus- und eingehender Kanten pro Knoten (None = unbegrenzt)."""
+        return self._top_k
 
     @property
     def edges(self) -> List[Overlap]:
-        return self._edges
+        """Alle Kanten des Graphen in Einfügereihenfolge (Momentaufnahme)."""
+        return list(self._edges)
 
     @property
     def fragments(self) -> List[Fragment]:
-        return self._fragments
\ No newline at end of file
+        """Alle Fragmente des Graphen in Einfügereihenfolge (Momentaufnahme)."""
+        return list(self._nodes.values())
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+def _graph_from_table(fragments: List[Fragment], table: tuple[array, array, array, array],
+                      engine: NaiveOverlapEngine, min_overlap: int, top_k: int | None) -> OverlapGraph:
+    """Gegenstück zu OverlapGraph.__reduce__(): baut den Graphen aus der Kantentabelle wieder auf."""
+    return OverlapGraph.from_edges(fragments, zip(*table), engine, 1, min_overlap, top_k)
@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator, List
+from fragment import Fragment
+from overlap_engine import NaiveOverlapEngine, identity_classes
+
+# Zustand eines Worker-Prozesses; wird einmalig im Initializer gesetzt
+_worker_state: dict = {}
+
+
+def _init_worker(shm_name: str, offsets: List[int], classes: List[int], base: NaiveOverlapEngine):
+    """
+    Liest die Sequenzen einmal pro Worker aus dem Shared Memory und baut den Index der Basis-Engine auf.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = bytes(shm.buf[:offsets[-1]])
+    finally:
+        shm.close()
+    sequences = [data[offsets[k]:offsets[k + 1]].decode("ascii") for k in range(len(offsets) - 1)]
+
+    _worker_state["sequences"] = sequences
+    _worker_state["classes"] = classes
+    _worker_state["base"] = base
+    _worker_state["index"] = base.prepare(sequences)
+
+
+def _compute_block(start: int, end: int, min_length: int, proper: bool) -> List[tuple[int, int, int]]:
+    """
+    Berechnet alle Overlaps der Quellzeilen [start, end) gegen alle Sequenzen.
+    """
+    state = _worker_state
+    return list(state["base"].iter_rows(state["sequences"], state["index"], range(start, end),
+                                        state["classes"], min_length, proper))
+
+
+class ParallelOverlapEngine(NaiveOverlapEngine):
+    """
+    Verteilt die Overlap-Berechnung einer Basis-Engine auf mehrere Prozesse.
+
+    Die Fragmentmenge wird in Zeilenblöcke (Quellfragmente) aufgeteilt. Alle Sequenzen liegen
+    verkettet in einem Shared-Memory-Block, den jeder Worker genau einmal einliest; pro Aufgabe
+    werden nur die Blockgrenzen übertragen. Die Ergebnisse werden in Blockreihenfolge
+    zusammengeführt, sodass die Kantenliste identisch zur seriellen Berechnung ist.
+    """
+    name = "parallel"
+
+    def __init__(self, base: NaiveOverlapEngine | None = None, workers: int | None = None,
+                 block_size: int | None = None):
+        """
+        Parameter:
+            base (NaiveOverlapEngine): Engine, die in den Workern die eigentliche Berechnung ausführt.
+            workers (int): Anzahl der Prozesse (Standard: Anzahl der CPU-Kerne).
+            block_size (int): Anzahl der Quellfragmente pro Aufgabe (Standard: automatisch).
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("Die Anzahl der Worker muss mindestens 1 sein.")
+        self.base = base if base is not None else NaiveOverlapEngine()
+        self.workers = workers or os.cpu_count() or 1
+        self.block_size = block_size
+
+    def overlap(self, a: Fragment, b: Fragment, min_length: int = 1, proper: bool = True) -> int:
+        """Einzelne Paare werden direkt von der Basis-Engine berechnet."""
+        return self.base.overlap(a, b, min_length, proper)
+
+    def sequence_overlap(self, seq_a: str, seq_b: str, min_length: int = 1,
+                         proper: bool = True) -> tuple[int, float]:
+        return self.base.sequence_overlap(seq_a, seq_b, min_length, proper)
+
+    def scored_overlap(self, a: Fragment, b: Fragment, min_length: int = 1,
+                       proper: bool = True) -> tuple[int, float]:
+        return self.base.scored_overlap(a, b, min_length, proper)
+
+    @property
+    def exact(self) -> bool:
+        return self.base.exact
+
+    def iter_overlaps(self, fragments: List[Fragment], min_length: int = 1,
+                      proper: bool = True) -> Iterator[tuple[int, int, int]]:
+        """
+        Liefert für alle geordneten Fragmentpaare den längsten Overlap, parallel berechnet.
+
+        Rückgabe:
+            Iterator über Tupel (Index Quelle, Index Ziel, Overlap-Länge), sortiert nach (Quelle, Ziel).
+        """
+        n = len(fragments)
+        if self.workers == 1 or n < 2:
+            yield from self.base.iter_overlaps(fragments, min_length, proper)
+            return
+
+        encoded = [f.sequence.encode("ascii") for f in fragments]
+        offsets = [0]
+        for seq in encoded:
+            offsets.append(offsets[-1] + len(seq))
+
+        block_size = self.block_size or max(1, -(-n // (self.workers * 4)))
+        shm = shared_memory.SharedMemory(create=True, size=max(1, offsets[-1]))
+        try:
+            shm.buf[:offsets[-1]] = b"".join(encoded)
+            del encoded
+
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(shm.name, offsets, identity_classes(fragments), self.base)) as executor:
+                futures = [executor.submit(_compute_block, start, min(start + block_size, n), min_length, proper)
+                           for start in range(0, n, block_size)]
+                # Ergebnisse in Blockreihenfolge übernehmen → deterministische Kantenliste
+                for future in futures:
+                    yield from future.result()
+        finally:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,281 @@
+import asyncio
+import functools
+import logging
+import pickle
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List
+from containment import ContainmentFilter
+from file_parser import FileParser
+from fragment import Fragment, MergedFragment
+from graph_cache import GraphCache
+from greedy_assembler import GreedyAssembler
+from orientation_selector import OrientationSelector
+from overlap_engine import NaiveOverlapEngine
+from overlap_graph import OverlapGraph
+from string_graph import StringGraph
+
+logger = logging.getLogger(__name__)
+
+class StageMetrics:
+    """
+    Kennzahlen einer Pipeline-Stufe.
+
+    Attribute:
+        items / errors: Anzahl verarbeiteter bzw. fehlgeschlagener Eingaben.
+        busy_seconds: Summe der Rechenzeit im Executor.
+        wait_seconds: Zeit, in der die Stufe auf Eingaben gewartet hat (Stufe davor zu langsam).
+        blocked_seconds: Zeit, in der die Ausgabewarteschlange voll war (Stufe danach zu langsam).
+        max_queue_depth / mean_queue_depth: Füllstand der Eingangswarteschlange beim Entnehmen
+            (bei parse, das direkt aus der Liste der Eingabedateien liest, immer 0).
+    """
+    __slots__ = ("name", "items", "errors", "busy_seconds", "wait_seconds", "blocked_seconds",
+                 "max_queue_depth", "_depth_sum")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.max_queue_depth = 0
+        self._depth_sum = 0
+
+    def record_depth(self, depth: int):
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self._depth_sum += depth
+
+    @property
+    def mean_queue_depth(self) -> float:
+        return self._depth_sum / (self.items + self.errors) if self.items + self.errors else 0.0
+
+    def as_dict(self) -> dict:
+        return {"stage": self.name, "items": self.items, "errors": self.errors,
+                "busy_seconds": round(self.busy_seconds, 6), "wait_seconds": round(self.wait_seconds, 6),
+                "blocked_seconds": round(self.blocked_seconds, 6), "max_queue_depth": self.max_queue_depth,
+                "mean_queue_depth": round(self.mean_queue_depth, 3)}
+
+
+class AssemblyPipeline:
+    """
+    Führt Einlesen, Orientierung, Graphaufbau und Assembly als Stufen einer Pipeline aus.
+
+    Die Stufen lassen sich einzeln synchron aufrufen (parse(), orient(), build(), assemble()).
+    run() bzw. run_async() verarbeitet mehrere Eingabedateien nebenläufig: jede Stufe ist eine
+    Coroutine, die Stufen sind über begrenzte asyncio-Warteschlangen (queue_size) verbunden, und
+    die eigentliche Arbeit läuft über run_in_executor. Während die Overlaps der ersten Datei
+    berechnet werden, wird so bereits die nächste Datei eingelesen und orientiert; volle
+    Warteschlangen bremsen schnelle Stufen (Backpressure), damit nicht alle Dateien gleichzeitig
+    im Speicher liegen.
+
+    Das Einlesen (vor allem Ein-/Ausgabe) läuft in einem Thread-Pool. Die rechenintensiven Stufen
+    (orient, build, assemble) laufen in einem Prozess-Pool mit `processes` Prozessen, da sich
+    Threads wegen des GIL beim reinen Python-Code nicht überlappen würden. Fragmente, Graph und
+    Contigs werden dafür zwischen den Prozessen gepickelt (der Graph nur einmal und als
+    Kantentabelle); die Contigs werden vor der Rückgabe zu einfachen Fragmenten zusammengesetzt.
+    Ob sich das lohnt, hängt von der Anzahl freier CPU-Kerne und dem Verhältnis von Rechenzeit zu
+    Pickle-Aufwand ab; auf einem einzelnen Kern ist der Prozess-Pool nicht schneller (siehe
+    benchmarks/pipeline_benchmark.py). Mit processes=0 läuft alles im Thread-Pool (dann
+    überlappen nur Ein-/Ausgabe und Rechnen).
+
+    Jede Stufe bearbeitet eine Datei nach der anderen; die Dateien durchlaufen die Stufen also in
+    Eingabereihenfolge. Im Thread-Pool bleiben die Merge-IDs (globaler Zähler) damit
+    reproduzierbar, im Prozess-Pool zählt jeder Prozess für sich.
+
+    Fehler beim Verarbeiten einer Datei werden im Ergebnis dieser Datei vermerkt (bei anderen als
+    OSError und ValueError mit dem Namen der Ausnahme); die übrigen Dateien laufen weiter.
+    """
+    STAGES = ("parse", "orient", "build", "assemble")
+
+    def __init__(self, engine: "str | NaiveOverlapEngine" = "suffix_array", double_strand: bool = False,
+                 orientation: str = "local", workers: int = 1, min_overlap: int = 1, top_k: int | None = None,
+                 assembly_mode: str = "heap", dedup: bool = False, string_graph: bool = False,
+                 cache_dir: str | None = None, contigs: bool = False, queue_size: int = 1,
+                 processes: int = 3, packed: bool = False):
+        if queue_size < 1:
+            raise ValueError("Die Größe der Warteschlangen muss mindestens 1 sein.")
+        if processes < 0:
+            raise ValueError("Die Anzahl der Prozesse darf nicht negativ sein.")
+        self.engine = engine
+        self.double_strand = double_strand
+        self.orientation = orientation
+        self.workers = workers
+        self.min_overlap = min_overlap
+        self.top_k = top_k
+        self.assembly_mode = assembly_mode
+        self.dedup = dedup
+        self.string_graph = string_graph
+        self.cache = GraphCache(cache_dir) if cache_dir else None
+        self.contigs = contigs
+        self.queue_size = queue_size
+        self.processes = processes
+        self.packed = packed
+
+    def parse(self, path: str) -> List[Fragment]:
+        """Stufe 1: Eingabedatei einlesen."""
+        fragments = FileParser.parse_fragments(path, packed=self.packed)
+        logger.info(f"{len(fragments)} Fragmente geladen.")
+        return fragments
+
+    def orient(self, fragments: List[Fragment]) -> List[Fragment]:
+        """Stufe 2: Duplikate/enthaltene Fragmente entfernen und bei Doppelstrang orientieren."""
+        if self.dedup:
+            fragments, _ = ContainmentFilter.filter(fragments, double_strand=self.double_strand)
+        if self.double_strand:
+            selector = OrientationSelector(fragments, engine=self.engine, workers=self.workers)
+            fragments = selector.select_orientation(self.orientation)
+        if self.string_graph:
+            fragments, _ = StringGraph.remove_contained(fragments)
+        return fragments
+
+    def build(self, fragments: List[Fragment]) -> OverlapGraph:
+        """Stufe 3: Overlap-Graphen aufbauen oder aus dem Cache laden."""
+        params = {"string_graph": self.string_graph}
+        thresholds = {"min_overlap": self.min_overlap, "top_k": self.top_k}
+        graph = self.cache.load(fragments, self.engine, self.workers, **thresholds, **params) if self.cache else None
+        if graph is None:
+            graph = OverlapGraph(fragments, engine=self.engine, workers=self.workers, **thresholds)
+            if self.string_graph:
+                StringGraph.reduce(graph)
+            if self.cache:
+                self.cache.store(graph, fragments, self.engine, **params)
+        return graph
+
+    def assemble(self, graph: OverlapGraph) -> List[Fragment]:
+        """Stufe 4: Contigs assemblieren; ohne contigs=True genau einen (sonst ValueError)."""
+        assembler = GreedyAssembler(graph, mode=self.assembly_mode)
+        return assembler.assemble_contigs() if self.contigs else [assembler.assemble()]
+
+    def run(self, paths: List[str], max_threads: int | None = None) -> tuple[List[dict], List[StageMetrics]]:
+        """Synchroner Einstieg für run_async()."""
+        return asyncio.run(self.run_async(paths, max_threads))
+
+    async def run_async(self, paths: List[str],
+                        max_threads: int | None = None) -> tuple[List[dict], List[StageMetrics]]:
+        """
+        Verarbeitet alle Eingabedateien nebenläufig durch die vier Stufen.
+
+        Parameter:
+            paths (List[str]): Eingabedateien.
+            max_threads (int): Threads im Thread-Pool (Standard: eine pro Stufe).
+
+        Rückgabe:
+            (Ergebnisse in Eingabereihenfolge als dict mit "input", "contigs" (oder None), "error"
+            (oder None), "seconds" = {Stufe: Laufzeit} und "total_seconds"; Kennzahlen pro Stufe)
+        """
+        results = [{"input": path, "contigs": None, "error": None, "seconds": {}, "total_seconds": 0.0}
+                   for path in paths]
+        metrics = [StageMetrics(name) for name in AssemblyPipeline.STAGES]
+        functions = [self.parse, self.orient, self.build, self.assemble]
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in AssemblyPipeline.STAGES[1:]]
+        source: asyncio.Queue = asyncio.Queue()  # Eingabedateien, unbegrenzt
+        for index, path in enumerate(paths):
+            source.put_nowait((index, path))
+        source.put_nowait(None)
+
+        start = time.perf_counter()
+        threads = ThreadPoolExecutor(max_workers=max_threads or len(AssemblyPipeline.STAGES),
+                                     thread_name_prefix="pipeline")
+        processes = ProcessPoolExecutor(max_workers=self.processes) if self.processes else None
+        # parse im Thread-Pool, die rechenintensiven Stufen im Prozess-Pool (falls vorhanden)
+        executors = [threads] + [processes or threads] * (len(AssemblyPipeline.STAGES) - 1)
+        try:
+            inputs = [source] + queues
+            outputs = queues + [None]
+            tasks = [asyncio.create_task(self._stage(function, stage, inbound, outbound, executor, results))
+                     for function, stage, inbound, outbound, executor
+                     in zip(functions, metrics, inputs, outputs, executors)]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+        finally:
+            threads.shutdown()
+            if processes is not None:
+                processes.shutdown()
+        elapsed = time.perf_counter() - start
+
+        for result in results:
+            result["total_seconds"] = round(sum(result["seconds"].values()), 6)
+        failed = sum(result["error"] is not None for result in results)
+        logger.info(f"[Pipeline] {len(paths)} Dateien in {elapsed:.2f}s verarbeitet, {failed} fehlgeschlagen.")
+        for stage in metrics:
+            logger.info(f"[Pipeline] {stage.name:<8} {stage.items} ok, {stage.errors} Fehler, "
+                        f"Rechenzeit {stage.busy_seconds:.2f}s, Warten {stage.wait_seconds:.2f}s, "
+                        f"blockiert {stage.blocked_seconds:.2f}s, Warteschlange max. {stage.max_queue_depth}")
+        return results, metrics
+
+    @staticmethod
+    async def _stage(function: Callable, metrics: StageMetrics, inbound: asyncio.Queue,
+                     outbound: asyncio.Queue | None, executor: Executor, results: List[dict]):
+        """
+        Eine Stufe: entnimmt (Index, Daten) aus inbound, rechnet im Executor und reicht das Ergebnis
+        weiter. None beendet die Stufe und wird an die nächste Stufe weitergegeben.
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(executor, ProcessPoolExecutor):
+            function = functools.partial(_run_detached, function)
+        while True:
+            depth = inbound.qsize()
+            waiting = time.perf_counter()
+            item = await inbound.get()
+            metrics.wait_seconds += time.perf_counter() - waiting
+            if item is None:
+                break
+            if inbound.maxsize:
+                metrics.record_depth(depth)
+            index, data = item
+            started = time.perf_counter()
+            try:
+                data = await loop.run_in_executor(executor, function, data)
+            except Exception as e:
+                # Auch unerwartete Fehler (z. B. ein abgestürzter Worker-Prozess) betreffen nur diese Datei
+                metrics.errors += 1
+                message = str(e) if isinstance(e, (OSError, ValueError)) else f"{type(e).__name__}: {e}"
+                results[index]["error"] = f"{metrics.name}: {message}"
+                logger.error(f"[Pipeline] {results[index]['input']}: {results[index]['error']}")
+                continue
+            finally:
+                seconds = time.perf_counter() - started
+                metrics.busy_seconds += seconds
+                results[index]["seconds"][metrics.name] = round(seconds, 6)
+            metrics.items += 1
+            if outbound is None:
+                results[index]["contigs"] = data
+            else:
+                blocked = time.perf_counter()
+                await outbound.put((index, data))
+                metrics.blocked_seconds += time.perf_counter() - blocked
+        if outbound is not None:
+            await outbound.put(None)
+
+
+class _Pickled:
+    """
+    Bereits gepickeltes Stufenergebnis. Der Hauptprozess reicht nur die Bytes weiter, statt z. B.
+    den Overlap-Graphen zwischen build und assemble selbst zu entpacken und erneut zu pickeln.
+    """
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+
+
+def _run_detached(function: Callable, data):
+    """
+    Führt eine Stufe im Worker-Prozess aus. Ein Overlap-Graph wird für die nächste Stufe nur
+    einmal (kompakt, siehe OverlapGraph.__reduce__) gepickelt; Contigs (MergedFragment) werden vor
+    der Rückgabe zu einfachen Fragmenten zusammengesetzt, statt den ganzen Rope-Baum zu pickeln.
+    """
+    if isinstance(data, _Pickled):
+        data = pickle.loads(data.payload)
+    data = function(data)
+    if isinstance(data, OverlapGraph):
+        return _Pickled(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+    if isinstance(data, list):
+        data = [Fragment._from_validated(item.id, item.sequence) if isinstance(item, MergedFragment) else item
+                for item in data]
+    return data
@@ -0,0 +1,67 @@
+import logging
+import time
+
+def configure_logging(verbosity: int = 0, quiet: bool = False):
+    """
+    Richtet die Ausgabe aller Module über das logging-Modul ein.
+
+    Parameter:
+        verbosity (int): 0 = Zusammenfassungen (INFO), ab 1 = Details pro Fragment/Merge (DEBUG).
+        quiet (bool): Nur Warnungen und Fehler ausgeben.
+    """
+    if quiet:
+        level = logging.WARNING
+    elif verbosity > 0:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+    logging.basicConfig(level=level, format="%(message)s", force=True)
+
+
+class ProgressReporter:
+    """
+    Meldet den Fortschritt einer langen Schleife mit begrenzter Rate über das logging-Modul.
+
+    update() zählt nur hoch und prüft die Uhr; eine Meldung (Anzahl, Rate, ggf. Restzeit) wird
+    höchstens einmal pro `interval` Sekunden ausgegeben. Ist INFO für den Logger deaktiviert
+    (z. B. im Quiet-Modus), kehrt update() sofort zurück.
+    """
+
+    def __init__(self, logger: logging.Logger, label: str, total: int | None = None, interval: float = 1.0):
+        self._logger = logger
+        self._label = label
+        self._total = total
+        self._interval = interval
+        self._enabled = logger.isEnabledFor(logging.INFO)
+        self._count = 0
+        self._start = time.monotonic()
+        self._next_report = self._start + interval
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def update(self, n: int = 1):
+        """Zählt n Einheiten weiter und meldet den Fortschritt, falls das Intervall abgelaufen ist."""
+        self._count += n
+        if not self._enabled:
+            return
+        now = time.monotonic()
+        if now >= self._next_report:
+            self._next_report = now + self._interval
+            self._report(now)
+
+    def finish(self):
+        """Gibt eine abschließende Meldung aus, sofern zwischendurch bereits berichtet wurde."""
+        if self._enabled and time.monotonic() - self._start >= self._interval:
+            self._report(time.monotonic())
+
+    def _report(self, now: float):
+        elapsed = max(now - self._start, 1e-9)
+        rate = self._count / elapsed
+        if self._total:
+            remaining = (self._total - self._count) / rate if rate > 0 else float("inf")
+            self._logger.info(f"[{self._label}] {self._count}/{self._total} "
+                              f"({100 * self._count / self._total:.1f} %, {rate:.1f}/s, noch ca. {remaining:.0f} s)")
+        else:
+            self._logger.info(f"[{self._label}] {self._count} ({rate:.1f}/s)")
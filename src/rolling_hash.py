@@ -0,0 +1,94 @@
+from array import array
+from itertools import compress
+from operator import eq
+
+MODULUS = (1 << 61) - 1  # Mersenne-Primzahl, alle Hashwerte passen in einen 64-Bit-Eintrag
+BASE = 1_000_003
+
+_powers = array("q", [1])  # _powers[l] = BASE^l mod MODULUS, wird bei Bedarf verlängert
+
+
+def powers(length: int) -> array:
+    """Liefert die Tabelle der Potenzen BASE^l für mindestens l = 0 .. length."""
+    if len(_powers) <= length:
+        value = _powers[-1]
+        for _ in range(len(_powers), length + 1):
+            value = value * BASE % MODULUS
+            _powers.append(value)
+    return _powers
+
+
+def prefix_hashes(sequence: str) -> array:
+    """
+    Berechnet die polynomialen Hashes aller Präfixe (Rabin–Karp).
+
+    Rückgabe:
+        array: hashes[l] ist der Hash von sequence[:l] für l = 0 .. len(sequence).
+    """
+    hashes = array("q", [0])
+    value = 0
+    for base in sequence.encode("ascii"):
+        value = (value * BASE + base) % MODULUS
+        hashes.append(value)
+    return hashes
+
+
+def suffix_hashes(prefix: array) -> array:
+    """
+    Berechnet aus den Präfix-Hashes die Hashes aller Suffixe.
+
+    Rückgabe:
+        array: hashes[l] ist der Hash der letzten l Basen für l = 0 .. n.
+    """
+    n = len(prefix) - 1
+    power = powers(n)
+    total = prefix[n]
+    return array("q", [(total - prefix[n - l] * power[l]) % MODULUS for l in range(n + 1)])
+
+
+def merge_prefix_hashes(source: array, target: array, overlap_len: int) -> array:
+    """
+    Leitet die Präfix-Hashes von source + target[overlap_len:] aus den Hashes der Eltern ab,
+    ohne die Basen erneut zu lesen.
+    """
+    power = powers(len(target))
+    source_hash = source[-1]
+    skipped = target[overlap_len]
+    merged = array("q", source)
+    for t in range(1, len(target) - overlap_len):
+        merged.append((source_hash * power[t] + target[overlap_len + t] - skipped * power[t]) % MODULUS)
+    return merged
+
+
+def merge_suffix_hashes(target_suffix: array, merged_prefix: array) -> array:
+    """
+    Leitet die Suffix-Hashes von source + target[overlap_len:] ab: Suffixe bis zur Länge des
+    Targets werden übernommen, nur die längeren aus den Präfix-Hashes des Contigs berechnet.
+    """
+    n = len(merged_prefix) - 1
+    power = powers(n)
+    total = merged_prefix[n]
+    merged = array("q", target_suffix)
+    for l in range(len(target_suffix), n + 1):
+        merged.append((total - merged_prefix[n - l] * power[l]) % MODULUS)
+    return merged
+
+
+def rolling_overlap(seq_a: str, suffix_a: array, seq_b: str, prefix_b: array, min_length: int = 1,
+                    proper: bool = True) -> int:
+    """
+    Wie suffix_prefix_overlap(), vergleicht pro Länge aber zuerst die Hashes in O(1).
+
+    suffix_a und prefix_b sind die Suffix-Hashes von seq_a bzw. die Präfix-Hashes von seq_b.
+    Die Hashes aller Längen werden in einem Durchlauf verglichen; nur bei Gleichheit werden
+    die Teilstrings geprüft. Ein Paar kostet damit O(L) statt O(L²).
+    """
+    max_len = min(len(seq_a), len(seq_b)) - (1 if proper else 0)
+    stop = max(min_length, 1) - 1
+    if max_len <= stop:
+        return 0
+    lengths = range(max_len, stop, -1)
+    for l in compress(lengths, map(eq, suffix_a[max_len:stop:-1], prefix_b[max_len:stop:-1])):
+        if seq_a[-l:] == seq_b[:l]:
+            return l
+    return 0
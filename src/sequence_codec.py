@@ -0,0 +1,39 @@
+from typing import List
+
+VALID_BASES = "ACGTacgt"
+_VALID_BYTES = VALID_BASES.encode("ascii")
+_COMPLEMENT = str.maketrans("ACGTacgt", "TGCAtgca")
+
+
+def is_valid(sequence: str) -> bool:
+    """
+    Prüft, ob die Sequenz nur aus A, C, G, T (Groß- oder Kleinschreibung) besteht.
+    bytes.translate löscht alle gültigen Basen in C; bleibt etwas übrig, ist die Sequenz ungültig.
+    """
+    return sequence.isascii() and not sequence.encode("ascii").translate(None, _VALID_BYTES)
+
+
+def reverse_complement(sequence: str) -> str:
+    """
+    Reverse Complement einer gültigen Sequenz über eine Übersetzungstabelle statt pro Base;
+    die Groß-/Kleinschreibung bleibt erhalten.
+    """
+    return sequence.translate(_COMPLEMENT)[::-1]
+
+
+def reverse_complements(sequences: List[str]) -> List[str]:
+    """
+    Reverse Complements vieler Sequenzen in einem Durchlauf.
+
+    Das Reverse Complement der Verkettung ist die Verkettung der Reverse Complements in
+    umgekehrter Reihenfolge; es genügt also ein translate und ein Umdrehen für alle Sequenzen,
+    danach wird nur noch an den bekannten Grenzen geschnitten.
+    """
+    joined = "".join(sequences).translate(_COMPLEMENT)[::-1]
+    result = []
+    end = len(joined)
+    for sequence in sequences:
+        start = end - len(sequence)
+        result.append(joined[start:end])
+        end = start
+    return result
@@ -0,0 +1,109 @@
+import logging
+from typing import List
+from containment import ContainmentFilter
+from fragment import Fragment
+from overlap import Overlap
+from overlap_engine import NaiveOverlapEngine
+from overlap_graph import OverlapGraph
+
+logger = logging.getLogger(__name__)
+
+class StringGraph:
+    """
+    Reduziert einen Overlap-Graphen zu einem String-Graphen (nach Myers 2005).
+
+    Zwei Schritte, beide optional einzeln nutzbar:
+    - remove_contained(): entfernt Fragmente, die vollständig in einem anderen Fragment enthalten
+      sind (inkl. exakter Duplikate), noch vor dem Graphaufbau.
+    - reduce(): entfernt transitive Kanten v→x, wenn es ein w mit v→w und w→x gibt und der Overlap
+      v→x genau dem über w implizierten entspricht: ov(v,x) = ov(v,w) + ov(w,x) - |w|.
+
+    Der GreedyAssembler kann unverändert auf dem reduzierten Graphen laufen.
+    """
+
+    @staticmethod
+    def remove_contained(fragments: List[Fragment]) -> tuple[List[Fragment], dict]:
+        """
+        Entfernt exakte Duplikate und alle Fragmente, die Teilstring eines anderen Fragments sind
+        (siehe ContainmentFilter). Von exakten Duplikaten bleibt das erste erhalten.
+
+        Rückgabe:
+            (verbleibende Fragmente in Eingabereihenfolge, {ID entfernt: ID des enthaltenden Fragments})
+        """
+        kept, stats = ContainmentFilter.filter(fragments)
+        return kept, stats["removed"]
+
+    @staticmethod
+    def reduce(graph: OverlapGraph, fuzz: int = 0) -> int:
+        """
+        Entfernt alle transitiven Kanten aus dem Graphen (Markierungsverfahren nach Myers 2005).
+
+        Gerechnet wird mit der Überhanglänge einer Kante v→w (|w| - ov(v,w)); v→x ist transitiv,
+        wenn ein Weg v→w→x dieselbe Überhanglänge hat (± fuzz, für fehlertolerante Engines). Pro
+        Knoten v werden die Nachfolger als "inplay" markiert und in aufsteigender Überhanglänge
+        besucht; für jeden noch markierten Nachfolger w werden dessen Nachfolger x ebenfalls
+        sortiert durchlaufen, aber nur, solange der Weg v→w→x nicht länger als der längste
+        Überhang von v ist. Getroffene Nachfolger werden "eliminated", am Ende wieder "vacant".
+        Die Nachbarlisten werden einmal sortiert (O(E log Grad)); der Suchaufwand hängt von der
+        Zahl der Nachfolger innerhalb dieses Fensters ab, nicht mehr von Grad(v) · Grad(w): Auch
+        im fast vollständigen Graphen bei Mindest-Overlap 1 enden die Wege über kurze Overlaps
+        (lange Überhänge) sofort.
+
+        Entfernt wird erst nach dem vollständigen Durchlauf, damit jede Entscheidung auf dem
+        ursprünglichen Graphen beruht.
+
+        Rückgabe:
+            int: Anzahl der entfernten Kanten.
+        """
+        # Ausgehende Kanten jedes Knotens als (Überhang, Kante), aufsteigend sortiert
+        sorted_out = {v: sorted(((len(edge.target) - edge.length, edge) for edge in graph.out_edges(v)),
+                                key=lambda item: item[0])
+                      for v in graph.fragments}
+
+        transitive: dict[Overlap, None] = {}
+        mark: dict[Fragment, int] = {}  # Überhang v→x für Knoten "inplay"; fehlt ein Knoten, ist er "vacant"
+        eliminated: dict[Fragment, None] = {}
+        for v in graph.fragments:
+            out = sorted_out[v]
+            if not out:
+                continue
+            for overhang, edge in out:
+                mark[edge.target] = overhang
+            longest = out[-1][0] + fuzz
+
+            for overhang_vw, vw in out:
+                if vw.target in eliminated:
+                    continue
+                for overhang_wx, wx in sorted_out[vw.target]:
+                    path = overhang_vw + overhang_wx
+                    if path > longest:
+                        break
+                    overhang_vx = mark.get(wx.target)
+                    if overhang_vx is not None and abs(overhang_vx - path) <= fuzz:
+                        eliminated[wx.target] = None
+
+            for _, edge in out:
+                if edge.target in eliminated:
+                    transitive[edge] = None
+            mark.clear()
+            eliminated.clear()
+
+        for edge in transitive:
+            graph.remove_edge(edge)
+        logger.info(f"[StringGraph] {len(transitive)} transitive Kanten entfernt, {len(graph.edges)} verbleiben.")
+        return len(transitive)
+
+    @staticmethod
+    def build(fragments: List[Fragment], engine: "str | NaiveOverlapEngine" = "suffix_array",
+              workers: int = 1) -> tuple[OverlapGraph, dict]:
+        """
+        Entfernt enthaltene Fragmente, baut den Overlap-Graphen und reduziert ihn transitiv.
+
+        Rückgabe:
+            (reduzierter Graph, Statistik mit "contained_reads", "transitive_edges" und
+            "removed" = {ID entfernt: ID des enthaltenden Fragments})
+        """
+        kept, removed = StringGraph.remove_contained(fragments)
+        graph = OverlapGraph(kept, engine=engine, workers=workers)
+        dropped = StringGraph.reduce(graph)
+        return graph, {"contained_reads": len(removed), "transitive_edges": dropped, "removed": removed}
@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from banded_alignment import banded_overlap
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from greedy_assembler import GreedyAssembler
+from overlap_engine import ApproximateOverlapEngine, NaiveOverlapEngine, suffix_prefix_overlap
+from overlap_graph import OverlapGraph
+
+
+def _mutate(sequence: str, position: int) -> str:
+    replacement = "A" if sequence[position] != "A" else "C"
+    return sequence[:position] + replacement + sequence[position + 1:]
+
+
+def test_banded_overlap_matches_exact_overlap():
+    random.seed(5)
+    dna = FragmentGenerator.generate_random_dna(120)
+    a, b = dna[:80], dna[40:]
+    overlap = suffix_prefix_overlap(a, b)
+    assert banded_overlap(a, b, len(a) - overlap, 3, 0.0) == (overlap, 0)
+
+
+def test_single_mismatch_is_tolerated():
+    random.seed(6)
+    dna = FragmentGenerator.generate_random_dna(160)
+    a = Fragment("a", dna[:100])
+    b = Fragment("b", _mutate(dna[40:], 30))
+
+    length, identity = ApproximateOverlapEngine(max_error_rate=0.05).scored_overlap(a, b)
+    assert length == 60
+    assert 0.98 < identity < 1.0
+    assert NaiveOverlapEngine().overlap(a, b) < 60
+
+
+def test_insertion_is_tolerated():
+    random.seed(7)
+    dna = FragmentGenerator.generate_random_dna(160)
+    a = Fragment("a", dna[:100])
+    b = Fragment("b", dna[40:70] + "G" + dna[70:])
+
+    length, identity = ApproximateOverlapEngine(max_error_rate=0.05).scored_overlap(a, b)
+    assert length == 61
+    assert identity < 1.0
+
+
+def test_assembler_prefers_higher_identity_on_equal_length():
+    fragments = [Fragment("A", "ACGTACGTAA"), Fragment("B", "TAACCCCC"), Fragment("C", "TAAGGGGG")]
+    edges = [(0, 1, 3, 0.9), (0, 2, 3, 1.0)]
+    for mode in GreedyAssembler.MODES:
+        OverlapGraph._merge_counter = 0
+        graph = OverlapGraph.from_edges(fragments, edges, engine="naive")
+        contigs = GreedyAssembler(graph, mode=mode).assemble_contigs()
+        assert "ACGTACGTAAGGGGG" in [contig.sequence for contig in contigs]
+
+
+if __name__ == "__main__":
+    test_banded_overlap_matches_exact_overlap()
+    test_single_mismatch_is_tolerated()
+    test_insertion_is_tolerated()
+    test_assembler_prefers_higher_identity_on_equal_length()
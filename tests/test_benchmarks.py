@@ -0,0 +1,37 @@
+import json
+import os
+import sys
+
+# Erlaube Imports aus dem benchmarks/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks")))
+
+import codec_benchmark
+import run_benchmarks
+
+
+def test_benchmark_grid_writes_json_and_csv(tmp_path):
+    json_path = tmp_path / "bench.json"
+    csv_path = tmp_path / "bench.csv"
+
+    exit_code = run_benchmarks.main(["--genome-lengths", "300", "--read-lengths", "30", "--overlaps", "10",
+                                     "--reverse-ratios", "0.4", "--json", str(json_path), "--csv", str(csv_path)])
+
+    assert exit_code == 0
+    results = json.loads(json_path.read_text())["results"]
+    stages = {(row["stage"], row["variant"]) for row in results}
+    assert {("orientation", "local"), ("orientation", "global"), ("graph_build", "suffix_array"),
+            ("assembly", "heap")} <= stages
+    assert all(row["peak_bytes"] for row in results)
+    assert csv_path.read_text().startswith("dataset,")
+
+
+def test_codec_benchmark_writes_json(tmp_path):
+    json_path = tmp_path / "codec.json"
+    exit_code = codec_benchmark.main(["--lengths", "50", "--batch", "20", "--repeats", "1",
+                                      "--json", str(json_path)])
+
+    assert exit_code == 0
+    results = json.loads(json_path.read_text())["results"]
+    assert {(row["input"], row["operation"]) for row in results} == {
+        ("single_50", "validate"), ("single_50", "reverse_complement"),
+        ("batch_20x60", "validate"), ("batch_20x60", "reverse_complement")}
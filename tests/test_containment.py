@@ -0,0 +1,70 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from containment import ContainmentFilter
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+
+
+def _naive_contained(fragments: list[Fragment], double_strand: bool) -> set:
+    """Referenz: paarweise Prüfung mit `in`."""
+    contained = set()
+    for read in fragments:
+        variants = {read.sequence, read.reverse_complement().sequence} if double_strand else {read.sequence}
+        for other in fragments:
+            if len(other) > len(read) and any(v in other.sequence for v in variants):
+                contained.add(read.id)
+    return contained
+
+
+def test_duplicates_are_removed_by_hash():
+    fragments = [Fragment("A", "ACGTTGCA"), Fragment("B", "ACGTTGCA"), Fragment("C", "TGCAACGT")]
+    kept, removed = ContainmentFilter.remove_duplicates(fragments)
+    assert [f.id for f in kept] == ["A", "C"] and removed == {"B": "A"}
+
+    # Reverse Complement von "GGATCA" ist "TGATCC"
+    fragments = [Fragment("A", "GGATCA"), Fragment("B", "TGATCC")]
+    assert ContainmentFilter.remove_duplicates(fragments)[1] == {}
+    assert ContainmentFilter.remove_duplicates(fragments, double_strand=True)[1] == {"B": "A"}
+
+
+def test_reverse_complement_containment():
+    container = Fragment("A", "ACGGATTCAGCTTAGC")
+    read = Fragment("B", "GATTCA").reverse_complement()
+    other = Fragment("C", "CAGCTTA").reverse_complement()
+    kept, removed = ContainmentFilter.remove_contained([container, read, other])
+    assert [f.id for f in kept] == ["A", "B_cf", "C_cf"] and removed == {}
+
+    kept, removed = ContainmentFilter.remove_contained([container, read, other], double_strand=True)
+    assert [f.id for f in kept] == ["A"]
+    assert removed == {"B_cf": "A", "C_cf": "A"}
+
+
+def test_filter_matches_pairwise_check():
+    random.seed(4)
+    dna = FragmentGenerator.generate_random_dna(600)
+    fragments = []
+    for n in range(80):
+        start = random.randint(0, 560)
+        fragment = Fragment(f"R{n}", dna[start:start + random.randint(20, 60)])
+        fragments.append(fragment.reverse_complement() if random.random() < 0.4 else fragment)
+    fragments.append(Fragment("dup", fragments[0].sequence))
+
+    for double_strand in (False, True):
+        kept, stats = ContainmentFilter.filter(fragments, double_strand)
+        kept_ids = {f.id for f in kept}
+        assert set(stats["removed"]) == {f.id for f in fragments} - kept_ids
+        assert set(stats["removed"].values()) <= kept_ids
+        assert stats["duplicates"] + stats["contained"] == len(fragments) - len(kept)
+        assert _naive_contained(fragments, double_strand) <= set(stats["removed"])
+        assert not _naive_contained(kept, double_strand)
+
+
+if __name__ == "__main__":
+    test_duplicates_are_removed_by_hash()
+    test_reverse_complement_containment()
+    test_filter_matches_pairwise_check()
@@ -0,0 +1,76 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment_generator import FragmentGenerator
+from greedy_assembler import GreedyAssembler
+from overlap_graph import OverlapGraph
+
+
+def _fragments(seed: int):
+    random.seed(seed)
+    dna = FragmentGenerator.generate_random_dna(2000)
+    fragments = FragmentGenerator.fragment_sequence(dna, min_overlap=20, avg_length=60)
+    random.shuffle(fragments)
+    return dna, fragments
+
+
+def _reference_top_k(graph: OverlapGraph, k: int) -> list[tuple]:
+    """Alle Kanten behalten, die bei Quelle und Ziel unter den k stärksten sind (sortiert statt Heap)."""
+    edges = graph.edges
+    order = {edge: position for position, edge in enumerate(edges)}
+
+    def strongest(group: list) -> set:
+        return set(sorted(group, key=lambda e: (-e.length, -e.identity, order[e]))[:k])
+
+    kept_out = set().union(*(strongest(graph.out_edges(f)) for f in graph.fragments))
+    kept_in = set().union(*(strongest(graph.in_edges(f)) for f in graph.fragments))
+    return [(e.source.id, e.target.id, e.length) for e in edges if e in kept_out and e in kept_in]
+
+
+def test_min_overlap_drops_short_edges():
+    _, fragments = _fragments(1)
+    full = OverlapGraph(fragments)
+    graph = OverlapGraph(fragments, min_overlap=10)
+    assert [(e.source.id, e.target.id, e.length) for e in graph.edges] == \
+           [(e.source.id, e.target.id, e.length) for e in full.edges if e.length >= 10]
+
+
+def test_top_k_matches_sorted_reference():
+    _, fragments = _fragments(2)
+    for k in (1, 2, 5):
+        graph = OverlapGraph(fragments, top_k=k)
+        assert [(e.source.id, e.target.id, e.length) for e in graph.edges] == \
+               _reference_top_k(OverlapGraph(fragments), k)
+        assert all(len(graph.out_edges(f)) <= k and len(graph.in_edges(f)) <= k for f in graph.fragments)
+
+
+def test_pruned_assembly_is_identical_in_both_modes():
+    dna, fragments = _fragments(3)
+    results = []
+    for mode in GreedyAssembler.MODES:
+        OverlapGraph._merge_counter = 0
+        graph = OverlapGraph(fragments, min_overlap=5, top_k=2)
+        contigs = GreedyAssembler(graph, mode=mode).assemble_contigs()
+        results.append([(c.id, c.sequence) for c in contigs])
+    assert results[0] == results[1]
+    assert results[0][0][1] == dna
+
+
+def test_invalid_thresholds():
+    for kwargs in ({"min_overlap": 0}, {"top_k": 0}):
+        try:
+            OverlapGraph([], **kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f"Ungültige Schwelle wurde akzeptiert: {kwargs}")
+
+
+if __name__ == "__main__":
+    test_min_overlap_drops_short_edges()
+    test_top_k_matches_sorted_reference()
+    test_pruned_assembly_is_identical_in_both_modes()
+    test_invalid_thresholds()
@@ -0,0 +1,58 @@
+import gzip
+import os
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from file_parser import FileParser
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def test_plain_text_keeps_line_ids():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsEinzelstrang_short.txt"))
+    assert fragments[0].id == "Frag_0"
+    assert fragments[-1].id == f"Frag_{len(fragments) - 1}"
+
+
+def test_multiline_fasta_uses_record_names(tmp_path):
+    path = tmp_path / "reads.fasta"
+    path.write_text(">read1 erste Beschreibung\nACGT\nTTGA\n\n>read2\nGGCC\n")
+
+    fragments = list(FileParser.iter_fragments(str(path)))
+
+    assert [(f.id, f.sequence) for f in fragments] == [("read1", "ACGTTTGA"), ("read2", "GGCC")]
+
+
+def test_gzipped_fastq_with_quality(tmp_path):
+    path = tmp_path / "reads.fastq.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("@r1\nACGT\n+\nIIII\n@r2 extra\nGGA\n+r2\n#5I\n")
+
+    fragments = list(FileParser.iter_fragments(str(path), keep_quality=True))
+
+    assert [(f.id, f.sequence, f.quality) for f in fragments] == [("r1", "ACGT", "IIII"), ("r2", "GGA", "#5I")]
+    assert fragments[1].reverse_complement().quality == "I5#"
+    assert list(FileParser.iter_fragments(str(path)))[0].quality is None
+
+
+def test_iter_fragments_is_lazy(tmp_path):
+    path = tmp_path / "reads.fasta"
+    path.write_text(">ok\nACGT\n>broken\nACGN\n")
+
+    iterator = FileParser.iter_fragments(str(path))
+    assert next(iterator).id == "ok"
+    try:
+        next(iterator)
+    except IOError:
+        return
+    raise AssertionError("Ungültige Base wurde nicht erkannt")
+
+
+def test_missing_file_raises_file_not_found():
+    try:
+        FileParser.parse_fragments(os.path.join(DATA_DIR, "does_not_exist.txt"))
+    except FileNotFoundError:
+        return
+    raise AssertionError("Fehlende Datei wurde nicht erkannt")
@@ -0,0 +1,35 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fm_index import FMIndex, suffix_array
+
+
+def test_suffix_array_matches_sorted_suffixes():
+    random.seed(3)
+    for _ in range(50):
+        # Wiederholungen erzwingen mehrere Verdopplungsrunden
+        text = b"".join(random.choice([b"A", b"C", b"ACGT" * 10]) for _ in range(random.randint(0, 80))) + b"#"
+        assert suffix_array(text) == sorted(range(len(text)), key=lambda i: text[i:])
+
+
+def test_backward_search_finds_sequences_with_prefix():
+    random.seed(4)
+    sequences = ["".join(random.choices("ACG", k=random.randint(1, 12))) for _ in range(40)]
+    index = FMIndex(sequences)
+
+    for pattern in ("A", "CG", "GAC", "ACGA", "T"):
+        lo, hi = 0, len(index)
+        for char in reversed(pattern.encode("ascii")):
+            lo, hi = index.extend(char, lo, hi)
+        expected = sorted(k for k, sequence in enumerate(sequences) if sequence.startswith(pattern))
+        assert sorted(index.starting_with(lo, hi)) == expected
+
+
+if __name__ == "__main__":
+    test_suffix_array_matches_sorted_suffixes()
+    test_backward_search_finds_sequences_with_prefix()
+    print("Alle FM-Index-Tests bestanden.")
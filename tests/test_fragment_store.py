@@ -0,0 +1,63 @@
+import os
+import sys
+
+# Erlaube Imports aus dem Projektverzeichnis und src/
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+import fragment
+import main
+from file_parser import FileParser
+from fragment_store import FragmentStore
+
+
+def test_convert_fasta_and_read_zero_copy(tmp_path):
+    fasta = tmp_path / "reads.fasta"
+    fasta.write_text(">r1 erste\nACGT\nTTGA\n>r2\nGGCATC\n>r3\nA\n")
+    store_path = str(tmp_path / "reads.fst")
+
+    assert FragmentStore.convert(str(fasta), store_path) == 3
+    with FragmentStore(store_path) as store:
+        assert len(store) == 3
+        view = store.sequence_view(0)
+        assert isinstance(view, memoryview) and view.readonly
+        assert bytes(view) == b"ACGTTTGA"
+        view.release()
+        assert [store.id(i) for i in range(3)] == ["r1", "r2", "r3"]
+        assert store.sequence(1) == "GGCATC"
+        assert store.sequence_length(2) == 1
+
+
+def test_file_parser_reads_store_like_original(tmp_path):
+    input_path = os.path.join(ROOT_DIR, "data", "fragmentsEinzelstrang_short.txt")
+    store_path = str(tmp_path / "short.fst")
+    assert main.main(["convert", input_path, store_path]) == 0
+
+    original = FileParser.parse_fragments(input_path)
+    stored = FileParser.parse_fragments(store_path)
+    assert [(f.id, f.sequence) for f in stored] == [(f.id, f.sequence) for f in original]
+
+
+def test_store_fragments_are_not_validated_again(tmp_path, monkeypatch):
+    store_path = str(tmp_path / "reads.fst")
+    FragmentStore.write(store_path, [fragment.Fragment("a", "acgt"), fragment.Fragment("b", "GGCA")])
+
+    def fail(sequence):
+        raise AssertionError("Basen werden erneut geprüft")
+
+    monkeypatch.setattr(fragment, "is_valid", fail)
+    with FragmentStore(store_path) as store:
+        assert [(f.id, f.sequence) for f in store.iter_fragments()] == [("a", "ACGT"), ("b", "GGCA")]
+        packed = store.fragment(1, packed=True)
+        assert packed.is_packed and packed.sequence == "GGCA"
+
+
+def test_invalid_store_is_rejected(tmp_path):
+    path = tmp_path / "kaputt.fst"
+    path.write_bytes(b"FSTR")
+    try:
+        FragmentStore(str(path))
+    except ValueError:
+        return
+    raise AssertionError("Ungültiger Fragmentspeicher wurde nicht abgelehnt")
@@ -0,0 +1,52 @@
+import os
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from file_parser import FileParser
+from fragment import Fragment
+from graph_cache import GraphCache
+from greedy_assembler import GreedyAssembler
+from overlap_engine import MinimizerOverlapEngine
+from overlap_graph import OverlapGraph
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def _edge_tuples(graph: OverlapGraph) -> list[tuple]:
+    return [(e.source.id, e.target.id, e.length) for e in graph.edges]
+
+
+def test_graph_roundtrip_preserves_edges_and_order(tmp_path):
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsEinzelstrang_short.txt"))
+    graph = OverlapGraph(fragments)
+    path = str(tmp_path / "graph.ovg")
+    GraphCache.write(path, graph)
+
+    loaded = GraphCache.read(path, fragments)
+    assert _edge_tuples(loaded) == _edge_tuples(graph)
+    assert loaded.fragments == graph.fragments
+    assert GreedyAssembler(loaded).assemble().sequence == GreedyAssembler(OverlapGraph(fragments)).assemble().sequence
+
+
+def test_cache_hit_only_for_same_input_and_parameters(tmp_path):
+    fragments = [Fragment("A", "ACGTTGCA"), Fragment("B", "TGCAGGA"), Fragment("C", "GGATTAC")]
+    cache = GraphCache(str(tmp_path))
+    assert cache.load(fragments) is None
+
+    cache.store(OverlapGraph(fragments), fragments)
+    assert _edge_tuples(cache.load(fragments)) == _edge_tuples(OverlapGraph(fragments))
+
+    assert cache.load(fragments, engine="naive") is None
+    assert cache.load(fragments, engine=MinimizerOverlapEngine(k=3, w=2, min_overlap=4)) is None
+    assert cache.load(fragments[:2] + [Fragment("C", "GGATTAG")]) is None
+
+
+def test_corrupt_cache_entry_is_ignored(tmp_path):
+    fragments = [Fragment("A", "ACGTTGCA"), Fragment("B", "TGCAGGA")]
+    cache = GraphCache(str(tmp_path))
+    path = cache.store(OverlapGraph(fragments), fragments)
+    with open(path, "r+b") as f:
+        f.truncate(10)
+    assert cache.load(fragments) is None
@@ -0,0 +1,99 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from file_parser import FileParser
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from overlap_engine import NaiveOverlapEngine
+from overlap_graph import OverlapGraph
+from greedy_assembler import GreedyAssembler
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def _assemble(fragments: list[Fragment], mode: str) -> Fragment:
+    OverlapGraph._merge_counter = 0
+    return GreedyAssembler(OverlapGraph(fragments), mode=mode).assemble()
+
+
+def test_heap_mode_matches_naive_on_data_file():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsEinzelstrang_short.txt"))
+
+    naive = _assemble(fragments, "naive")
+    heap = _assemble(fragments, "heap")
+
+    assert heap.id == naive.id
+    assert heap.sequence == naive.sequence
+
+
+def test_heap_mode_reconstructs_random_sequence():
+    random.seed(3)
+    dna = FragmentGenerator.generate_random_dna(2000)
+    fragments = FragmentGenerator.fragment_sequence(dna, min_overlap=12, avg_length=40)
+    random.shuffle(fragments)
+
+    assert _assemble(fragments, "heap").sequence == _assemble(fragments, "naive").sequence
+
+
+def test_heap_mode_raises_without_overlaps():
+    fragments = [Fragment("A", "AAAA"), Fragment("C", "CCCC")]
+    try:
+        _assemble(fragments, "heap")
+    except ValueError:
+        return
+    raise AssertionError("Fehlende Overlaps wurden nicht erkannt")
+
+
+def test_contigs_are_returned_when_overlaps_run_out():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsDoppelstrang_short.txt"))
+    results = []
+    for mode in GreedyAssembler.MODES:
+        OverlapGraph._merge_counter = 0
+        contigs = GreedyAssembler(OverlapGraph(fragments), mode=mode).assemble_contigs()
+        results.append([(c.id, c.sequence) for c in contigs])
+
+    assert results[0] == results[1]
+    assert len(results[0]) > 1
+
+
+def test_repeat_longer_than_reads_matches_full_recomputation():
+    # Zwei Contigs, die sich über einen Repeat von 25 Basen überlappen, aus Reads der Länge 12
+    for seed in range(5):
+        random.seed(seed)
+        repeat = FragmentGenerator.generate_random_dna(25)
+        left = FragmentGenerator.generate_random_dna(20) + repeat
+        right = repeat + FragmentGenerator.generate_random_dna(20)
+        fragments = [Fragment(f"r{i}", sequence) for i, sequence in enumerate(
+            [left[i:i + 12] for i in range(0, len(left) - 11, 4)] +
+            [right[i:i + 12] for i in range(0, len(right) - 11, 4)])]
+
+        # Ohne exakte Engine werden die Overlaps jedes Contigs vollständig neu berechnet
+        full = NaiveOverlapEngine()
+        full.exact = False
+        OverlapGraph._merge_counter = 0
+        graph = OverlapGraph(fragments, engine=full, min_overlap=3)
+        expected = [c.sequence for c in GreedyAssembler(graph).assemble_contigs()]
+        for mode in GreedyAssembler.MODES:
+            OverlapGraph._merge_counter = 0
+            graph = OverlapGraph(fragments, engine="naive", min_overlap=3)
+            assert [c.sequence for c in GreedyAssembler(graph, mode=mode).assemble_contigs()] == expected
+
+
+def test_contig_stats():
+    contigs = [Fragment("A", "A" * 10), Fragment("B", "C" * 4), Fragment("C", "G" * 6)]
+    stats = GreedyAssembler.contig_stats(contigs)
+    assert stats == {"count": 3, "total_length": 20, "longest": 10, "n50": 10}
+    assert GreedyAssembler.contig_stats(contigs[1:])["n50"] == 6
+
+
+if __name__ == "__main__":
+    test_heap_mode_matches_naive_on_data_file()
+    test_heap_mode_reconstructs_random_sequence()
+    test_heap_mode_raises_without_overlaps()
+    test_contigs_are_returned_when_overlaps_run_out()
+    test_repeat_longer_than_reads_matches_full_recomputation()
+    test_contig_stats()
@@ -0,0 +1,106 @@
+import json
+import os
+import shutil
+import sys
+
+# Erlaube Imports aus dem Projektverzeichnis und src/
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+import main
+from file_parser import FileParser
+
+
+def test_assemble_writes_fasta(tmp_path):
+    output = tmp_path / "contig.fasta"
+    input_path = os.path.join(ROOT_DIR, "data", "fragmentsEinzelstrang_short.txt")
+
+    exit_code = main.main(["assemble", input_path, "--engine", "naive", "-o", str(output)])
+
+    assert exit_code == 0
+    contigs = FileParser.parse_fragments(str(output))
+    assert len(contigs) == 1
+    assert len(contigs[0].sequence) == 10000
+
+
+def test_simulate_reconstructs_sequence(tmp_path):
+    output = tmp_path / "contig.fasta"
+
+    exit_code = main.main(["simulate", "--seed", "1", "--length", "500", "--fragment-length", "40",
+                           "--min-overlap", "15", "-o", str(output)])
+
+    assert exit_code == 0
+    assert output.exists()
+
+
+def test_contigs_option_writes_multi_fasta(tmp_path):
+    output = tmp_path / "contigs.fasta"
+    input_path = os.path.join(ROOT_DIR, "data", "fragmentsDoppelstrang_short.txt")
+
+    assert main.main(["assemble", input_path, "--strand", "double"]) == 1
+    assert main.main(["assemble", input_path, "--strand", "double", "--contigs", "-o", str(output)]) == 0
+    assert len(FileParser.parse_fragments(str(output))) > 1
+
+
+def test_missing_input_returns_error_code():
+    assert main.main(["assemble", os.path.join(ROOT_DIR, "data", "does_not_exist.txt")]) == 1
+
+
+def test_assemble_packed_matches_unpacked(tmp_path):
+    input_path = os.path.join(ROOT_DIR, "data", "fragmentsEinzelstrang_short.txt")
+    plain, packed = tmp_path / "plain.fasta", tmp_path / "packed.fasta"
+
+    assert main.main(["assemble", input_path, "-o", str(plain)]) == 0
+    assert main.main(["assemble", input_path, "--packed", "--engine", "packed", "-o", str(packed)]) == 0
+    assert [f.sequence for f in FileParser.parse_fragments(str(packed))] == \
+           [f.sequence for f in FileParser.parse_fragments(str(plain))]
+
+
+def test_pipeline_assembles_several_files(tmp_path):
+    output_dir = tmp_path / "contigs"
+    metrics_path = tmp_path / "metrics.json"
+    inputs = [os.path.join(ROOT_DIR, "data", name)
+              for name in ("fragmentsEinzelstrang_short.txt", "fragmentsDoppelstrang_short.txt")]
+
+    exit_code = main.main(["pipeline", *inputs, "--strand", "double", "--contigs", "--output-dir", str(output_dir),
+                           "--metrics", str(metrics_path)])
+
+    assert exit_code == 0
+    assert len(FileParser.parse_fragments(str(output_dir / "fragmentsEinzelstrang_short.fasta"))) == 1
+    assert len(FileParser.parse_fragments(str(output_dir / "fragmentsDoppelstrang_short.fasta"))) > 1
+    report = json.loads(metrics_path.read_text())
+    assert [stage["stage"] for stage in report["stages"]] == ["parse", "orient", "build", "assemble"]
+    assert [row["contigs"] > 0 for row in report["files"]] == [True, True]
+
+    assert main.main(["pipeline", inputs[0], os.path.join(ROOT_DIR, "data", "does_not_exist.txt")]) == 1
+
+
+def test_pipeline_output_names_do_not_collide(tmp_path):
+    assert main.output_names(["a/reads.txt", "b/reads.txt", "reads.fa.gz", "reads_2.fq", "v1.2.fasta"]) == \
+           ["reads", "reads_2", "reads_3", "reads_2_2", "v1.2"]
+
+    source = os.path.join(ROOT_DIR, "data", "fragmentsEinzelstrang_short.txt")
+    inputs = []
+    for directory in ("a", "b"):
+        os.makedirs(tmp_path / directory)
+        inputs.append(str(tmp_path / directory / "reads.txt"))
+        shutil.copy(source, inputs[-1])
+    output_dir = tmp_path / "contigs"
+
+    assert main.main(["pipeline", *inputs, "--output-dir", str(output_dir)]) == 0
+    assert sorted(os.listdir(output_dir)) == ["reads.fasta", "reads_2.fasta"]
+
+
+def test_minimizer_options_and_overlap_limit(caplog):
+    input_path = os.path.join(ROOT_DIR, "data", "fragmentsEinzelstrang_short.txt")
+
+    pipeline = main.build_pipeline(main.parse_args(["assemble", input_path, "--engine", "minimizer"]))
+    assert (pipeline.engine.k, pipeline.engine.w, pipeline.engine.min_overlap, pipeline.min_overlap) == (11, 5, 15, 15)
+    assert "auf 15 angehoben" in caplog.text
+
+    caplog.clear()
+    pipeline = main.build_pipeline(main.parse_args(["assemble", input_path, "--engine", "minimizer", "--minimizer-k",
+                                                    "7", "--minimizer-w", "3", "--min-edge-overlap", "12"]))
+    assert (pipeline.engine.k, pipeline.engine.w, pipeline.engine.min_overlap, pipeline.min_overlap) == (7, 3, 12, 12)
+    assert "angehoben" not in caplog.text
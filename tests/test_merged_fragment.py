@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment import Fragment, MergedFragment
+from fragment_generator import FragmentGenerator
+from overlap_graph import OverlapGraph
+
+
+def _random_rope(seed: int, merges: int) -> tuple[Fragment, str]:
+    """Verschachtelte Merges in zufälliger Reihenfolge samt erwarteter Sequenz."""
+    random.seed(seed)
+    pool = [(Fragment(f"F{i}", seq), seq) for i, seq in
+            enumerate(FragmentGenerator.generate_random_dna(random.randint(5, 30)) for _ in range(merges + 1))]
+    while len(pool) > 1:
+        (a, seq_a), (b, seq_b) = pool.pop(random.randrange(len(pool))), pool.pop(random.randrange(len(pool)))
+        overlap = random.randint(0, len(seq_b))
+        pool.append((MergedFragment(f"M{len(pool)}", a, b, overlap), seq_a + seq_b[overlap:]))
+    return pool[0]
+
+
+def test_rope_matches_string_concatenation():
+    for seed in range(5):
+        rope, expected = _random_rope(seed, 40)
+        assert len(rope) == len(expected)
+        for n in (1, 7, len(expected) // 2, len(expected), len(expected) + 5):
+            assert rope.head(n) == expected[:n]
+            assert rope.tail(n) == expected[-n:]
+        assert rope.sequence == expected
+        assert rope.reverse_complement().sequence == Fragment("x", expected).reverse_complement().sequence
+
+
+def test_deep_rope_materializes_iteratively():
+    contig = Fragment("F0", "ACGT")
+    for i in range(5000):
+        contig = MergedFragment(f"M{i}", contig, Fragment(f"F{i + 1}", "GTCA"), 2)
+    assert contig.sequence == "ACGT" + "CA" * 5000
+    assert contig.head(6) == "ACGTCA"
+
+
+def test_merge_and_replace_builds_rope():
+    graph = OverlapGraph([Fragment("A", "ACGTTGCA"), Fragment("B", "TGCAGGAT")])
+    a, b = graph.fragments
+    merged = graph.merge_and_replace(a, b, 4)
+    assert isinstance(merged, MergedFragment)
+    assert merged.sequence == "ACGTTGCAGGAT"
+
+
+if __name__ == "__main__":
+    test_rope_matches_string_concatenation()
+    test_deep_rope_materializes_iteratively()
+    test_merge_and_replace_builds_rope()
@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from minimizer_index import MinimizerIndex, minimizers
+from orientation_selector import OrientationSelector
+from overlap_engine import MinimizerOverlapEngine, NaiveOverlapEngine
+from overlap_graph import OverlapGraph
+
+
+def _random_fragments(seed: int, reverse: bool = False) -> list[Fragment]:
+    random.seed(seed)
+    dna = FragmentGenerator.generate_random_dna(1500)
+    fragments = FragmentGenerator.fragment_sequence(dna, min_overlap=20, avg_length=60)
+    if reverse:
+        fragments += [f.reverse_complement() for f in fragments[::3]]
+    return fragments
+
+
+def test_minimizers_depend_only_on_content():
+    sequence = "ACGTTGCAAGGCTTACGATCGATCGGATC"
+    inner = sequence[5:20]
+    assert minimizers(inner, 5, 4) <= minimizers(sequence, 5, 4)
+    assert minimizers("ACG", 5, 4) == set()
+
+
+def test_minimizer_engine_matches_naive():
+    for proper in (True, False):
+        fragments = _random_fragments(3, reverse=True)
+        expected = [t for t in NaiveOverlapEngine().iter_overlaps(fragments, 15, proper)]
+        engine = MinimizerOverlapEngine(k=9, w=7, min_overlap=15)
+        assert list(engine.iter_overlaps(fragments, proper=proper)) == expected
+        assert engine.candidate_pairs < engine.total_pairs
+        assert 0 < engine.reduction_ratio < 1
+
+
+def test_minimizer_engine_in_graph_and_orientation():
+    fragments = _random_fragments(5, reverse=True)
+    engine = MinimizerOverlapEngine(min_overlap=18)
+    graph = OverlapGraph(fragments, engine=engine)
+    assert all(edge.length >= 18 for edge in graph.edges)
+    assert len(graph.edges) == sum(1 for _ in NaiveOverlapEngine().iter_overlaps(fragments, 18))
+
+    oriented = OrientationSelector(fragments, engine="minimizer").select_orientation_local()
+    assert len(oriented) == len(fragments)
+
+
+def test_window_must_fit_into_min_overlap():
+    for create in (lambda: MinimizerOverlapEngine(k=11, w=10, min_overlap=15),
+                   lambda: MinimizerIndex(["ACGT"], k=0, w=1, min_overlap=5)):
+        try:
+            create()
+        except ValueError:
+            continue
+        raise AssertionError("Ungültige Minimizer-Parameter wurden nicht abgelehnt")
+
+
+if __name__ == "__main__":
+    test_minimizers_depend_only_on_content()
+    test_minimizer_engine_matches_naive()
+    test_minimizer_engine_in_graph_and_orientation()
+    test_window_must_fit_into_min_overlap()
+    print("Alle Minimizer-Tests bestanden.")
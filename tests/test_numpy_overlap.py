@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from file_parser import FileParser
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from overlap_engine import NaiveOverlapEngine, NumpyOverlapEngine, suffix_prefix_overlap
+from overlap_graph import OverlapGraph
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def _random_fragments() -> list[Fragment]:
+    random.seed(11)
+    dna = FragmentGenerator.generate_random_dna(500)
+    fragments = FragmentGenerator.fragment_sequence(dna, min_overlap=5, avg_length=25)
+    # Duplikate, Teilstrings, Kleinbuchstaben und Reverse-Komplemente als Grenzfälle
+    fragments += [Fragment("dup", fragments[0].sequence), Fragment("sub", fragments[1].sequence[:6]),
+                  Fragment("lower", fragments[2].sequence.lower()), fragments[3].reverse_complement()]
+    return fragments + [fragments[4]]
+
+
+def test_overlap_matrix_matches_pure_python():
+    fragments = _random_fragments()
+    sequences = [f.sequence for f in fragments]
+    engine = NumpyOverlapEngine()
+    classes = list(range(len(sequences)))
+    for proper in (True, False):
+        matrix = engine.overlap_matrix(sequences, engine.prepare(sequences), range(len(sequences)),
+                                       classes, 1, proper)
+        for i, seq_a in enumerate(sequences):
+            for j, seq_b in enumerate(sequences):
+                expected = suffix_prefix_overlap(seq_a, seq_b, 1, proper) if i != j else 0
+                assert matrix[i, j] == expected
+
+
+def test_numpy_engine_matches_naive():
+    fragments = _random_fragments()
+    for proper in (True, False):
+        for min_length in (1, 4):
+            expected = list(NaiveOverlapEngine().iter_overlaps(fragments, min_length, proper))
+            assert list(NumpyOverlapEngine().iter_overlaps(fragments, min_length, proper)) == expected
+
+
+def test_hash_collisions_are_verified():
+    class CollidingEngine(NumpyOverlapEngine):
+        BASE = 1  # Hash = Summe der Codes, erzeugt viele Kollisionen
+        BLOCK_SIZE = 5
+
+    fragments = _random_fragments()
+    expected = list(NaiveOverlapEngine().iter_overlaps(fragments, proper=False))
+    assert list(CollidingEngine().iter_overlaps(fragments, proper=False)) == expected
+
+
+def test_numpy_graph_matches_naive_on_data_file():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsEinzelstrang_short.txt"))
+    naive = OverlapGraph(fragments, engine="naive")
+    vectorized = OverlapGraph(fragments, engine="numpy")
+    assert [(e.source.id, e.target.id, e.length) for e in naive.edges] == \
+           [(e.source.id, e.target.id, e.length) for e in vectorized.edges]
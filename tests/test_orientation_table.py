@@ -0,0 +1,103 @@
+import io
+import os
+import random
+import sys
+from contextlib import redirect_stdout
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from file_parser import FileParser
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from orientation_selector import OrientationSelector
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def _reference_local(selector: OrientationSelector) -> list[Fragment]:
+    """Ursprüngliche lokale Orientierungswahl ohne Overlap-Tabelle."""
+    oriented = []
+    for fragment in selector.initial_fragments:
+        rc = fragment.reverse_complement()
+        if selector._total_overlap_score(rc, oriented) > selector._total_overlap_score(fragment, oriented):
+            oriented.append(rc)
+        else:
+            oriented.append(fragment)
+    return oriented
+
+
+def _reference_global(selector: OrientationSelector) -> list[Fragment]:
+    """Ursprüngliche globale Orientierungswahl ohne Overlap-Tabelle (inkl. Tie-Breaking)."""
+    fragments = selector.initial_fragments[:]
+    best_fragment, best_score = None, -1
+    for fragment in fragments:
+        for candidate in (fragment, fragment.reverse_complement()):
+            score = selector._total_overlap_score(candidate, fragments)
+            if score > best_score:
+                best_fragment, best_score = candidate, score
+    oriented = [best_fragment]
+    fragments = [f for f in fragments if f.id != best_fragment.id.replace("_cf", "")]
+
+    while fragments:
+        best_next, best_score, best_id = None, -1, None
+        for fragment in fragments:
+            for candidate in (fragment, fragment.reverse_complement()):
+                score = selector._total_overlap_score(candidate, oriented)
+                if score > best_score:
+                    best_next, best_score, best_id = candidate, score, fragment.id
+        oriented.append(best_next)
+        fragments = [f for f in fragments if f.id != best_id]
+    return oriented
+
+
+def _as_tuples(fragments: list[Fragment]) -> list[tuple]:
+    return [(f.id, f.sequence) for f in fragments]
+
+
+def _check_against_reference(fragments: list[Fragment]):
+    selector = OrientationSelector(fragments)
+    with redirect_stdout(io.StringIO()):
+        assert _as_tuples(selector.select_orientation_local()) == _as_tuples(_reference_local(selector))
+        assert _as_tuples(selector.select_orientation_global()) == _as_tuples(_reference_global(selector))
+
+
+def test_orientation_matches_reference_on_data_file():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsDoppelstrang_short.txt"))
+    _check_against_reference(fragments[:30])
+
+
+def test_orientation_matches_reference_on_generated_fragments():
+    # Generierte Reverse Complements tragen bereits "_cf" in der ID
+    random.seed(21)
+    generator = FragmentGenerator(400, 25, 8, shuffle=True, reverse_ratio=0.5)
+    _check_against_reference(generator.generate_fragments())
+
+
+def test_orientation_with_duplicate_fragment_objects():
+    fragment = Fragment("F", "ACGTTGCA")
+    _check_against_reference([fragment, Fragment("G", "TGCAAC"), fragment])
+
+
+def test_kmer_orientation_puts_all_fragments_on_one_strand():
+    random.seed(8)
+    generator = FragmentGenerator(3000, 60, 20, shuffle=True, reverse_ratio=0.4)
+    fragments = generator.generate_fragments()
+    oriented = OrientationSelector(fragments).select_orientation("kmer")
+
+    assert len(oriented) == len(fragments)
+    rc_dna = Fragment("dna", generator.dna).reverse_complement().sequence
+    assert all(f.sequence in generator.dna for f in oriented) or all(f.sequence in rc_dna for f in oriented)
+
+
+def test_kmer_orientation_keeps_unconnected_fragments():
+    fragments = [Fragment("A", "ACGTTGCAAGT"), Fragment("B", "GGGGCCCCTTT")]
+    assert _as_tuples(OrientationSelector(fragments).select_orientation_kmer(k=5)) == _as_tuples(fragments)
+
+
+if __name__ == "__main__":
+    test_orientation_matches_reference_on_data_file()
+    test_orientation_matches_reference_on_generated_fragments()
+    test_orientation_with_duplicate_fragment_objects()
+    test_kmer_orientation_puts_all_fragments_on_one_strand()
+    test_kmer_orientation_keeps_unconnected_fragments()
@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from file_parser import FileParser
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from overlap_engine import NaiveOverlapEngine, SortedPrefixOverlapEngine, SuffixArrayOverlapEngine
+from overlap_graph import OverlapGraph
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def _edge_tuples(graph: OverlapGraph) -> list[tuple]:
+    return [(e.source.id, e.target.id, e.length) for e in graph.edges]
+
+
+def test_suffix_array_matches_naive_on_data_file():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsEinzelstrang_short.txt"))
+
+    naive = OverlapGraph(fragments, engine="naive")
+    suffix_array = OverlapGraph(fragments, engine="suffix_array")
+
+    assert _edge_tuples(naive) == _edge_tuples(suffix_array)
+
+
+def test_suffix_array_matches_naive_on_random_fragments():
+    random.seed(7)
+    dna = FragmentGenerator.generate_random_dna(600)
+    fragments = FragmentGenerator.fragment_sequence(dna, min_overlap=6, avg_length=30)
+    # Duplikate und Teilstrings erzeugen Grenzfälle (Overlap = ganze Länge)
+    fragments += [Fragment("dup", fragments[0].sequence), Fragment("sub", fragments[1].sequence[:8])]
+
+    for proper in (True, False):
+        for min_length in (1, 4):
+            expected = list(NaiveOverlapEngine().iter_overlaps(fragments, min_length, proper))
+            for engine in (SuffixArrayOverlapEngine(), SortedPrefixOverlapEngine()):
+                assert list(engine.iter_overlaps(fragments, min_length, proper)) == expected
+
+
+def test_unknown_engine_is_rejected():
+    try:
+        OverlapGraph([Fragment("A", "ACGT")], engine="does_not_exist")
+    except ValueError:
+        return
+    raise AssertionError("Unbekannte Engine wurde nicht abgelehnt")
+
+
+if __name__ == "__main__":
+    test_suffix_array_matches_naive_on_data_file()
+    test_suffix_array_matches_naive_on_random_fragments()
+    test_unknown_engine_is_rejected()
@@ -0,0 +1,105 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from overlap_graph import OverlapGraph
+
+
+def _build_chain() -> tuple[OverlapGraph, list[Fragment]]:
+    fragments = [
+        Fragment("A", "ACGTTGCA"),
+        Fragment("B", "TGCAGGAT"),
+        Fragment("C", "GGATCCTA"),
+    ]
+    return OverlapGraph(fragments), fragments
+
+
+def test_neighbor_queries_use_adjacency():
+    graph, (a, b, c) = _build_chain()
+
+    assert [graph.node_index(f) for f in (a, b, c)] == [0, 1, 2]
+    assert b in graph.successors(a)
+    assert a in graph.predecessors(b)
+    assert all(edge.source is b for edge in graph.out_edges(b))
+    assert all(edge.target is b for edge in graph.in_edges(b))
+
+
+def test_remove_fragment_drops_incident_edges():
+    graph, (a, b, c) = _build_chain()
+
+    graph.remove_fragment(b)
+
+    assert graph.fragments == [a, c]
+    assert all(b not in (edge.source, edge.target) for edge in graph.edges)
+    assert b not in graph.successors(a)
+    assert b not in graph.predecessors(c)
+
+
+def test_merge_keeps_edge_order_and_views():
+    graph, (a, b, c) = _build_chain()
+
+    merged = graph.merge_and_replace(a, b, 4)
+
+    assert merged.sequence == "ACGTTGCAGGAT"
+    assert graph.fragments == [c, merged]
+    assert len(graph) == 2
+    assert graph.node_index(merged) == 3
+    assert any(edge.source is merged and edge.target is c for edge in graph.edges)
+
+
+def test_inherited_edges_match_full_recomputation():
+    # Unterschiedlich lange Fragmente, damit auch die Fenster-Neuberechnung gegen längere Knoten greift
+    random.seed(11)
+    dna = FragmentGenerator.generate_random_dna(600)
+    fragments, start = [], 0
+    while start < len(dna) - 20:
+        fragments.append(Fragment(f"R{len(fragments)}", dna[start:start + random.randint(15, 90)]))
+        start += random.randint(5, 14)
+    random.shuffle(fragments)
+
+    for engine in ("naive", "suffix_array", "rolling"):
+        incremental = OverlapGraph(fragments, engine=engine)
+        full = OverlapGraph(fragments, engine=engine)
+        while incremental.edges:
+            edge = max(incremental.edges, key=lambda e: e.length)
+            merged = incremental.merge_and_replace(edge.source, edge.target, edge.length)
+            full.remove_fragment(edge.source)
+            full.remove_fragment(edge.target)
+            full.add_fragment(merged)
+            assert [(e.source.id, e.target.id, e.length) for e in incremental.edges] == \
+                   [(e.source.id, e.target.id, e.length) for e in full.edges]
+
+
+def test_merge_windows_are_bounded_by_read_length():
+    random.seed(4)
+    dna = FragmentGenerator.generate_random_dna(3000)
+    fragments = FragmentGenerator.fragment_sequence(dna, min_overlap=15, avg_length=60)
+    random.shuffle(fragments)
+    graph = OverlapGraph(fragments, engine="naive")
+    lengths = []
+    sequence_overlap = graph.engine.sequence_overlap
+
+    def recording_overlap(seq_a, seq_b, min_length=1, proper=True):
+        lengths.append(max(len(seq_a), len(seq_b)))
+        return sequence_overlap(seq_a, seq_b, min_length, proper)
+
+    graph.engine.sequence_overlap = recording_overlap
+    while graph.edges:
+        edge = max(graph.edges, key=lambda e: e.length)
+        graph.merge_and_replace(edge.source, edge.target, edge.length)
+
+    assert len(graph) == 1 and graph.fragments[0].sequence == dna
+    assert lengths and max(lengths) <= graph.read_length == max(len(f) for f in fragments)
+
+
+if __name__ == "__main__":
+    test_neighbor_queries_use_adjacency()
+    test_remove_fragment_drops_incident_edges()
+    test_merge_keeps_edge_order_and_views()
+    test_inherited_edges_match_full_recomputation()
+    test_merge_windows_are_bounded_by_read_length()
@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment import Fragment
+from overlap_engine import NaiveOverlapEngine, PackedOverlapEngine, suffix_prefix_overlap
+from packed_sequence import PackedSequence, packed_overlap
+
+
+def test_pack_roundtrip_for_all_padding_lengths():
+    random.seed(5)
+    for length in range(1, 13):
+        sequence = "".join(random.choices("ACGT", k=length))
+        packed = PackedSequence(sequence)
+        assert packed.decode() == sequence
+        assert len(packed) == length
+        assert len(packed.data) == -(-length // 4)
+
+
+def test_packed_reverse_complement_matches_string_version():
+    for sequence in ("A", "AC", "ACG", "ACGT", "AGTCCTAT", "GGGATTACAC"):
+        fragment = Fragment("F", sequence)
+        packed = Fragment("F", sequence, packed=True)
+
+        assert packed.is_packed
+        assert packed.sequence == sequence
+        assert packed.reverse_complement().sequence == fragment.reverse_complement().sequence
+        assert packed.reverse_complement().id == "F_cf"
+
+
+def test_packed_overlap_matches_string_overlap():
+    random.seed(11)
+    for _ in range(200):
+        a = "".join(random.choices("ACGT", k=random.randint(1, 15)))
+        b = "".join(random.choices("AC", k=random.randint(1, 15)))
+        for proper in (True, False):
+            assert packed_overlap(PackedSequence(a).value, len(a), PackedSequence(b).value, len(b), proper=proper) \
+                   == suffix_prefix_overlap(a, b, proper=proper)
+
+
+def test_packed_engine_matches_naive_without_decoding(monkeypatch):
+    random.seed(12)
+    sequences = ["".join(random.choices("ACG", k=random.randint(2, 20))) for _ in range(40)]
+    plain = [Fragment(f"F{k}", sequence) for k, sequence in enumerate(sequences)]
+    packed = [Fragment(f"F{k}", sequence, packed=True) for k, sequence in enumerate(sequences)]
+    expected = list(NaiveOverlapEngine().iter_overlaps(plain, 2))
+
+    def fail(self):
+        raise AssertionError("Sequenz wurde entpackt")
+
+    monkeypatch.setattr(PackedSequence, "decode", fail)
+    assert list(PackedOverlapEngine().iter_overlaps(packed, 2)) == expected
+
+
+def test_slots_prevent_instance_dict():
+    fragment = Fragment("F", "ACGT", packed=True)
+    assert not hasattr(fragment, "__dict__")
+    assert len(fragment) == 4
+
+
+if __name__ == "__main__":
+    test_pack_roundtrip_for_all_padding_lengths()
+    test_packed_reverse_complement_matches_string_version()
+    test_packed_overlap_matches_string_overlap()
+    test_slots_prevent_instance_dict()
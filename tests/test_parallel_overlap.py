@@ -0,0 +1,36 @@
+import os
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from file_parser import FileParser
+from overlap_engine import NaiveOverlapEngine, SuffixArrayOverlapEngine
+from overlap_graph import OverlapGraph
+from parallel_overlap import ParallelOverlapEngine
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def test_parallel_engine_matches_serial_edges():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsDoppelstrang_short.txt"))
+    expected = list(NaiveOverlapEngine().iter_overlaps(fragments))
+
+    for base in (NaiveOverlapEngine(), SuffixArrayOverlapEngine()):
+        engine = ParallelOverlapEngine(base, workers=2, block_size=7)
+        assert list(engine.iter_overlaps(fragments)) == expected
+
+
+def test_graph_with_workers_matches_serial_graph():
+    fragments = FileParser.parse_fragments(os.path.join(DATA_DIR, "fragmentsEinzelstrang_short.txt"))
+
+    serial = OverlapGraph(fragments)
+    parallel = OverlapGraph(fragments, workers=2)
+
+    assert [(e.source.id, e.target.id, e.length) for e in parallel.edges] == \
+           [(e.source.id, e.target.id, e.length) for e in serial.edges]
+
+
+if __name__ == "__main__":
+    test_parallel_engine_matches_serial_edges()
+    test_graph_with_workers_matches_serial_graph()
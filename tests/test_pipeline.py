@@ -0,0 +1,138 @@
+import os
+import pickle
+import sys
+import time
+
+# Erlaube Imports aus dem Projektverzeichnis und src/
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+from file_parser import FileParser
+from overlap_graph import OverlapGraph
+from pipeline import AssemblyPipeline
+
+SHORT = os.path.join(ROOT_DIR, "data", "fragmentsEinzelstrang_short.txt")
+DOUBLE = os.path.join(ROOT_DIR, "data", "fragmentsDoppelstrang_short.txt")
+
+
+class SlowPipeline(AssemblyPipeline):
+    """
+    Stufen, die nur warten. Start, Ende und Prozess jedes Schritts werden mit den Daten
+    weitergereicht, da Stufen im Prozess-Pool keinen gemeinsamen Zustand haben.
+    """
+
+    def _step(self, stage, data):
+        path, events = data
+        start = time.time()
+        time.sleep(0.05)
+        return path, events + [(stage, start, time.time(), os.getpid())]
+
+    def parse(self, path):
+        return self._step("parse", (path, []))
+
+    def orient(self, data):
+        return self._step("orient", data)
+
+    def build(self, data):
+        return self._step("build", data)
+
+    def assemble(self, data):
+        return [self._step("assemble", data)]
+
+
+class BrokenPipeline(AssemblyPipeline):
+    """Orientierung, die für die zweite Datei mit einer unerwarteten Ausnahme abbricht."""
+
+    def orient(self, fragments):
+        if len(fragments) != self._expected:
+            raise RuntimeError("kaputt")
+        return super().orient(fragments)
+
+
+def test_pipeline_matches_sequential_stages():
+    pipeline = AssemblyPipeline(engine="naive")
+    expected = pipeline.assemble(pipeline.build(pipeline.orient(pipeline.parse(SHORT))))
+
+    results, metrics = pipeline.run([SHORT, os.path.join(ROOT_DIR, "data", "missing.txt"), SHORT])
+
+    assert [result["input"] for result in results] == [SHORT, os.path.join(ROOT_DIR, "data", "missing.txt"), SHORT]
+    assert results[0]["contigs"][0].sequence == expected[0].sequence
+    assert results[2]["contigs"][0].sequence == expected[0].sequence
+    assert results[1]["contigs"] is None and results[1]["error"].startswith("parse:")
+    assert set(results[0]["seconds"]) == set(AssemblyPipeline.STAGES)
+    assert [(stage.name, stage.items, stage.errors) for stage in metrics] == \
+           [("parse", 2, 1), ("orient", 2, 0), ("build", 2, 0), ("assemble", 2, 0)]
+
+
+def test_failed_assembly_does_not_stop_other_files():
+    results, metrics = AssemblyPipeline(double_strand=True).run([DOUBLE, SHORT])
+
+    assert results[0]["error"].startswith("assemble:")
+    assert results[1]["error"] is None and len(results[1]["contigs"]) == 1
+    assert metrics[-1].errors == 1
+
+    results, _ = AssemblyPipeline(double_strand=True, contigs=True).run([DOUBLE])
+    assert results[0]["error"] is None and len(results[0]["contigs"]) > 1
+
+
+def test_unexpected_error_does_not_stop_other_files():
+    for processes in (2, 0):
+        pipeline = BrokenPipeline(processes=processes)
+        pipeline._expected = len(FileParser.parse_fragments(SHORT))
+        results, metrics = pipeline.run([SHORT, DOUBLE, SHORT])
+
+        assert results[1]["error"] == "orient: RuntimeError: kaputt" and results[1]["contigs"] is None
+        assert all(results[i]["error"] is None and len(results[i]["contigs"]) == 1 for i in (0, 2))
+        assert (metrics[1].items, metrics[1].errors) == (2, 1)
+
+
+def test_graph_is_pickled_as_edge_table():
+    graph = OverlapGraph(FileParser.parse_fragments(DOUBLE), min_overlap=3)
+    copy = pickle.loads(pickle.dumps(graph))
+
+    assert [f.id for f in copy.fragments] == [f.id for f in graph.fragments]
+    assert [(e.source.id, e.target.id, e.length, e.identity) for e in copy.edges] == \
+           [(e.source.id, e.target.id, e.length, e.identity) for e in graph.edges]
+
+
+def test_stages_overlap_in_time_with_bounded_queues():
+    for processes in (3, 0):
+        pipeline = SlowPipeline(queue_size=1, processes=processes)
+        paths = [f"file{i}" for i in range(4)]
+
+        start = time.perf_counter()
+        results, metrics = pipeline.run(paths)
+        elapsed = time.perf_counter() - start
+
+        assert [result["contigs"][0][0] for result in results] == paths
+        events = {(stage, path): (begin, end, pid)
+                  for result in results for path, steps in result["contigs"] for stage, begin, end, pid in steps}
+        # Die zweite Datei wird eingelesen, bevor die erste assembliert ist
+        assert events[("parse", "file1")][0] < events[("assemble", "file0")][1]
+        # Einlesen im Hauptprozess, die übrigen Stufen im Prozess-Pool (bzw. ebenfalls im Hauptprozess)
+        assert {pid for (stage, _), (_, _, pid) in events.items() if stage == "parse"} == {os.getpid()}
+        assert all((pid != os.getpid()) == bool(processes)
+                   for (stage, _), (_, _, pid) in events.items() if stage != "parse")
+        # Sequentiell wären es 16 Schritte à 0.05 s
+        assert elapsed < 16 * 0.05
+        assert all(stage.max_queue_depth <= 1 for stage in metrics)
+        assert all(stage.items == 4 and stage.busy_seconds > 0 for stage in metrics)
+
+
+def test_invalid_pipeline_parameters():
+    for kwargs in ({"queue_size": 0}, {"processes": -1}):
+        try:
+            AssemblyPipeline(**kwargs)
+            raise AssertionError("ValueError erwartet")
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_pipeline_matches_sequential_stages()
+    test_failed_assembly_does_not_stop_other_files()
+    test_unexpected_error_does_not_stop_other_files()
+    test_graph_is_pickled_as_edge_table()
+    test_stages_overlap_in_time_with_bounded_queues()
+    test_invalid_pipeline_parameters()
+    print("Alle Tests bestanden.")
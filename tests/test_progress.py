@@ -0,0 +1,39 @@
+import logging
+import os
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from progress import ProgressReporter
+
+
+def test_progress_is_rate_limited(caplog):
+    logger = logging.getLogger("test_progress.limited")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        progress = ProgressReporter(logger, "Test", total=1000, interval=3600)
+        for _ in range(1000):
+            progress.update()
+        progress.finish()
+
+    assert progress.count == 1000
+    assert caplog.records == []
+
+
+def test_progress_reports_counts_and_rate(caplog):
+    logger = logging.getLogger("test_progress.reporting")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        progress = ProgressReporter(logger, "Test", total=4, interval=0)
+        progress.update(2)
+
+    assert "[Test] 2/4 (50.0 %" in caplog.records[0].getMessage()
+
+
+def test_progress_is_silent_when_info_disabled(caplog):
+    logger = logging.getLogger("test_progress.quiet")
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        progress = ProgressReporter(logger, "Test", interval=0)
+        progress.update()
+        progress.finish()
+
+    assert caplog.records == []
@@ -0,0 +1,56 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from overlap_engine import NaiveOverlapEngine, RollingHashOverlapEngine, suffix_prefix_overlap
+from overlap_graph import OverlapGraph
+from rolling_hash import prefix_hashes, rolling_overlap, suffix_hashes
+
+
+def test_rolling_overlap_matches_suffix_prefix_overlap():
+    random.seed(3)
+    for _ in range(300):
+        a = "".join(random.choice("AC") for _ in range(random.randint(1, 12)))
+        b = "".join(random.choice("AC") for _ in range(random.randint(1, 12)))
+        prefix_a, prefix_b = prefix_hashes(a), prefix_hashes(b)
+        for proper in (True, False):
+            for min_length in (1, 3):
+                expected = suffix_prefix_overlap(a, b, min_length, proper)
+                assert rolling_overlap(a, suffix_hashes(prefix_a), b, prefix_b, min_length, proper) == expected
+
+
+def test_rolling_engine_matches_naive():
+    random.seed(8)
+    dna = FragmentGenerator.generate_random_dna(500)
+    fragments = FragmentGenerator.fragment_sequence(dna, min_overlap=5, avg_length=25)
+    fragments += [Fragment("dup", fragments[0].sequence), fragments[1]]
+    for proper in (True, False):
+        expected = list(NaiveOverlapEngine().iter_overlaps(fragments, 1, proper))
+        assert list(RollingHashOverlapEngine().iter_overlaps(fragments, 1, proper)) == expected
+
+
+def test_merged_fragment_hashes_are_derived_from_parents():
+    source = Fragment("S", "ACGTTGCAAG")
+    target = Fragment("T", "CAAGTTACGGA")
+    graph = OverlapGraph([source, target], engine="rolling")
+    merged = graph.merge_and_replace(source, target, 4)
+
+    # Erst beim Zugriff abgeleitet, und zwar ohne die Sequenz zusammenzusetzen
+    assert not merged.has_hashes
+    merged.prefix_hashes
+    assert merged.has_hashes
+    assert merged._sequence is None
+    assert merged.prefix_hashes == prefix_hashes(merged.sequence)
+    assert merged.suffix_hashes == suffix_hashes(prefix_hashes(merged.sequence))
+
+
+if __name__ == "__main__":
+    test_rolling_overlap_matches_suffix_prefix_overlap()
+    test_rolling_engine_matches_naive()
+    test_merged_fragment_hashes_are_derived_from_parents()
+    print("Alle Rolling-Hash-Tests bestanden.")
@@ -0,0 +1,65 @@
+import os
+import random
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment import Fragment
+from sequence_codec import is_valid, reverse_complement, reverse_complements
+
+
+def _reference_reverse_complement(sequence):
+    complement = {"A": "T", "T": "A", "G": "C", "C": "G", "a": "t", "t": "a", "g": "c", "c": "g"}
+    return "".join(complement[base] for base in reversed(sequence))
+
+
+def test_is_valid():
+    assert is_valid("ACGT")
+    assert is_valid("acgtACGT")
+    assert not is_valid("ACGN")
+    assert not is_valid("AC GT")
+    assert not is_valid("ACGTÄ")
+    assert not is_valid("ACGT\n")
+
+
+def test_reverse_complement_matches_reference():
+    random.seed(3)
+    for length in (1, 2, 17, 1000):
+        sequence = "".join(random.choice("ACGTacgt") for _ in range(length))
+        assert reverse_complement(sequence) == _reference_reverse_complement(sequence)
+    assert reverse_complement("AGTCCTAT") == "ATAGGACT"
+
+
+def test_reverse_complements_batch_equals_single():
+    random.seed(5)
+    sequences = ["".join(random.choice("ACGT") for _ in range(random.randint(1, 80))) for _ in range(50)]
+    assert reverse_complements(sequences) == [reverse_complement(seq) for seq in sequences]
+    assert reverse_complements([]) == []
+
+
+def test_fragment_rejects_invalid_bases():
+    for sequence in ("ACGN", "ACGTé"):
+        try:
+            Fragment("F", sequence)
+            raise AssertionError("ValueError erwartet")
+        except ValueError:
+            pass
+
+
+def test_reverse_complement_all_matches_single_fragments():
+    fragments = [Fragment("F1", "AGTCCTAT"), Fragment("F2", "acgga", quality="ABCDE"),
+                 Fragment("F3", "GGGTTTACG", packed=True), Fragment("F4", "TTAC", quality="!#%&")]
+    batch = Fragment.reverse_complement_all(fragments)
+    for fragment, rc in zip(fragments, batch):
+        single = fragment.reverse_complement()
+        assert (rc.id, rc.sequence, rc.quality, rc.is_packed) == \
+               (single.id, single.sequence, single.quality, single.is_packed)
+    assert batch[1].sequence == "TCCGT" and batch[1].quality == "EDCBA"
+
+
+if __name__ == "__main__":
+    test_is_valid()
+    test_reverse_complement_matches_reference()
+    test_reverse_complements_batch_equals_single()
+    test_fragment_rejects_invalid_bases()
+    test_reverse_complement_all_matches_single_fragments()
+    print("Alle Tests bestanden.")
@@ -0,0 +1,96 @@
+import os
+import random
+import sys
+
+# Erlaube Imports aus dem src/ Verzeichnis
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from fragment import Fragment
+from fragment_generator import FragmentGenerator
+from greedy_assembler import GreedyAssembler
+from overlap_graph import OverlapGraph
+from string_graph import StringGraph
+
+
+def _tiled_reads(seed: int) -> tuple[str, list[Fragment]]:
+    """Überlappende Reads mit hoher Abdeckung, inkl. enthaltener Reads."""
+    random.seed(seed)
+    dna = FragmentGenerator.generate_random_dna(1500)
+    reads, start = [], 0
+    while start < len(dna) - 40:
+        reads.append(Fragment(f"R{len(reads)}", dna[start:start + random.randint(40, 70)]))
+        start += random.randint(3, 25)
+    reads.append(Fragment("end", dna[-50:]))
+    random.shuffle(reads)
+    return dna, reads
+
+
+def test_remove_contained_reads_and_duplicates():
+    fragments = [Fragment("A", "ACGTACGGATC"), Fragment("B", "GTACG"), Fragment("C", "ACGTACGGATC"),
+                 Fragment("D", "TTTTGGGA"), Fragment("E", "TTGG")]
+    kept, removed = StringGraph.remove_contained(fragments)
+    assert [f.id for f in kept] == ["A", "D"]
+    assert removed == {"B": "A", "C": "A", "E": "D"}
+
+
+def test_transitive_edges_are_removed():
+    # v → w → x mit ov(v,x) = ov(v,w) + ov(w,x) - |w|
+    v, w, x = Fragment("v", "AAACCCGGG"), Fragment("w", "CCCGGGTTT"), Fragment("x", "GGGTTTACA")
+    graph = OverlapGraph([v, w, x])
+    transitive = [edge for edge in graph.out_edges(v) if edge.target is x][0]
+    assert transitive.length == 3
+
+    assert StringGraph.reduce(graph) == 1
+    assert x not in graph.successors(v)
+    assert w in graph.successors(v) and x in graph.successors(w)
+
+
+def test_reduce_matches_pairwise_definition_on_repeats():
+    for seed in range(20):
+        random.seed(seed)
+        unit = "".join(random.choices("ACGT", k=random.randint(3, 10)))
+        dna = "".join(random.choice([unit, "".join(random.choices("ACGT", k=8))]) for _ in range(40))
+        reads = []
+        for k in range(50):
+            start = random.randint(0, len(dna) - 20)
+            reads.append(Fragment(f"R{k}", dna[start:start + random.randint(15, 40)]))
+        reads, _ = StringGraph.remove_contained(reads)
+        graph = OverlapGraph(reads)
+
+        # Referenz: jede Kante v→x, zu der irgendein w den Overlap genau impliziert
+        expected = {(e.source.id, e.target.id) for e in graph.edges} - {
+            (vw.source.id, vx.target.id)
+            for vw in graph.edges for wx in graph.out_edges(vw.target) for vx in graph.out_edges(vw.source)
+            if vx.target is wx.target and vx.length == vw.length + wx.length - len(vw.target)}
+        StringGraph.reduce(graph)
+        assert {(e.source.id, e.target.id) for e in graph.edges} == expected
+
+
+def test_fuzz_tolerates_inexact_implied_overlaps():
+    # ov(v,x) = 2 statt der über w implizierten 3 Basen (wie bei fehlertoleranten Engines)
+    v, w, x = Fragment("v", "AAACCCGGG"), Fragment("w", "CCCGGGTTT"), Fragment("x", "GGGTTTACA")
+    graph = OverlapGraph.from_edges([v, w, x], [(0, 1, 6), (1, 2, 6), (0, 2, 2)])
+
+    assert StringGraph.reduce(graph) == 0
+    assert StringGraph.reduce(graph, fuzz=1) == 1
+    assert x not in graph.successors(v)
+
+
+def test_greedy_assembly_on_string_graph():
+    dna, reads = _tiled_reads(2)
+    graph, stats = StringGraph.build(reads)
+    assert stats["contained_reads"] > 0 and stats["transitive_edges"] > 0
+    assert len(graph.edges) < len(OverlapGraph(reads).edges)
+
+    for mode in GreedyAssembler.MODES:
+        graph, _ = StringGraph.build(reads)
+        assert GreedyAssembler(graph, mode=mode).assemble().sequence == dna
+
+
+if __name__ == "__main__":
+    test_remove_contained_reads_and_duplicates()
+    test_transitive_edges_are_removed()
+    test_reduce_matches_pairwise_definition_on_repeats()
+    test_fuzz_tolerates_inexact_implied_overlaps()
+    test_greedy_assembly_on_string_graph()
+    print("Alle String-Graph-Tests bestanden.")